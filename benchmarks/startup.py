@@ -0,0 +1,367 @@
+"""Startup and first-paint benchmarks of se.plan.
+
+Measures, every case in a fresh interpreter:
+
+- the cold import time of the top-level modules of the app;
+- the construction of an empty ``Recipe`` and of the ``SeplanMap``;
+- the first render of the Solara ``Page``;
+- the latency from loading a recipe file to a recipe ready to use.
+
+Earth Engine requests are answered by ``FakeGEEInterface``, so nothing is
+computed on the server. Building the Earth Engine graphs of a recipe still needs
+an initialized client: the recipe load is skipped when there are no credentials.
+
+The results are written as JSON and compared with a baseline, e.g. the results
+of the previous release::
+
+    python benchmarks/startup.py --output startup.json --baseline previous.json
+
+A case slower than the baseline by more than the threshold is flagged and the
+command fails.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_MODULES = [
+    "component.parameter",
+    "component.message",
+    "component.model.recipe",
+    "component.scripts.statistics",
+    "component.scripts.compute",
+    "component.scripts.batch",
+    "component.widget.map",
+    "component.tile.custom_aoi_tile",
+    "component.tile.questionnaire_tile",
+    "component.tile.recipe_tile",
+    "component.tile.dashboard_tile",
+    "solara_app",
+]
+"""The modules whose cold import is measured."""
+
+DEFAULT_RECIPE = ROOT / "tests" / "data" / "recipes" / "test_recipe.json"
+
+FAKE_PROPERTIES = {"gaul0_code": 133, "gaul0_name": "Kenya", "iso3_code": "KEN"}
+"""The properties of every feature requested from the fake interface."""
+
+FAKE_RING = [[33.9, -4.7], [41.9, -4.7], [41.9, 5.0], [33.9, 5.0], [33.9, -4.7]]
+"""The bounding box of every AOI requested from the fake interface."""
+
+DEFAULT_THRESHOLD = 0.2
+"""Relative slowdown of a case, compared with the baseline, that is flagged."""
+
+DEFAULT_MIN_DELTA = 0.05
+"""Slowdown in seconds below which a case is never flagged, as noise."""
+
+
+# -- cases, run in the child interpreter --------------------------------------
+
+
+def fake_gee_interface():
+    """A GEE interface answering the requests without Earth Engine."""
+    from sepal_ui.scripts.gee_interface import GEEInterface
+
+    class FakeGEEInterface(GEEInterface):
+        async def get_info_async(self, ee_object, *args, **kwargs):
+            graph = ee_object.serialize()
+            if "toDictionary" in graph:
+                return dict(FAKE_PROPERTIES)
+            if "coordinates" in graph:
+                return FAKE_RING
+            return {}
+
+        def get_info(self, ee_object, *args, **kwargs):
+            return asyncio.run(self.get_info_async(ee_object))
+
+        def get_map_id(self, *args, **kwargs):
+            url = "https://tiles.invalid/{z}/{x}/{y}"
+            return {"tile_fetcher": SimpleNamespace(url_format=url)}
+
+        async def get_map_id_async(self, *args, **kwargs):
+            return self.get_map_id()
+
+        def get_folder(self, *args, **kwargs):
+            return "projects/benchmark/assets"
+
+        async def get_folder_async(self, *args, **kwargs):
+            return self.get_folder()
+
+    return FakeGEEInterface()
+
+
+def _isolate_caches(folder: Path) -> None:
+    """Keep the fake answers out of the persistent caches of the user."""
+    from component.scripts import aoi_geometry, breakpoints, statistics_store
+    from component.scripts.cache import JsonLRUCache
+
+    aoi_geometry.bounds_cache = JsonLRUCache(folder / "aoi_bounds.json")
+    breakpoints.breakpoint_cache = JsonLRUCache(folder / "breakpoints.json")
+    statistics_store.stats_cache = JsonLRUCache(folder / "statistics.json")
+
+
+def _patch_app_startup() -> None:
+    """Run the app module out of a Solara server and SEPAL session."""
+    from sepal_ui import solara as sepal_solara
+    from sepal_ui.scripts import utils as su
+
+    gee_interface = fake_gee_interface()
+    su.init_ee = lambda *args, **kwargs: None
+    sepal_solara.setup_solara_server = lambda *args, **kwargs: None
+    sepal_solara.with_sepal_sessions = lambda *args, **kwargs: (lambda page: page)
+    sepal_solara.get_current_gee_interface = lambda: gee_interface
+    sepal_solara.get_current_sepal_client = lambda: None
+
+
+def _init_ee() -> Optional[str]:
+    """Initialize Earth Engine, returning why it failed if it did."""
+    from sepal_ui.scripts import utils as su
+
+    try:
+        su.init_ee()
+    except Exception as e:
+        return f"Earth Engine is not initialized: {e}"
+
+    return None
+
+
+def _time(run: Callable[[], object], repeat: int) -> List[float]:
+    """The durations of the runs of a callable, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def case_import(module: str) -> List[float]:
+    """Import a module in a cold interpreter: a single run."""
+    if module == "solara_app":
+        # the patches import sepal_ui.solara before the module of the app
+        _patch_app_startup()
+
+    return _time(lambda: importlib.import_module(module), 1)
+
+
+def case_recipe(repeat: int) -> List[float]:
+    from component.model.recipe import Recipe
+
+    gee_interface = fake_gee_interface()
+    return _time(lambda: Recipe(gee_interface=gee_interface), repeat)
+
+
+def case_map(repeat: int) -> List[float]:
+    from component.model.recipe import Recipe
+    from component.widget.map import SeplanMap
+
+    gee_interface = fake_gee_interface()
+    recipe = Recipe(gee_interface=gee_interface)
+    return _time(
+        lambda: SeplanMap(recipe.seplan_aoi, gee_interface=gee_interface), repeat
+    )
+
+
+def case_page(repeat: int) -> List[float]:
+    import solara
+
+    _patch_app_startup()
+    solara_app = importlib.import_module("solara_app")
+
+    return _time(lambda: solara.render(solara_app.Page(), handle_error=False), repeat)
+
+
+def case_recipe_load(repeat: int, recipe_path: Path) -> List[float]:
+    from component.model.recipe import Recipe
+
+    gee_interface = fake_gee_interface()
+
+    async def load():
+        recipe = Recipe(gee_interface=gee_interface)
+        return await recipe.load_async(str(recipe_path))
+
+    return _time(lambda: asyncio.run(load()), repeat)
+
+
+def run_case(name: str, repeat: int, recipe_path: Path) -> dict:
+    """Run a case in this interpreter."""
+    sys.path.insert(0, str(ROOT))
+    if name.startswith("import:"):
+        return {"runs": case_import(name.split(":", 1)[1])}
+
+    with tempfile.TemporaryDirectory() as folder:
+        _isolate_caches(Path(folder))
+
+        if name == "recipe_load":
+            reason = _init_ee()
+            if reason:
+                return {"skipped": reason}
+            return {"runs": case_recipe_load(repeat, recipe_path)}
+
+        case = {"recipe": case_recipe, "map": case_map, "page": case_page}[name]
+        return {"runs": case(repeat)}
+
+
+# -- driver -------------------------------------------------------------------
+
+
+def _run_child(name: str, repeat: int, recipe_path: Path) -> dict:
+    """Run a case in a fresh interpreter."""
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--case",
+        name,
+        "--repeat",
+        str(repeat),
+        "--recipe",
+        str(recipe_path),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+    if result.returncode:
+        error = (result.stderr.strip().splitlines() or ["no output"])[-1]
+        return {"error": error}
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _summarize(runs: List[float]) -> dict:
+    return {
+        "runs": [round(run, 4) for run in runs],
+        "first": round(runs[0], 4),
+        "min": round(min(runs), 4),
+        "median": round(statistics.median(runs), 4),
+    }
+
+
+def run_benchmarks(repeat: int, recipe_path: Path) -> Dict[str, dict]:
+    """Run every case, each in a fresh interpreter."""
+    results = {}
+
+    # an import is only cold once per interpreter: one interpreter per run
+    for module in IMPORT_MODULES:
+        name = f"import:{module}"
+        runs, outcome = [], {}
+        for _ in range(repeat):
+            outcome = _run_child(name, 1, recipe_path)
+            if "runs" not in outcome:
+                break
+            runs += outcome["runs"]
+
+        results[name] = _summarize(runs) if "runs" in outcome else outcome
+        print(f"{name}: {results[name]}", file=sys.stderr)
+
+    for name in ["recipe", "map", "page", "recipe_load"]:
+        outcome = _run_child(name, repeat, recipe_path)
+        results[name] = _summarize(outcome["runs"]) if "runs" in outcome else outcome
+        print(f"{name}: {results[name]}", file=sys.stderr)
+
+    return results
+
+
+def _version() -> str:
+    try:
+        import tomllib
+
+        pyproject = tomllib.loads((ROOT / "pyproject.toml").read_text())
+        return pyproject["project"]["version"]
+    except Exception:
+        return "unknown"
+
+
+def compare(
+    results: Dict[str, dict],
+    baseline: Dict[str, dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> List[str]:
+    """List the cases slower than in the baseline.
+
+    A case of the baseline that has no median anymore (it failed, was skipped
+    or didn't run) is flagged too.
+
+    Args:
+        results: the measured cases.
+        baseline: the cases of a previous run.
+        threshold: the relative slowdown of the median that is flagged.
+        min_delta: the slowdown in seconds below which a case isn't flagged.
+    """
+    regressions = []
+    for name in {**baseline, **results}:
+        before = baseline.get(name, {}).get("median")
+        result = results.get(name, {})
+        after = result.get("median")
+        if before is None:
+            continue
+
+        if after is None:
+            if "error" in result:
+                status = f"failed ({result['error']})"
+            elif "skipped" in result:
+                status = f"skipped ({result['skipped']})"
+            else:
+                status = "not run"
+            regressions.append(f"{name}: {before:.3f}s -> {status}")
+        elif after > before * (1 + threshold) and after - before > min_delta:
+            regressions.append(
+                f"{name}: {before:.3f}s -> {after:.3f}s (+{after / before - 1:.0%})"
+            )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("startup.json"))
+    parser.add_argument("--baseline", type=Path, help="results to compare with")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--recipe", type=Path, default=DEFAULT_RECIPE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.repeat, args.recipe)))
+        return 0
+
+    report = {
+        "version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "results": run_benchmarks(args.repeat, args.recipe),
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(
+        report["results"], baseline["results"], args.threshold, args.min_delta
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,26 @@
 """SE.PLAN model to store the data related with areas of interest."""
 
+import asyncio
 import json
 import logging
 from functools import lru_cache
-from pathlib import Path
 from typing import Any as AnyType
 from typing import Dict as DictType
-from typing import Tuple
+from typing import Optional, Tuple
 
-import geopandas as gpd
-import pygaul
-from sepal_ui import color, model
-from sepal_ui.aoi.aoi_model import AoiModel
-from sepal_ui.message import ms
+from sepal_ui import model
 from sepal_ui.scripts import utils as su
 from sepal_ui.scripts.gee_interface import GEEInterface
 from traitlets import Any, Bool, Dict, Int
 
 import component.parameter as cp
-from component.scripts.aoi_geometry import _aoi_bbox, fc_from_source
+from component.scripts.aoi_geometry import (
+    ANALYSIS_MAX_AREA_ERROR,
+    aoi_fingerprint,
+    fc_from_source,
+    resolve_analysis_simplification_async,
+    simplify_fc,
+)
 
 logger = logging.getLogger("SEPLAN")
 
@@ -114,6 +116,8 @@ def _migrate_gaul_code(admin_code, method=None, name=None):
     if not admin_code:
         return admin_code
 
+    import pygaul
+
     code = str(admin_code)
     df = pygaul._df()
     mapping = _gaul_migration_map()
@@ -170,253 +174,9 @@ def _migrate_gaul_code(admin_code, method=None, name=None):
     return code
 
 
-class AoiModel(AoiModel):
-    updated = Int(0).tag(sync=True)
-    """announces when the model is updated"""
-
-    def __init__(self, gee_interface: GEEInterface = None, **kwargs):
-        super().__init__(gee_interface=gee_interface, **kwargs)
-
-        # set the default
-        self.set_default(self.default_vector, self.default_admin, self.default_asset)
-
-    def _from_geo_json(self, geo_json: dict):
-        """Build the in-memory feature_collection from a drawn geometry.
-
-        Overrides pysepal's implementation to skip ``export_to_asset()`` —
-        for SE.PLAN we only need an ``ee.FeatureCollection`` in memory; we
-        don't want to persist user-drawn AOIs to their EE asset folder
-        (and pysepal's folder resolution falls through to the literal
-        string "None" when no folder is configured, breaking the export).
-        """
-        if not geo_json or not geo_json.get("features"):
-            raise Exception(ms.aoi_sel.exception.no_draw)
-
-        # Strip styling so geopandas/EE accept the geometry.
-        for feat in geo_json["features"]:
-            if "style" in feat.get("properties", {}):
-                del feat["properties"]["style"]
-
-        self.gdf = gpd.GeoDataFrame.from_features(geo_json).set_crs(epsg=4326)
-        self.name = su.normalize_str(self.name)
-        self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
-
-        return self
-
-    def set_object(self, method: str = ""):
-        """Set the object (gdf/featurecollection) based on the model inputs.
-
-        The method can be manually overwritten by setting the ``method`` parameter.
-
-        Args:
-            method: a model loading method
-        """
-        # clear the model output if existing
-        self.clear_output()
-
-        # overwrite self.method
-        self.method = method or self.method
-
-        if self.method in ["ADMIN0", "ADMIN1", "ADMIN2"]:
-            self._from_admin(self.admin)
-        elif self.method == "POINTS":
-            self._from_points(self.point_json)
-        elif self.method == "SHAPE":
-            self._from_vector(self.vector_json)
-        elif self.method == "DRAW":
-            self._from_geo_json(self.geo_json)
-        elif self.method == "ASSET":
-            self._from_asset(self.asset_json)
-        else:
-            raise Exception(ms.aoi_sel.exception.no_inputs)
-
-        self.updated += 1
-
-        return self
-
-    async def set_object_async(self, method: str = ""):
-        """Set the object (gdf/featurecollection) based on the model inputs.
-
-        The method can be manually overwritten by setting the ``method`` parameter.
-
-        Args:
-            method: a model loading method
-        """
-        # clear the model output if existing
-        self.clear_output()
-
-        # overwrite self.method
-        self.method = method or self.method
-
-        if self.method in ["ADMIN0", "ADMIN1", "ADMIN2"]:
-            await self._from_admin_async(self.admin)
-        elif self.method == "SHAPE":
-            await self._from_vector_async(self.vector_json)
-        elif self.method == "DRAW":
-            await self._from_geo_json_async(self.geo_json)
-        elif self.method == "ASSET":
-            self._from_asset(self.asset_json)
-        else:
-            raise Exception(ms.aoi_sel.exception.no_inputs)
-
-        self.updated += 1
-
-        return self
-
-    async def total_bounds_async(self, fc=None):
-        """Return the AOI extent ``[minx, miny, maxx, maxy]`` asynchronously.
-
-        Pass ``fc`` to compute from a captured feature collection instead of the
-        live ``feature_collection`` trait, which ``set_object`` transiently nulls
-        (via ``clear_output``) while rebuilding — a deferred zoom must use the AOI
-        it was scheduled with. Per-feature bounding boxes (see ``_aoi_bbox``) avoid
-        the dissolved-geometry edge limit; fetched via ``get_info_async``.
-        """
-        fc = self.feature_collection if fc is None else fc
-        if fc is None:
-            raise ValueError(ms.aoi_sel.exception.no_gdf)
-
-        coords = await self.gee_interface.get_info_async(
-            _aoi_bbox(fc).coordinates().get(0)
-        )
-        bounds = [coords[0][0], coords[0][1], coords[2][0], coords[2][1]]
-        return [round(bound, 4) for bound in bounds]
-
-    def clear_attributes(self):
-        """Return all attributes to their default state.
-
-        Note:
-            Set the default setting as current object.
-        """
-        # keep the default
-        admin = self.default_admin
-        vector = self.default_vector
-        asset = self.default_asset
-
-        # delete all the traits but the updated one (to avoid triggering the event)
-        [
-            setattr(self, attr, None)
-            for attr in self.trait_names()
-            if attr not in ["updated", "object_set"]
-        ]
-
-        # reset the outputs
-        self.clear_output()
-
-        # reset the default
-        self.set_default(vector, admin, asset)
-
-        # Tell seplan_aoi to update their linked traits (feature collecction)
-        self.updated += 1
-
-        return self
-
-    async def _from_vector_async(self, vector_json: dict):
-        """Set the object output from a vector json.
-
-        Args:
-            vector_json: the dict describing the vector file, and column filter
-        """
-        if not (vector_json["pathname"]):
-            raise Exception(ms.aoi_sel.exception.no_file)
-
-        if vector_json["column"] != "ALL":
-            if vector_json["value"] is None:
-                raise Exception(ms.aoi_sel.exception.no_value)
-
-        # cast the pathname to pathlib Path
-        vector_file = Path(vector_json["pathname"])
-
-        # create the gdf
-        self.gdf = gpd.read_file(vector_file).to_crs("EPSG:4326")
-
-        # set the name using the file stem
-        self.name = vector_file.stem
-
-        # filter it if necessary
-        if vector_json["value"] is not None:
-            self.gdf = self.gdf[self.gdf[vector_json["column"]] == vector_json["value"]]
-            self.name = f"{self.name}_{vector_json['column']}_{vector_json['value']}"
-
-        if self.gee:
-            # transform the gdf to ee.FeatureCollection
-            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
-
-            # export as a GEE asset
-            await self.export_to_asset_async()
-
-        return self
-
-    async def _from_geo_json_async(self, geo_json: dict):
-        """Set the gdf output from a geo_json.
-
-        Args:
-            geo_json: the __geo_interface__ dict of a geometry drawn on the map
-        """
-        if not geo_json:
-            raise Exception(ms.aoi_sel.exception.no_draw)
-
-        # remove the style property from geojson as it's not recognize by geopandas and gee
-        for feat in geo_json["features"]:
-            if "style" in feat["properties"]:
-                del feat["properties"]["style"]
-
-        # create the gdf
-        self.gdf = gpd.GeoDataFrame.from_features(geo_json).set_crs(epsg=4326)
-
-        # normalize the name
-        self.name = su.normalize_str(self.name)
-
-        if self.gee:
-            # transform the gdf to ee.FeatureCollection
-            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
-
-            # export as a GEE asset
-            await self.export_to_asset_async()
-        else:
-            # save the geojson in downloads
-            path = Path("~", "downloads", "aoi").expanduser()
-            path.mkdir(
-                exist_ok=True, parents=True
-            )  # if nothing have been run the downloads folder doesn't exist
-            self.gdf.to_file(path / f"{self.name}.geojson", driver="GeoJSON")
-
-        return self
-
-    async def _from_admin_async(self, admin: str):
-        """Set the object according to the given an administrative code in the GADM/GAUL codes.
-
-        Args:
-            admin: the admin code corresponding to FAO GAUl (if gee) or GADM
-        """
-        if not admin:
-            raise Exception(ms.aoi_sel.exception.no_admlyr)
-
-        # get the data from either the pygaul or the pygadm libs
-        self.feature_collection = pygaul.AdmItems(admin=admin)
-
-        # get properties from the first feature to build the AOI name
-        feature = self.feature_collection.first()
-        properties = await self.gee_interface.get_info_async(
-            feature.toDictionary(feature.propertyNames())
-        )
-
-        # GAUL 2024 has iso3_code directly, fallback to mapping for disputed areas
-        iso = properties.get("iso3_code", "")
-        if not iso or (isinstance(iso, str) and iso.startswith("x")):
-            gaul0_code = str(properties.get("gaul0_code", ""))
-            iso = json.loads(self.MAPPING.read_text()).get(gaul0_code, "UNK")
-
-        # GAUL 2024 uses lowercase column names: gaul0_name, gaul1_name, gaul2_name
-        names = [value for prop, value in properties.items() if "_name" in prop]
-
-        # generate the name from the columns
-        names = [su.normalize_str(name) for name in names]
-        names[0] = iso
-
-        self.name = "_".join(names)
-
-        return self
+def _default_simplification() -> dict:
+    """The analysis simplification of a new recipe: disabled."""
+    return {"enabled": False, "max_area_error": ANALYSIS_MAX_AREA_ERROR, "aois": {}}
 
 
 class SeplanAoi(model.Model):
@@ -455,7 +215,15 @@ class SeplanAoi(model.Model):
     auto-close of the step dialog so the user can see a non-LMIC warning
     before the dialog disappears."""
 
+    simplification = Dict(_default_simplification()).tag(sync=True)
+    """dict: opt-in simplification of the AOI geometries used for the analysis.
+    ``enabled`` and ``max_area_error`` (fraction of the AOI area) are set by the
+    user, ``aois`` records the tolerance (m) and the measured area error
+    resolved for each AOI, see ``resolve_simplification_async``."""
+
     def __init__(self, gee_interface=None, **kwargs):
+        from component.model.sepal_aoi_model import AoiModel
+
         # test_countries:
         # Multiple polygon country: 220
         # Small department: 959 (risaralda)
@@ -498,8 +266,12 @@ class SeplanAoi(model.Model):
 
         self.updated += 1
 
-    def get_ee_features(self) -> Tuple[DictType[str, AnyType], DictType[str, AnyType]]:
-        """Returns a dictionary of current AOI layers, where name is the key."""
+    def _source_features(
+        self,
+    ) -> Tuple[DictType[str, AnyType], DictType[str, AnyType]]:
+        """Return the full-resolution primary AOI and sub-AOIs, by name."""
+        from sepal_ui import color
+
         primary_aoi = {
             self.aoi_model.name: {
                 "ee_feature": self.feature_collection,
@@ -520,6 +292,112 @@ class SeplanAoi(model.Model):
 
         return (primary_aoi, custom_aois)
 
+    def _simplification_record(self, name: str, fc) -> Optional[dict]:
+        """Return the simplification applied to an AOI, None if it's not simplified.
+
+        A record is only applied to the geometry it was resolved for.
+        """
+        if fc is None or not self.simplification.get("enabled"):
+            return None
+
+        record = self.simplification.get("aois", {}).get(name)
+        if not record or record.get("tolerance") is None:
+            return None
+
+        if record.get("fingerprint") != aoi_fingerprint(fc):
+            return None
+
+        return record
+
+    def _analysis_feature(self, name: str, data: dict) -> dict:
+        """Swap the geometry of an AOI for its simplified version if any."""
+        record = self._simplification_record(name, data["ee_feature"])
+        if record is None:
+            return data
+
+        return {
+            **data,
+            "ee_feature": simplify_fc(data["ee_feature"], record["tolerance"]),
+            "simplification": {
+                "tolerance": record["tolerance"],
+                "area_error": record["area_error"],
+            },
+        }
+
+    def get_ee_features(self) -> Tuple[DictType[str, AnyType], DictType[str, AnyType]]:
+        """Returns a dictionary of current AOI layers, where name is the key.
+
+        The AOIs are the ones used for the analysis: when the simplification is
+        enabled, each resolved AOI is replaced by its simplified geometry and
+        carries the applied ``simplification``.
+        """
+        primary_aoi, custom_aois = self._source_features()
+
+        return tuple(
+            {name: self._analysis_feature(name, data) for name, data in aois.items()}
+            for aois in (primary_aoi, custom_aois)
+        )
+
+    def get_analysis_feature_collection(self):
+        """Return the primary AOI used for the analysis, None if there is none."""
+        data = {"ee_feature": self.feature_collection}
+
+        return self._analysis_feature(self.aoi_model.name, data)["ee_feature"]
+
+    def set_simplification(self, enabled: bool) -> None:
+        """Enable or disable the simplification of the analysis geometries."""
+        self.simplification = {**self.simplification, "enabled": enabled}
+
+    async def resolve_simplification_async(self, gee_interface: GEEInterface) -> None:
+        """Choose the tolerance of every AOI missing one, when simplification is on.
+
+        The simplification is only an optimization: an AOI whose tolerance
+        can't be resolved is analysed at full resolution.
+        """
+        if not self.simplification.get("enabled") or self.feature_collection is None:
+            return
+
+        primary_aoi, custom_aois = self._source_features()
+        fcs = {
+            name: data["ee_feature"]
+            for name, data in {**primary_aoi, **custom_aois}.items()
+        }
+        records = self.simplification.get("aois", {})
+        fingerprints = {name: aoi_fingerprint(fc) for name, fc in fcs.items()}
+        max_area_error = self.simplification["max_area_error"]
+
+        # drop the records of removed or changed AOIs
+        aois = {
+            name: record
+            for name, record in records.items()
+            if fingerprints.get(name) == record.get("fingerprint")
+            and record.get("max_area_error") == max_area_error
+        }
+        missing = [name for name in fcs if name not in aois]
+
+        results = await asyncio.gather(
+            *[
+                resolve_analysis_simplification_async(
+                    gee_interface, fcs[name], max_area_error
+                )
+                for name in missing
+            ],
+            return_exceptions=True,
+        )
+        for name, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning(f"AOI '{name}' analysed at full resolution: {result}")
+                continue
+            aois[name] = {
+                **result,
+                "fingerprint": fingerprints[name],
+                "max_area_error": max_area_error,
+            }
+            logger.info(f"Analysis simplification of '{name}': {result}")
+
+        if aois != records:
+            self.simplification = {**self.simplification, "aois": aois}
+
     def import_data(self, data: dict, auto_update: bool = True):
         """Set the data for each of the AOIs."""
         primary_data = dict(data["primary"])
@@ -536,6 +414,9 @@ class SeplanAoi(model.Model):
         try:
             self.aoi_model.import_data(primary_data)
             self.custom_layers = data["custom"]
+            self.simplification = (
+                data.get("simplification") or _default_simplification()
+            )
 
             # if there's no aoi we just need to reset the map
             if not primary_data["method"]:
@@ -564,6 +445,9 @@ class SeplanAoi(model.Model):
         try:
             self.aoi_model.import_data(primary_data)
             self.custom_layers = data["custom"]
+            self.simplification = (
+                data.get("simplification") or _default_simplification()
+            )
 
             # if there's no aoi we just need to reset the map
             if not primary_data["method"]:
@@ -579,12 +463,17 @@ class SeplanAoi(model.Model):
 
     def export_data(self):
         """Save the data from each of the AOIs."""
-        return {"primary": self.aoi_model.export_data(), "custom": self.custom_layers}
+        return {
+            "primary": self.aoi_model.export_data(),
+            "custom": self.custom_layers,
+            "simplification": self.simplification,
+        }
 
     def reset(self):
         """Reset the aoi_model to its default values."""
         self.aoi_model.clear_attributes()
         self.custom_layers = {"type": "FeatureCollection", "features": []}
+        self.simplification = _default_simplification()
 
         # I have to do this because I need to have an unique event on reset
         # that resets the view, We can use this event to reset the map as well...
@@ -1,9 +1,8 @@
-import pandas as pd
 from traitlets import List
 
-from component import parameter as cp
 from component.message import cm
 from component.model.questionnaire_model import QuestionnaireModel
+from component.scripts.layer_catalog import get_layer_catalog
 from component.types import BenefitLayerData
 
 
@@ -16,19 +15,34 @@ class BenefitModel(QuestionnaireModel):
     weights = List([]).tag(sync=True)
     units = List([]).tag(sync=True)
 
-    def __init__(self):
-        # get the default benefit from the csv file
-        _themes = pd.read_csv(cp.layer_list).fillna("").sort_values(by=["subtheme"])
-        _themes = _themes[_themes.theme == "benefit"]
+    _columns = {
+        "names": "name",
+        "ids": "id",
+        "themes": "theme",
+        "assets": "asset",
+        "descs": "desc",
+        "weights": "weight",
+        "units": "unit",
+    }
+    _defaults = {"weight": 4}
 
-        for _, row in _themes.iterrows():
-            self.names.append(cm.layers[row.layer_id].name)
-            self.ids.append(row.layer_id)
-            self.themes.append(row.subtheme)
-            self.assets.append(row.gee_asset)
-            self.descs.append(cm.layers[row.layer_id].detail)
-            self.weights.append(4)
-            self.units.append(row.unit)
+    def __init__(self):
+        # get the default benefit from the layer catalog
+        _themes = sorted(
+            get_layer_catalog().by_theme("benefit"), key=lambda row: row.subtheme
+        )
+
+        for row in _themes:
+            self._append(
+                {
+                    "theme": row.subtheme,
+                    "name": cm.layers[row.layer_id].name,
+                    "id": row.layer_id,
+                    "asset": row.gee_asset,
+                    "desc": cm.layers[row.layer_id].detail,
+                    "unit": row.unit,
+                }
+            )
 
         super().__init__()
 
@@ -41,50 +55,41 @@ class BenefitModel(QuestionnaireModel):
                 I dont' want to update the whole table if one asset failed
                 to be added.
         """
-        idx = self.get_index(id)
-
-        del self.names[idx]
-        del self.ids[idx]
-        del self.themes[idx]
-        del self.assets[idx]
-        del self.descs[idx]
-        del self.weights[idx]
-        del self.units[idx]
-
-        if update:
-            self.updated += 1
-        self.new_changes += 1
+        self.remove_layers([id], update)
 
     def add(
         self, theme: str, name: str, id: str, asset: str, desc: str, unit: str
     ) -> None:
         """add a benefit and trigger the update."""
-        self.themes.append(theme)
-        self.names.append(name)
-        self.ids.append(id)
-        self.assets.append(asset)
-        self.descs.append(desc)
-        self.weights.append(4)
-        self.units.append(unit)
-
-        self.updated += 1
-        self.new_changes += 1
+        self.add_layers(
+            [
+                {
+                    "theme": theme,
+                    "name": name,
+                    "id": id,
+                    "asset": asset,
+                    "desc": desc,
+                    "unit": unit,
+                }
+            ]
+        )
 
     def update(
         self, theme: str, name: str, id: str, asset: str, desc: str, unit: str
     ) -> None:
         """update an existing benefit metadata and trigger the update."""
-        idx = self.get_index(id)
-
-        self.themes[idx] = theme
-        self.names[idx] = name
-        self.ids[idx] = id
-        self.assets[idx] = asset
-        self.descs[idx] = desc
-        self.units[idx] = unit
-
-        self.updated += 1
-        self.new_changes += 1
+        self.update_layers(
+            [
+                {
+                    "theme": theme,
+                    "name": name,
+                    "id": id,
+                    "asset": asset,
+                    "desc": desc,
+                    "unit": unit,
+                }
+            ]
+        )
 
     def update_value(self, id: str, value: list) -> None:
         """Update the value of a specific benefit."""
@@ -93,21 +98,6 @@ class BenefitModel(QuestionnaireModel):
         self.weights[idx] = value
         self.new_changes += 1
 
-    def reset(self):
-        """Reset the model to its default values."""
-        self.names = []
-        self.ids = []
-        self.themes = []
-        self.assets = []
-        self.descs = []
-        self.weights = []
-        self.units = []
-
-        self.__init__()
-
-        self.updated += 1
-        self.new_changes = 0
-
     def get_layer_data(self, layer_id: str) -> BenefitLayerData:
         """Return the data of a specific layer."""
         idx = self.get_index(layer_id)
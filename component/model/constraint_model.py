@@ -1,10 +1,9 @@
-import pandas as pd
 from traitlets import List, observe
 from typing import Tuple
 
-from component import parameter as cp
 from component.message import cm
 from component.model.questionnaire_model import QuestionnaireModel
+from component.scripts.layer_catalog import get_layer_catalog
 from component.scripts.validation import validate_constraint_model_data
 from component.types import ConstraintLayerData
 
@@ -23,20 +22,34 @@ class ConstraintModel(QuestionnaireModel):
     values = List([]).tag(sync=True)
     data_type = List([]).tag(sync=True)
 
+    _columns = {
+        "names": "name",
+        "ids": "id",
+        "themes": "theme",
+        "assets": "asset",
+        "descs": "desc",
+        "units": "unit",
+        "values": "value",
+        "data_type": "data_type",
+    }
+    _defaults = {"value": []}
+
     def __init__(self):
-        # get the default constraint from the csv file
-        _constraint = pd.read_csv(cp.layer_list).fillna("")
-        _constraint = _constraint[_constraint.layer_id == "treecover_with_potential"]
-
-        for _, r in _constraint.iterrows():
-            self.themes.append(r.subtheme)
-            self.names.append(cm.layers[r.layer_id].name)
-            self.ids.append(r.layer_id)
-            self.assets.append(r.gee_asset)
-            self.descs.append(cm.layers[r.layer_id].detail)
-            self.units.append(r.unit)
-            self.values.append([0, 1])
-            self.data_type.append(r.data_type)
+        # get the default constraint from the layer catalog
+        r = get_layer_catalog()["treecover_with_potential"]
+
+        self._append(
+            {
+                "theme": r.subtheme,
+                "name": cm.layers[r.layer_id].name,
+                "id": r.layer_id,
+                "asset": r.gee_asset,
+                "desc": cm.layers[r.layer_id].detail,
+                "unit": r.unit,
+                "value": [0, 1],
+                "data_type": r.data_type,
+            }
+        )
 
         super().__init__()
 
@@ -49,21 +62,9 @@ class ConstraintModel(QuestionnaireModel):
                 I dont' want to update the whole table if one asset failed
                 to be added.
         """
-        idx = self.get_index(id)
-
-        del self.names[idx]
-        del self.ids[idx]
-        del self.themes[idx]
-        del self.assets[idx]
-        del self.descs[idx]
-        del self.units[idx]
-        del self.values[idx]
-        del self.data_type[idx]
-
         if update:
             logger.debug("updating from remove")
-            self.updated += 1
-        self.new_changes += 1
+        self.remove_layers([id], update)
 
     def add(
         self,
@@ -76,17 +77,20 @@ class ConstraintModel(QuestionnaireModel):
         data_type: str,
     ) -> None:
         """add a constraint and trigger the update."""
-        self.themes.append(theme)
-        self.names.append(name)
-        self.ids.append(id)
-        self.assets.append(asset)
-        self.descs.append(desc)
-        self.units.append(unit)
-        self.values.append([])
-        self.data_type.append(data_type)
         logger.debug("updating from add")
-        self.updated += 1
-        self.new_changes += 1
+        self.add_layers(
+            [
+                {
+                    "theme": theme,
+                    "name": name,
+                    "id": id,
+                    "asset": asset,
+                    "desc": desc,
+                    "unit": unit,
+                    "data_type": data_type,
+                }
+            ]
+        )
 
     def update(
         self,
@@ -99,18 +103,20 @@ class ConstraintModel(QuestionnaireModel):
         data_type: str,
     ) -> None:
         """update an existing constraint metadata and trigger the update."""
-        idx = self.get_index(id)
-
-        self.themes[idx] = theme
-        self.names[idx] = name
-        self.ids[idx] = id
-        self.assets[idx] = asset
-        self.descs[idx] = desc
-        self.units[idx] = unit
-        self.data_type[idx] = data_type
         logger.debug("updating from update")
-        self.updated += 1
-        self.new_changes += 1
+        self.update_layers(
+            [
+                {
+                    "theme": theme,
+                    "name": name,
+                    "id": id,
+                    "asset": asset,
+                    "desc": desc,
+                    "unit": unit,
+                    "data_type": data_type,
+                }
+            ]
+        )
 
     def update_value(self, id: str, value: list) -> None:
         """Update the value of a specific constraint."""
@@ -121,19 +127,8 @@ class ConstraintModel(QuestionnaireModel):
 
     def reset(self):
         """Reset the model to its default values."""
-        self.names = []
-        self.ids = []
-        self.themes = []
-        self.assets = []
-        self.descs = []
-        self.units = []
-        self.values = []
-        self.data_type = []
-
-        self.__init__()
         logger.debug("updating from reset")
-        self.updated += 1
-        self.new_changes = 0
+        super().reset()
 
     @observe("updated")
     def _on_update(self, *_):
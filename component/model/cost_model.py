@@ -1,9 +1,8 @@
-import pandas as pd
 from traitlets import List
 
-from component import parameter as cp
 from component.message import cm
 from component.model.questionnaire_model import QuestionnaireModel
+from component.scripts.layer_catalog import get_layer_catalog
 from component.types import CostLayerData
 
 
@@ -17,17 +16,28 @@ class CostModel(QuestionnaireModel):
     _unit = "$/ha"
     "All cost layer must use the same unit if not aggregation will not be possible"
 
-    def __init__(self):
-        # get the default costs from the csv file
-        _costs = pd.read_csv(cp.layer_list).fillna("")
-        _costs = _costs[_costs.theme == "cost"]
+    _columns = {
+        "names": "name",
+        "ids": "id",
+        "assets": "asset",
+        "descs": "desc",
+        "units": "unit",
+    }
+    _defaults = {"unit": _unit}
 
-        for _, r in _costs.iterrows():
-            self.names.append(cm.layers[r.layer_id].name)
-            self.ids.append(r.layer_id)
-            self.assets.append(r.gee_asset)
-            self.descs.append(cm.layers[r.layer_id].detail)
-            self.units.append(self._unit)
+    def __init__(self):
+        # get the default costs from the layer catalog
+        _costs = get_layer_catalog().by_theme("cost")
+
+        for r in _costs:
+            self._append(
+                {
+                    "name": cm.layers[r.layer_id].name,
+                    "id": r.layer_id,
+                    "asset": r.gee_asset,
+                    "desc": cm.layers[r.layer_id].detail,
+                }
+            )
 
         super().__init__()
 
@@ -40,54 +50,25 @@ class CostModel(QuestionnaireModel):
                 I dont' want to update the whole table if one asset failed
                 to be added.
         """
-        idx = self.get_index(id)
-
-        del self.names[idx]
-        del self.ids[idx]
-        del self.assets[idx]
-        del self.descs[idx]
-        del self.units[idx]
-
-        if update:
-            self.updated += 1
-        self.new_changes += 1
+        self.remove_layers([id], update)
 
     def add(self, name: str, id: str, asset: str, desc: str) -> None:
         """add a cost and trigger the update."""
-        self.names.append(name)
-        self.ids.append(id)
-        self.assets.append(asset)
-        self.descs.append(desc)
-        self.units.append(self._unit)
-
-        self.updated += 1
-        self.new_changes += 1
+        self.add_layers([{"name": name, "id": id, "asset": asset, "desc": desc}])
 
     def update(self, name: str, id: str, asset: str, desc: str) -> None:
         """update an existing cost metadata and trigger the update."""
-        idx = self.get_index(id)
-
-        self.names[idx] = name
-        self.ids[idx] = id
-        self.assets[idx] = asset
-        self.descs[idx] = desc
-        self.units[idx] = self._unit
-
-        self.updated += 1
-        self.new_changes += 1
-
-    def reset(self):
-        """Reset the model to its default values."""
-        self.names = []
-        self.ids = []
-        self.assets = []
-        self.descs = []
-        self.units = []
-
-        self.__init__()
-
-        self.updated += 1
-        self.new_changes = 0
+        self.update_layers(
+            [
+                {
+                    "name": name,
+                    "id": id,
+                    "asset": asset,
+                    "desc": desc,
+                    "unit": self._unit,
+                }
+            ]
+        )
 
     def get_layer_data(self, layer_id: str) -> CostLayerData:
         """Return the data of a specific layer."""
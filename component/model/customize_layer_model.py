@@ -1,10 +1,7 @@
-import pandas as pd
 from sepal_ui import model
 from traitlets import Any
 
-from component import parameter as cp
-
-layer_list = pd.read_csv(cp.layer_list).fillna("")
+from component.scripts.layer_catalog import get_layer_catalog
 
 
 class CustomizeLayerModel(model.Model):
@@ -18,7 +15,7 @@ class CustomizeLayerModel(model.Model):
                 "theme": row.theme,
                 "subtheme": row.subtheme,
             }
-            for i, row in layer_list.iterrows()
+            for row in get_layer_catalog()
         ]
     ).tag(sync=True)
 
@@ -1,11 +1,21 @@
 from sepal_ui import model
-from traitlets import Int
+from traitlets import Bool, Int
 
 
 class DashboardModel(model.Model):
 
     reset_count = Int(0).tag(sync=True)
 
+    exact_scale = Bool(False).tag(sync=True)
+    """bool: compute the statistics of every AOI at the reference 100 m scale
+    instead of the scale planned from its extent (see ``plan_stats_scale``)."""
+
+    quick_estimate = Bool(False).tag(sync=True)
+    """bool: display statistics estimated from sample points before the exact ones."""
+
+    refine_estimate = Bool(True).tag(sync=True)
+    """bool: compute the exact statistics after the quick estimate."""
+
     def reset(self):
         """Reset the model to its default values."""
         self.reset_count += 1
@@ -1,7 +1,10 @@
 """questionnaire model that sets the basic structure for theme model."""
 
+import copy
+from typing import Any, Dict, Iterable, Optional
+
 from sepal_ui import model
-from traitlets import Int
+from traitlets import Int, observe
 
 
 class QuestionnaireModel(model.Model):
@@ -10,6 +13,15 @@ class QuestionnaireModel(model.Model):
     new_changes = Int().tag(sync=True)
     """A counter that is incremented every time any trait of the model changes. This trait is linked to the recipe model and later with app_model, so we can show messaages on the app_bar"""
 
+    _columns: Dict[str, str] = {}
+    """The list traits storing the layers, by the key of their value in the data of a layer. The lists are aligned: a layer is at the same row in all of them."""
+
+    _defaults: Dict[str, Any] = {}
+    """The values of the columns missing from the data of an added layer."""
+
+    _index: Optional[Dict[str, int]] = None
+    """The row of every layer id, rebuilt lazily when the rows move."""
+
     def import_data(self, data: dict):
         """Set the data for each of the model traits and triggers the update of the view."""
         super().import_data(data)
@@ -17,6 +29,111 @@ class QuestionnaireModel(model.Model):
 
         self.new_changes += 1
 
+    @observe("ids")
+    def _reset_index(self, *_):
+        self._index = None
+
+    def _get_index_map(self) -> Dict[str, int]:
+        if self._index is None:
+            # the first occurrence wins, as in a scan of the ids
+            self._index = {}
+            for i, id_ in enumerate(self.ids):
+                self._index.setdefault(id_, i)
+
+        return self._index
+
     def get_index(self, id: str) -> int:
         """get the index of the searched layer id."""
-        return next(i for i, v in enumerate(self.ids) if v == id)
+        idx = self._get_index_map().get(id)
+
+        # the lists can be edited in place out of the model: check the row
+        if idx is None or idx >= len(self.ids) or self.ids[idx] != id:
+            self._index = None
+            idx = self._get_index_map().get(id)
+
+        if idx is None:
+            raise ValueError(f"{id} is not a layer of the model")
+
+        return idx
+
+    def _append(self, layer: dict) -> None:
+        """Append a layer to the columns without triggering any update."""
+        row = {**copy.deepcopy(self._defaults), **layer}
+        for column, key in self._columns.items():
+            getattr(self, column).append(row[key])
+
+        if self._index is not None:
+            self._index.setdefault(row["id"], len(self.ids) - 1)
+
+    def add_layers(self, layers: Iterable[dict]) -> None:
+        """Add layers and trigger a single update.
+
+        Args:
+            layers: the data of the layers, as in ``get_layer_data``. The values
+                missing from a layer are the defaults of the model.
+        """
+        layers = list(layers)
+        if not layers:
+            return
+
+        for layer in layers:
+            self._append(layer)
+
+        self.updated += 1
+        self.new_changes += 1
+
+    def remove_layers(self, ids: Iterable[str], update: bool = True) -> None:
+        """Remove layers using their ids and trigger a single update.
+
+        Args:
+            ids: the ids of the layers to remove
+            update: trigger the update of the view.
+        """
+        ids = set(ids)
+        if not ids:
+            return
+
+        missing = ids - set(self.ids)
+        if missing:
+            raise ValueError(f"{sorted(missing)} are not layers of the model")
+
+        keep = [i for i, id_ in enumerate(self.ids) if id_ not in ids]
+        for column in self._columns:
+            values = getattr(self, column)
+            values[:] = [values[i] for i in keep]
+
+        self._index = None
+
+        if update:
+            self.updated += 1
+        self.new_changes += 1
+
+    def update_layers(self, layers: Iterable[dict]) -> None:
+        """Update the metadata of existing layers and trigger a single update.
+
+        Args:
+            layers: the data of the layers, found by their "id". Only the
+                values given are updated.
+        """
+        layers = list(layers)
+        if not layers:
+            return
+
+        for layer in layers:
+            idx = self.get_index(layer["id"])
+            for column, key in self._columns.items():
+                if key in layer:
+                    getattr(self, column)[idx] = layer[key]
+
+        self.updated += 1
+        self.new_changes += 1
+
+    def reset(self):
+        """Reset the model to its default values."""
+        for column in self._columns:
+            setattr(self, column, [])
+
+        self.__init__()
+
+        self.updated += 1
+        self.new_changes = 0
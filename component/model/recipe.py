@@ -57,7 +57,7 @@ class Recipe(HasTraits):
         )
 
         # link the new_changes counter to the models
-        self.seplan_aoi.observe(self.update_changes, "updated")
+        self.seplan_aoi.observe(self.update_changes, ["updated", "simplification"])
         # auto-assign a default name+path the first time an AOI is set, so the
         # right-panel header has something to display and Save has a target
         self.seplan_aoi.observe(self._auto_init_recipe_path, "updated")
@@ -197,6 +197,27 @@ class Recipe(HasTraits):
         logger.info("Sanitized recipe loaded successfully")
         return self
 
+    async def load_sanitized_async(self, data: dict, recipe_path: str):
+        """Load sanitized recipe data after user accepts fixes.
+
+        Args:
+            data: Sanitized recipe data dictionary
+            recipe_path: Path to the recipe file
+        """
+        logger.debug(f"Loading sanitized recipe data from: {recipe_path}")
+
+        self.recipe_session_path = str(recipe_path)
+
+        await self.seplan_aoi.import_data_async(data["aoi"])
+        self.benefit_model.import_data(data["benefits"])
+        self.constraint_model.import_data(data["constraints"])
+        self.cost_model.import_data(data["costs"])
+
+        self.new_changes = 0
+
+        logger.info("Sanitized recipe loaded successfully")
+        return self
+
     def to_dict(self) -> dict:
         """Build the recipe payload from the in-memory models.
 
@@ -0,0 +1,266 @@
+"""SE.PLAN override of the pysepal model of the primary AOI.
+
+Kept apart from ``component.model.aoi_model``: pysepal's ``aoi`` package loads
+its widgets, its map and geopandas along with the model, so the recipe layer
+only imports it when a ``SeplanAoi`` is built.
+"""
+
+import json
+from pathlib import Path
+
+import geopandas as gpd
+import pygaul
+from sepal_ui.aoi.aoi_model import AoiModel as SepalAoiModel
+from sepal_ui.message import ms
+from sepal_ui.scripts import utils as su
+from sepal_ui.scripts.gee_interface import GEEInterface
+from traitlets import Int
+
+from component.scripts.aoi_geometry import aoi_bounds_async
+
+
+class AoiModel(SepalAoiModel):
+    updated = Int(0).tag(sync=True)
+    """announces when the model is updated"""
+
+    def __init__(self, gee_interface: GEEInterface = None, **kwargs):
+        super().__init__(gee_interface=gee_interface, **kwargs)
+
+        # set the default
+        self.set_default(self.default_vector, self.default_admin, self.default_asset)
+
+    def _from_geo_json(self, geo_json: dict):
+        """Build the in-memory feature_collection from a drawn geometry.
+
+        Overrides pysepal's implementation to skip ``export_to_asset()`` —
+        for SE.PLAN we only need an ``ee.FeatureCollection`` in memory; we
+        don't want to persist user-drawn AOIs to their EE asset folder
+        (and pysepal's folder resolution falls through to the literal
+        string "None" when no folder is configured, breaking the export).
+        """
+        if not geo_json or not geo_json.get("features"):
+            raise Exception(ms.aoi_sel.exception.no_draw)
+
+        # Strip styling so geopandas/EE accept the geometry.
+        for feat in geo_json["features"]:
+            if "style" in feat.get("properties", {}):
+                del feat["properties"]["style"]
+
+        self.gdf = gpd.GeoDataFrame.from_features(geo_json).set_crs(epsg=4326)
+        self.name = su.normalize_str(self.name)
+        self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
+
+        return self
+
+    def set_object(self, method: str = ""):
+        """Set the object (gdf/featurecollection) based on the model inputs.
+
+        The method can be manually overwritten by setting the ``method`` parameter.
+
+        Args:
+            method: a model loading method
+        """
+        # clear the model output if existing
+        self.clear_output()
+
+        # overwrite self.method
+        self.method = method or self.method
+
+        if self.method in ["ADMIN0", "ADMIN1", "ADMIN2"]:
+            self._from_admin(self.admin)
+        elif self.method == "POINTS":
+            self._from_points(self.point_json)
+        elif self.method == "SHAPE":
+            self._from_vector(self.vector_json)
+        elif self.method == "DRAW":
+            self._from_geo_json(self.geo_json)
+        elif self.method == "ASSET":
+            self._from_asset(self.asset_json)
+        else:
+            raise Exception(ms.aoi_sel.exception.no_inputs)
+
+        self.updated += 1
+
+        return self
+
+    async def set_object_async(self, method: str = ""):
+        """Set the object (gdf/featurecollection) based on the model inputs.
+
+        The method can be manually overwritten by setting the ``method`` parameter.
+
+        Args:
+            method: a model loading method
+        """
+        # clear the model output if existing
+        self.clear_output()
+
+        # overwrite self.method
+        self.method = method or self.method
+
+        if self.method in ["ADMIN0", "ADMIN1", "ADMIN2"]:
+            await self._from_admin_async(self.admin)
+        elif self.method == "SHAPE":
+            await self._from_vector_async(self.vector_json)
+        elif self.method == "DRAW":
+            await self._from_geo_json_async(self.geo_json)
+        elif self.method == "ASSET":
+            self._from_asset(self.asset_json)
+        else:
+            raise Exception(ms.aoi_sel.exception.no_inputs)
+
+        self.updated += 1
+
+        return self
+
+    async def total_bounds_async(self, fc=None):
+        """Return the AOI extent ``[minx, miny, maxx, maxy]`` asynchronously.
+
+        Pass ``fc`` to compute from a captured feature collection instead of the
+        live ``feature_collection`` trait, which ``set_object`` transiently nulls
+        (via ``clear_output``) while rebuilding — a deferred zoom must use the AOI
+        it was scheduled with. Per-feature bounding boxes (see ``_aoi_bbox``) avoid
+        the dissolved-geometry edge limit; fetched via ``get_info_async`` the first
+        time the AOI is seen (see ``aoi_bounds_async``).
+        """
+        fc = self.feature_collection if fc is None else fc
+        if fc is None:
+            raise ValueError(ms.aoi_sel.exception.no_gdf)
+
+        bounds = await aoi_bounds_async(self.gee_interface, fc)
+        return [round(bound, 4) for bound in bounds]
+
+    def clear_attributes(self):
+        """Return all attributes to their default state.
+
+        Note:
+            Set the default setting as current object.
+        """
+        # keep the default
+        admin = self.default_admin
+        vector = self.default_vector
+        asset = self.default_asset
+
+        # delete all the traits but the updated one (to avoid triggering the event)
+        [
+            setattr(self, attr, None)
+            for attr in self.trait_names()
+            if attr not in ["updated", "object_set"]
+        ]
+
+        # reset the outputs
+        self.clear_output()
+
+        # reset the default
+        self.set_default(vector, admin, asset)
+
+        # Tell seplan_aoi to update their linked traits (feature collecction)
+        self.updated += 1
+
+        return self
+
+    async def _from_vector_async(self, vector_json: dict):
+        """Set the object output from a vector json.
+
+        Args:
+            vector_json: the dict describing the vector file, and column filter
+        """
+        if not (vector_json["pathname"]):
+            raise Exception(ms.aoi_sel.exception.no_file)
+
+        if vector_json["column"] != "ALL":
+            if vector_json["value"] is None:
+                raise Exception(ms.aoi_sel.exception.no_value)
+
+        # cast the pathname to pathlib Path
+        vector_file = Path(vector_json["pathname"])
+
+        # create the gdf
+        self.gdf = gpd.read_file(vector_file).to_crs("EPSG:4326")
+
+        # set the name using the file stem
+        self.name = vector_file.stem
+
+        # filter it if necessary
+        if vector_json["value"] is not None:
+            self.gdf = self.gdf[self.gdf[vector_json["column"]] == vector_json["value"]]
+            self.name = f"{self.name}_{vector_json['column']}_{vector_json['value']}"
+
+        if self.gee:
+            # transform the gdf to ee.FeatureCollection
+            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
+
+            # export as a GEE asset
+            await self.export_to_asset_async()
+
+        return self
+
+    async def _from_geo_json_async(self, geo_json: dict):
+        """Set the gdf output from a geo_json.
+
+        Args:
+            geo_json: the __geo_interface__ dict of a geometry drawn on the map
+        """
+        if not geo_json:
+            raise Exception(ms.aoi_sel.exception.no_draw)
+
+        # remove the style property from geojson as it's not recognize by geopandas and gee
+        for feat in geo_json["features"]:
+            if "style" in feat["properties"]:
+                del feat["properties"]["style"]
+
+        # create the gdf
+        self.gdf = gpd.GeoDataFrame.from_features(geo_json).set_crs(epsg=4326)
+
+        # normalize the name
+        self.name = su.normalize_str(self.name)
+
+        if self.gee:
+            # transform the gdf to ee.FeatureCollection
+            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
+
+            # export as a GEE asset
+            await self.export_to_asset_async()
+        else:
+            # save the geojson in downloads
+            path = Path("~", "downloads", "aoi").expanduser()
+            path.mkdir(
+                exist_ok=True, parents=True
+            )  # if nothing have been run the downloads folder doesn't exist
+            self.gdf.to_file(path / f"{self.name}.geojson", driver="GeoJSON")
+
+        return self
+
+    async def _from_admin_async(self, admin: str):
+        """Set the object according to the given an administrative code in the GADM/GAUL codes.
+
+        Args:
+            admin: the admin code corresponding to FAO GAUl (if gee) or GADM
+        """
+        if not admin:
+            raise Exception(ms.aoi_sel.exception.no_admlyr)
+
+        # get the data from either the pygaul or the pygadm libs
+        self.feature_collection = pygaul.AdmItems(admin=admin)
+
+        # get properties from the first feature to build the AOI name
+        feature = self.feature_collection.first()
+        properties = await self.gee_interface.get_info_async(
+            feature.toDictionary(feature.propertyNames())
+        )
+
+        # GAUL 2024 has iso3_code directly, fallback to mapping for disputed areas
+        iso = properties.get("iso3_code", "")
+        if not iso or (isinstance(iso, str) and iso.startswith("x")):
+            gaul0_code = str(properties.get("gaul0_code", ""))
+            iso = json.loads(self.MAPPING.read_text()).get(gaul0_code, "UNK")
+
+        # GAUL 2024 uses lowercase column names: gaul0_name, gaul1_name, gaul2_name
+        names = [value for prop, value in properties.items() if "_name" in prop]
+
+        # generate the name from the columns
+        names = [su.normalize_str(name) for name in names]
+        names[0] = iso
+
+        self.name = "_".join(names)
+
+        return self
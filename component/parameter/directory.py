@@ -8,3 +8,7 @@ module_dir.mkdir(exist_ok=True)
 
 result_dir = module_dir / "se.plan"
 result_dir.mkdir(exist_ok=True)
+
+# persistent caches (normalization breakpoints, statistics) shared across sessions
+cache_dir = result_dir / "cache"
+cache_dir.mkdir(exist_ok=True)
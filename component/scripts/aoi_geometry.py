@@ -2,25 +2,114 @@
 
 ``ee.FeatureCollection.geometry()`` aggregates every feature into one geometry,
 which can exceed EE's 2M-edge limit for dense AOIs. These helpers materialise
-only per-feature bounding boxes, so they stay under the cap. Kept dependency-free
-(only ``ee``) so every module can import them at the top level.
+only per-feature bounding boxes, so they stay under the cap. Kept free of widget
+dependencies (only ``ee`` and the on-disk caches) so every module can import
+them at the top level.
 """
 
-from typing import Optional, Union
+import hashlib
+from typing import List, Optional, Sequence, Union
 
 import ee
+from sepal_ui.scripts.gee_interface import GEEInterface
+
+from component import parameter as cp
+from component.scripts.cache import JsonLRUCache
+
+bounds_cache = JsonLRUCache(cp.cache_dir / "aoi_bounds.json", max_entries=1024)
+"""Resolved ``[minx, miny, maxx, maxy]`` of the AOIs, by AOI fingerprint."""
+
+
+def _bbox_graph(aoi: Union[ee.FeatureCollection, ee.Geometry]) -> ee.Geometry:
+    """Server-side bounding box of the per-feature bounding boxes of an AOI."""
+    fc = ee.FeatureCollection(aoi)
+    return fc.map(lambda feat: ee.Feature(feat.geometry().bounds())).geometry().bounds()
 
 
 def _aoi_bbox(aoi: Union[ee.FeatureCollection, ee.Geometry]) -> ee.Geometry:
     """Bounding-box geometry for ``reduceRegion`` that never dissolves the AOI.
 
     ``aoi.geometry()`` unions every feature and can exceed EE's 2M-edge limit on
-    dense AOIs. Take each feature's bbox first; callers clip the image to ``aoi``
-    so only AOI pixels are reduced (the result matches reducing over the exact
-    polygon).
+    dense AOIs. Take each feature's bbox first; callers mask the image to
+    ``aoi`` so only AOI pixels are reduced (the result matches reducing over the
+    exact polygon).
+
+    Once the bounds of the AOI are resolved (see ``aoi_bounds_async``), the box
+    is a constant rectangle instead of a per-feature graph.
+    """
+    bounds = cached_aoi_bounds(aoi)
+
+    if bounds is None:
+        return _bbox_graph(aoi)
+
+    return ee.Geometry.Rectangle(bounds, None, False)
+
+
+def cached_aoi_bounds(
+    aoi: Union[ee.FeatureCollection, ee.Geometry],
+) -> Optional[List[float]]:
+    """Return the extent of an AOI if already resolved, without querying the server."""
+    try:
+        return bounds_cache.get(aoi_fingerprint(aoi))
+    except Exception:
+        return None
+
+
+async def aoi_bounds_async(
+    gee_interface: GEEInterface, aoi: Union[ee.FeatureCollection, ee.Geometry]
+) -> List[float]:
+    """Return the ``[minx, miny, maxx, maxy]`` extent of an AOI.
+
+    The extent is resolved once per AOI and stored on disk, so zooming to an
+    AOI already seen doesn't query the server.
+    """
+    key = aoi_fingerprint(aoi)
+    bounds = bounds_cache.get(key)
+
+    if bounds is None:
+        coords = await gee_interface.get_info_async(
+            _bbox_graph(aoi).coordinates().get(0)
+        )
+        bounds = [coords[0][0], coords[0][1], coords[2][0], coords[2][1]]
+        bounds_cache.set(key, bounds)
+
+    return bounds
+
+
+def ee_fingerprint(ee_object: ee.ComputedObject) -> str:
+    """Stable digest of an Earth Engine object's computation graph.
+
+    The serialized graph only depends on how the object is built (asset ids,
+    filters, parameters, inlined geometries), so the same AOI or image gets the
+    same fingerprint across sessions. Nothing is sent to the server.
+    """
+    return hashlib.sha1(ee_object.serialize().encode()).hexdigest()
+
+
+def aoi_fingerprint(aoi: Union[ee.FeatureCollection, ee.Geometry]) -> str:
+    """Fingerprint identifying an AOI in the persistent caches."""
+    return ee_fingerprint(ee.FeatureCollection(aoi))
+
+
+def aoi_mask(aoi: Union[ee.FeatureCollection, ee.Geometry]) -> ee.Image:
+    """Rasterized mask of an AOI.
+
+    The features are painted in a constant image and the pixels outside them
+    are masked. Unlike ``clip(fc)``, which clips every tile against the vector
+    features, the mask is rasterized at the scale of the request, so reductions
+    over dense AOIs (e.g. admin boundaries of Brazil or Indonesia) stay cheap.
+    Building it is a client-side expression only: the same AOI gives the same
+    graph, deduplicated when the request is serialized.
     """
     fc = ee.FeatureCollection(aoi)
-    return fc.map(lambda feat: ee.Feature(feat.geometry().bounds())).geometry().bounds()
+    return ee.Image(0).byte().paint(fc, 1).selfMask().rename("aoi")
+
+
+def mask_to_aoi(
+    image: ee.Image, aoi: Union[ee.FeatureCollection, ee.Geometry]
+) -> ee.Image:
+    """Mask an image outside of the AOI, a cheaper equivalent of ``clip(aoi)``."""
+    return image.updateMask(aoi_mask(aoi))
 
 
 # Display simplification tolerance (meters). Dense AOIs (millions of vertices)
@@ -43,7 +132,8 @@ def simplify_fc(
     the server first means ``get_info`` only ever transfers a low-vertex outline.
 
     Per-feature simplification (not ``Collection.geometry().simplify``) avoids
-    EE's 2M-edge dissolve limit on dense collections.
+    EE's 2M-edge dissolve limit on dense collections. It also builds the opt-in
+    simplified analysis geometry (see ``resolve_analysis_simplification_async``).
 
     Args:
         aoi: source collection / geometry (kept server-side, never downloaded).
@@ -66,6 +156,101 @@ def simplify_fc(
     return simplified
 
 
+ANALYSIS_MAX_AREA_ERROR = 0.005
+"""Default area error budget of the analysis simplification (fraction of the AOI)."""
+
+ANALYSIS_TOLERANCES = (5000, 2000, 1000, 500, 250, 100, 50)
+"""Candidate tolerances (meters) of the analysis simplification, coarsest first."""
+
+
+ANALYSIS_ERROR_MARGIN = 0.1
+"""Max error of the area measures, as a fraction of the measured tolerance."""
+
+
+def _simplification_error(
+    aoi: Union[ee.FeatureCollection, ee.Geometry], tolerance: float
+) -> ee.Number:
+    """Area error of a simplification tolerance, in m².
+
+    The error of a feature is the area of the symmetric difference between its
+    geometry and the simplified one: the land gained and the land lost by the
+    simplification both count, instead of cancelling out as in the difference
+    of the areas. It is measured with a max error scaled to the tolerance, finer
+    measures don't change the choice. The features are never dissolved.
+    """
+    max_error = tolerance * ANALYSIS_ERROR_MARGIN
+
+    def measure(feat):
+        geom = feat.geometry()
+        simplified = geom.simplify(maxError=tolerance)
+        error = geom.symmetricDifference(simplified, maxError=max_error)
+        return feat.set("error", error.area(maxError=max_error))
+
+    return ee.Number(ee.FeatureCollection(aoi).map(measure).aggregate_sum("error"))
+
+
+def _simplification_choice(
+    aoi: Union[ee.FeatureCollection, ee.Geometry],
+    tolerances: Sequence[float],
+    max_area_error: float,
+) -> ee.List:
+    """``[tolerance, area_error]`` of the coarsest tolerance within the budget.
+
+    The tolerances are chained in ``ee.Algorithms.If``, coarsest first: the
+    server only measures a tolerance when the coarser ones don't fit, and stops
+    at the first one that does. The list is empty if none fits.
+    """
+    fc = ee.FeatureCollection(aoi)
+    max_error = min(tolerances) * ANALYSIS_ERROR_MARGIN
+    area = ee.Number(
+        fc.map(
+            lambda feat: feat.set("area", feat.geometry().area(maxError=max_error))
+        ).aggregate_sum("area")
+    )
+
+    choice = ee.List([])
+    for tolerance in reversed(tolerances):
+        error = _simplification_error(fc, tolerance)
+        area_error = ee.Number(ee.Algorithms.If(area.gt(0), error.divide(area), 0))
+        choice = ee.Algorithms.If(
+            area_error.lte(max_area_error), ee.List([tolerance, area_error]), choice
+        )
+
+    return ee.List(choice)
+
+
+async def resolve_analysis_simplification_async(
+    gee_interface: GEEInterface,
+    aoi: Union[ee.FeatureCollection, ee.Geometry],
+    max_area_error: float = ANALYSIS_MAX_AREA_ERROR,
+    tolerances: Sequence[float] = ANALYSIS_TOLERANCES,
+) -> dict:
+    """Choose the coarsest analysis simplification within an area error budget.
+
+    The candidate tolerances are measured in a single request, against the
+    full-resolution AOI, until one fits the budget.
+
+    Args:
+        gee_interface: the interface used to run the measure.
+        aoi: the full-resolution AOI.
+        max_area_error: the accepted area error, as a fraction of the AOI area.
+        tolerances: the candidate tolerances in meters, coarsest first.
+
+    Returns:
+        The chosen ``tolerance`` (None if no candidate fits the budget, the AOI
+        is then analysed at full resolution) and its measured ``area_error``.
+    """
+    choice = await gee_interface.get_info_async(
+        _simplification_choice(aoi, tolerances, max_area_error)
+    )
+
+    if not choice:
+        return {"tolerance": None, "area_error": 0.0}
+
+    tolerance, area_error = choice
+    return {"tolerance": tolerance, "area_error": area_error}
+
+
 def fc_from_source(source: Optional[dict], feat: dict) -> ee.FeatureCollection:
     """Rebuild the EXACT server-side FeatureCollection for a custom sub-AOI.
 
@@ -1,7 +1,3 @@
-import pandas as pd
-from component import parameter as cp
+from component.scripts.layer_catalog import get_layer_catalog
 
-layers = pd.read_csv(cp.layer_list).fillna("")
-default_asset_id = layers[layers.layer_id == "treecover_with_potential"][
-    "gee_asset"
-].values[0]
+default_asset_id = get_layer_catalog()["treecover_with_potential"].gee_asset
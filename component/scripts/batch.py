@@ -0,0 +1,316 @@
+"""Headless batch runner of se.plan recipes.
+
+Runs the pipeline of the dashboard on every recipe of a folder without the UI:
+validate the recipe, load its models, compute the summary statistics, write
+their CSV and optionally export the restoration index::
+
+    python -m component.scripts.batch recipes/ --output results/ --workers 4
+
+The recipes run in a bounded pool of processes. They share the on-disk caches
+of the AOI bounds, breakpoints and statistics, so a re-run only pays for what
+changed. The state of every recipe is written to ``batch_progress.json`` in the
+output folder as soon as it's done: an interrupted run resumes where it stopped,
+skipping the recipes already done. A summary of the run is written to
+``batch_summary.csv``.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Literal, NamedTuple, Optional
+
+from sepal_ui.scripts import utils as su
+from sepal_ui.scripts.gee_interface import GEEInterface
+
+from component import parameter as cp
+from component.model.recipe import Recipe
+from component.scripts import validation
+from component.scripts.aoi_geometry import _aoi_bbox, mask_to_aoi
+from component.scripts.compute import export_as_csv
+from component.scripts.gee import apply_export_viz, get_gee_recipe_folder_async
+from component.scripts.seplan import prepare_breakpoints_async
+from component.scripts.statistics import get_summary_statistics_async
+from component.scripts.ui_helpers import parse_export_name
+
+logger = logging.getLogger("SEPLAN")
+
+PROGRESS_FILE = "batch_progress.json"
+"""The state of every recipe of a run, in the output folder."""
+
+SUMMARY_FILE = "batch_summary.csv"
+"""The summary report of a run, in the output folder."""
+
+SUMMARY_COLUMNS = ["recipe", "status", "duration", "csv", "export", "error"]
+
+
+class BatchOptions(NamedTuple):
+    """The settings of the run of every recipe."""
+
+    output: Path
+    sanitize: bool = False
+    mode: Literal["auto", "sequential", "collection"] = "auto"
+    exact_scale: bool = False
+    export: Optional[Literal["gee", "gdrive"]] = None
+    export_scale: int = 1000
+
+
+def find_recipes(recipe_dir: Path) -> List[Path]:
+    """List the recipe files of a folder, sorted by name."""
+    return sorted(
+        path for path in Path(recipe_dir).glob("*.json") if path.name != PROGRESS_FILE
+    )
+
+
+def load_progress(output: Path) -> Dict[str, dict]:
+    """Read the state of the recipes of a previous run, by recipe name."""
+    try:
+        return json.loads((Path(output) / PROGRESS_FILE).read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable progress file: {e}")
+        return {}
+
+
+def _save_progress(output: Path, progress: Dict[str, dict]) -> None:
+    """Atomically write the state of the recipes."""
+    path = Path(output) / PROGRESS_FILE
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(progress, indent=2))
+    tmp_path.replace(path)
+
+
+def write_summary(output: Path, progress: Dict[str, dict]) -> Path:
+    """Write the summary report of the recipes of a run."""
+    path = Path(output) / SUMMARY_FILE
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(progress[name] for name in sorted(progress))
+
+    return path
+
+
+async def _export_index_async(
+    gee_interface: GEEInterface, recipe: Recipe, options: BatchOptions
+) -> str:
+    """Export the restoration index of a recipe as the export dialog does.
+
+    Returns:
+        The description of the export task.
+    """
+    aoi = recipe.seplan.aoi_model.feature_collection
+
+    await prepare_breakpoints_async(gee_interface, recipe.seplan)
+    image = mask_to_aoi(recipe.seplan.get_constraint_index(), aoi)
+
+    recipe_name = recipe.get_recipe_name()
+    name = parse_export_name(f"index_constraint_index_{recipe_name}")
+    export_params = {
+        "description": name,
+        "scale": options.export_scale,
+        "region": _aoi_bbox(aoi),
+        "max_pixels": 1e13,
+    }
+
+    if options.export == "gee":
+        folder = await get_gee_recipe_folder_async(recipe_name, gee_interface)
+        export_params.update(asset_id=str(folder / name))
+        image = await apply_export_viz(
+            image, "index", "constraint_index", aoi, gee_interface
+        )
+        await gee_interface.export_image_to_asset_async(image, **export_params)
+    else:
+        await gee_interface.export_image_to_drive_async(image, **export_params)
+
+    return name
+
+
+async def run_recipe_async(recipe_path: Path, options: BatchOptions) -> dict:
+    """Run the pipeline of a recipe.
+
+    Returns:
+        The state of the recipe: ``done``, or ``invalid`` if the recipe has
+        validation errors and isn't sanitized.
+    """
+    gee_interface = GEEInterface()
+    recipe = Recipe(gee_interface=gee_interface)
+
+    result = await recipe.load_async(str(recipe_path))
+    if isinstance(result, validation.ValidationResult):
+        if not options.sanitize:
+            return {
+                "status": "invalid",
+                "error": f"{result.total_errors} validation error(s)",
+            }
+
+        sanitized = validation.sanitize_recipe_data(result.raw_data, result)
+        await recipe.load_sanitized_async(sanitized, result.recipe_path)
+
+    if not recipe.seplan.aoi_model.feature_collection:
+        return {"status": "invalid", "error": "the recipe has no AOI"}
+
+    recipe.dash_model.exact_scale = options.exact_scale
+    stats = await get_summary_statistics_async(gee_interface, recipe, options.mode)
+    record = {
+        "status": "done",
+        "csv": str(export_as_csv(stats, folder=options.output)),
+    }
+
+    if options.export:
+        record["export"] = await _export_index_async(gee_interface, recipe, options)
+
+    return record
+
+
+def run_recipe(recipe_path: Path, options: BatchOptions) -> dict:
+    """Run the pipeline of a recipe in a worker, never raising.
+
+    Returns:
+        The state of the recipe, ``failed`` with the error if it raised.
+    """
+    start = time.monotonic()
+    try:
+        record = asyncio.run(run_recipe_async(recipe_path, options))
+    except Exception as e:
+        logger.exception(f"Recipe {recipe_path.name} failed")
+        record = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "recipe": recipe_path.stem,
+        "duration": round(time.monotonic() - start, 1),
+        **record,
+    }
+
+
+def _init_worker() -> None:
+    """Authenticate Earth Engine once per worker process."""
+    logging.basicConfig(level=logging.INFO, format="%(processName)s %(message)s")
+    su.init_ee()
+
+
+def run_batch(
+    recipe_dir: Path, options: BatchOptions, workers: int = 2, force: bool = False
+) -> Dict[str, dict]:
+    """Run the recipes of a folder, resuming a previous run.
+
+    Args:
+        recipe_dir: the folder of the recipe files.
+        options: the settings of the run of every recipe.
+        workers: the number of recipes run in parallel. They all share the
+            concurrent aggregations allowed to the Earth Engine account.
+        force: run the recipes already done too.
+
+    Returns:
+        The state of every recipe of the run, by recipe name.
+    """
+    Path(options.output).mkdir(parents=True, exist_ok=True)
+
+    progress = load_progress(options.output)
+    recipes = find_recipes(recipe_dir)
+    pending = [
+        path
+        for path in recipes
+        if force or progress.get(path.stem, {}).get("status") != "done"
+    ]
+    logger.info(
+        f"{len(pending)} recipe(s) to run, {len(recipes) - len(pending)} already done"
+    )
+
+    # spawn: the Earth Engine client doesn't survive a fork of its threads
+    with ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as executor:
+        futures = {executor.submit(run_recipe, path, options): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:  # the worker died
+                record = {
+                    "recipe": path.stem,
+                    "status": "failed",
+                    "error": f"{type(e).__name__}: {e}",
+                }
+
+            progress[path.stem] = record
+            _save_progress(options.output, progress)
+            logger.info(
+                f"[{len(progress)}/{len(recipes)}] {path.stem}: {record['status']}"
+            )
+
+    return progress
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the recipes of a folder from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="seplan-batch", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("recipe_dir", type=Path, help="folder of the recipe files")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=cp.result_dir / "batch",
+        help="folder of the CSV files, the progress and the summary",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=2, help="recipes run in parallel"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="run the recipes already done too"
+    )
+    parser.add_argument(
+        "--sanitize",
+        action="store_true",
+        help="drop the invalid layers of a recipe instead of skipping it",
+    )
+    parser.add_argument(
+        "--mode", choices=["auto", "sequential", "collection"], default="auto"
+    )
+    parser.add_argument(
+        "--exact-scale",
+        action="store_true",
+        help="compute every statistic at the 100 m reference scale",
+    )
+    parser.add_argument(
+        "--export",
+        choices=["gee", "gdrive"],
+        help="export the restoration index to an asset or to Google Drive",
+    )
+    parser.add_argument(
+        "--export-scale", type=int, default=1000, help="scale of the export (m)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    options = BatchOptions(
+        output=args.output,
+        sanitize=args.sanitize,
+        mode=args.mode,
+        exact_scale=args.exact_scale,
+        export=args.export,
+        export_scale=args.export_scale,
+    )
+    progress = run_batch(args.recipe_dir, options, args.workers, args.force)
+    summary = write_summary(options.output, progress)
+
+    statuses = [record["status"] for record in progress.values()]
+    counts = ", ".join(f"{statuses.count(s)} {s}" for s in sorted(set(statuses)))
+    logger.info(f"Summary ({counts or 'no recipe'}) written to {summary}")
+
+    return int(any(status != "done" for status in statuses))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Persistent cache of the normalization breakpoints.
+
+``quintiles`` and ``_percentile`` need percentile aggregations over the AOI that
+only depend on the image and the AOI. Once resolved with ``get_info_async`` the
+numbers are stored on disk, keyed by (image, AOI, scale, percentiles), and the
+normalization graphs inline them as constants instead of re-running the
+aggregation on every Compute, Export, Compare or dashboard request.
+"""
+
+import json
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import ee
+
+from component import parameter as cp
+from component.scripts.aoi_geometry import aoi_fingerprint, ee_fingerprint
+from component.scripts.cache import JsonLRUCache
+from component.scripts.concurrency import ESCALATION_LADDER, Escalation
+
+breakpoint_cache = JsonLRUCache(cp.cache_dir / "breakpoints.json", max_entries=2048)
+"""Breakpoints shared by every recipe and session of the module."""
+
+
+def breakpoint_key(
+    image: ee.Image,
+    aoi: Union[ee.FeatureCollection, ee.Geometry],
+    scale: int,
+    percentiles: Sequence[int],
+    escalation: Escalation = Escalation(),
+) -> str:
+    """Build the cache key of the breakpoints of an image over an aoi.
+
+    The image is identified by its computation graph, which is the asset id for
+    plain assets and the full expression for derived images (e.g. the
+    benefit/cost ratio). Breakpoints approximated by their escalation (coarser
+    scale or bestEffort) have keys of their own.
+    """
+    key = [ee_fingerprint(image), aoi_fingerprint(aoi), scale, list(percentiles)]
+    if not escalation.exact:
+        key.append([escalation.scale_factor, escalation.best_effort])
+
+    return json.dumps(key)
+
+
+def get_breakpoints(key: str) -> Optional[List[float]]:
+    """Return the cached breakpoints, None if they were never resolved."""
+    return breakpoint_cache.get(key)
+
+
+def find_breakpoints(
+    key: Callable[[Escalation], str],
+) -> Tuple[Optional[List[float]], Escalation]:
+    """Return the cached breakpoints of a reduction, the exact ones first.
+
+    Args:
+        key: builds the cache key of the breakpoints reduced with an escalation.
+
+    Returns:
+        The breakpoints and the escalation they were reduced with, None if they
+        were never resolved.
+    """
+    approximated = [
+        escalation for escalation in ESCALATION_LADDER if not escalation.exact
+    ]
+    for escalation in [Escalation(), *approximated]:
+        breakpoints = get_breakpoints(key(escalation))
+        if breakpoints is not None:
+            return breakpoints, escalation
+
+    return None, Escalation()
+
+
+def set_breakpoints(values: dict) -> None:
+    """Store resolved breakpoints, skipping the ones that couldn't be computed.
+
+    Args:
+        values: mapping of breakpoint keys to the list of breakpoints in the
+            same order as the percentiles of the key.
+    """
+    breakpoint_cache.update(
+        {
+            key: breakpoints
+            for key, breakpoints in values.items()
+            if breakpoints and all(b is not None for b in breakpoints)
+        }
+    )
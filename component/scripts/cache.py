@@ -0,0 +1,188 @@
+"""Size-bounded, on-disk LRU cache for small JSON payloads.
+
+Used to persist the results of Earth Engine aggregations (normalization
+breakpoints, statistics) across sessions, so reopening an unchanged recipe
+doesn't pay for them again. Entries are stored in recency order in a single
+JSON file that is rewritten atomically on every change.
+
+Several processes can share a cache file (see ``component.scripts.batch``): a
+read or a write holds a lock on the file and first merges the entries the
+other processes wrote since it was read, so they see the entries of each other
+and don't overwrite them.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows, where the processes don't lock the file
+    fcntl = None
+
+logger = logging.getLogger("SEPLAN")
+
+
+class JsonLRUCache:
+    def __init__(self, path: Path, max_entries: int = 1024):
+        """A JSON file backed least-recently-used cache.
+
+        Args:
+            path: the JSON file holding the entries. Created on the first write.
+            max_entries: number of entries kept, the least recently used ones are
+                evicted first.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+
+        self._entries: Optional[OrderedDict] = None
+        self._signature_read: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def _signature(self) -> Optional[tuple]:
+        """The modification time and size of the file, None if it doesn't exist."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> dict:
+        """Read the entries stored on disk."""
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+
+        return {}
+
+    def _load(self) -> OrderedDict:
+        """Read the entries from disk the first time they are needed."""
+        if self._entries is None:
+            self._signature_read = self._signature()
+            self._entries = OrderedDict(self._read())
+
+        return self._entries
+
+    def _refresh(self) -> OrderedDict:
+        """Merge the entries written by other processes since the last read.
+
+        The merged entries are the least recently used ones of this process.
+        """
+        entries = self._load()
+        signature = self._signature()
+        if signature is None or signature == self._signature_read:
+            return entries
+
+        for key, value in reversed(list(self._read().items())):
+            if key not in entries:
+                entries[key] = value
+                entries.move_to_end(key, last=False)
+
+        self._signature_read = signature
+        return entries
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the lock of the cache file shared by the processes."""
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self.path.with_suffix(".lock"), "a")
+        except OSError as e:
+            logger.warning(f"Could not lock cache {self.path}: {e}")
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _dump(self) -> None:
+        """Atomically write the entries to disk."""
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._entries))
+            tmp_path.replace(self.path)
+            self._signature_read = self._signature()
+        except OSError as e:
+            logger.warning(f"Could not persist cache {self.path}: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored for key and mark it as recently used."""
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> dict:
+        """Return the values stored for the keys with a single read of the file.
+
+        The keys missing from the cache are left out.
+        """
+        with self._lock, self._file_lock():
+            entries = self._refresh()
+            values = {}
+            for key in keys:
+                if key in entries:
+                    entries.move_to_end(key)
+                    values[key] = entries[key]
+
+            return values
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value and evict the oldest entries."""
+        self.update({key: value})
+
+    def update(self, values: dict) -> None:
+        """Store several values with a single write to disk."""
+        if not values:
+            return
+
+        with self._lock, self._file_lock():
+            entries = self._refresh()
+            for key, value in values.items():
+                entries[key] = value
+                entries.move_to_end(key)
+
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+            self._dump()
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove key from the cache and return its value."""
+        with self._lock, self._file_lock():
+            entries = self._refresh()
+            if key not in entries:
+                return default
+
+            value = entries.pop(key)
+            self._dump()
+
+            return value
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._file_lock():
+            self._entries = OrderedDict()
+            self._dump()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._load()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
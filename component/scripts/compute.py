@@ -5,17 +5,13 @@ import math
 from datetime import datetime, timezone
 from pathlib import Path
 
-import pandas as pd
-
 import component.parameter.gui_params as param
 from component.message import cm
 from component.parameter.directory import result_dir
-from component.parameter.file_params import layer_list
+from component.scripts.layer_catalog import get_layer_catalog
 from component.scripts.statistics import STATS_SCALE_M
 from component.types import RecipeStatsDict
 
-from sepal_ui.solara import get_current_sepal_client
-
 logger = logging.getLogger("SEPLAN")
 
 AGGREGATION_LABEL = {
@@ -31,6 +27,13 @@ VALUE_KEY = {
     "cost": "sum",
 }
 
+CI_KEY = {
+    "benefit": "mean_ci",
+    "constraint": "percent_ci",
+    "cost": "sum_ci",
+}
+"""The half-width of the confidence interval of the values estimated from points."""
+
 THEME_DISPLAY = {
     "benefit": "Benefit",
     "constraint": "Constraint",
@@ -47,6 +50,7 @@ CSV_COLUMNS = [
     "Unit",
     "Aggregation",
     "Value",
+    "95% CI",
 ]
 
 
@@ -54,20 +58,14 @@ def _layer_label(layer_id: str) -> str:
     """Human-readable name for a layer; falls back to a humanized layer_id."""
     entry = cm.layers.get(layer_id) if hasattr(cm.layers, "get") else None
     if entry is not None:
-        name = getattr(entry, "name", None) or (entry.get("name") if hasattr(entry, "get") else None)
+        name = getattr(entry, "name", None) or (
+            entry.get("name") if hasattr(entry, "get") else None
+        )
         if name:
             return name
     return layer_id.replace("_", " ").capitalize()
 
 
-def _build_unit_lookup() -> dict:
-    df = pd.read_csv(layer_list).fillna("")
-    return dict(zip(df["layer_id"], df["unit"]))
-
-
-_UNIT_LOOKUP = _build_unit_lookup()
-
-
 def _format_value(v) -> str:
     if v is None:
         return ""
@@ -91,7 +89,7 @@ def _humanize_primary_area_name(area_name: str) -> str:
 
 
 def _build_rows(recipe_name: str, area_stats: dict) -> list:
-    unit_for = _UNIT_LOOKUP
+    catalog = get_layer_catalog()
     rows = []
 
     for idx, (area_name, area_data) in enumerate(area_stats.items()):
@@ -112,7 +110,7 @@ def _build_rows(recipe_name: str, area_stats: dict) -> list:
                     unit = (
                         "% of AOI"
                         if category == "constraint"
-                        else unit_for.get(layer_id, "")
+                        else catalog.unit(layer_id)
                     )
                     rows.append(
                         {
@@ -124,9 +122,25 @@ def _build_rows(recipe_name: str, area_stats: dict) -> list:
                             "Unit": unit,
                             "Aggregation": AGGREGATION_LABEL[category],
                             "Value": _format_value(raw_value),
+                            "95% CI": _format_value(
+                                content.get("values", {}).get(CI_KEY[category])
+                            ),
                         }
                     )
 
+                    # area masked by this constraint only, when the constraints
+                    # were reduced together (see get_constraints_cover)
+                    exclusive = content.get("values", {}).get("exclusive")
+                    if category == "constraint" and exclusive is not None:
+                        rows.append(
+                            {
+                                **rows[-1],
+                                "Aggregation": "exclusive coverage",
+                                "Value": _format_value(exclusive),
+                                "95% CI": "",
+                            }
+                        )
+
         suit = area_data.get("suitability") or {}
         for v in suit.get("values", []):
             rows.append(
@@ -139,6 +153,7 @@ def _build_rows(recipe_name: str, area_stats: dict) -> list:
                     "Unit": "ha",
                     "Aggregation": AGGREGATION_LABEL["suitability"],
                     "Value": _format_value(v.get("sum")),
+                    "95% CI": _format_value(v.get("ci")),
                 }
             )
 
@@ -158,6 +173,29 @@ def _build_rows(recipe_name: str, area_stats: dict) -> list:
     return rows
 
 
+def _format_scales(area_stats: dict) -> str:
+    """Report the statistics scale, per area when they differ."""
+    scales = {
+        area_name: (area_data.get("analysis") or {}).get("scale", STATS_SCALE_M)
+        for area_name, area_data in area_stats.items()
+    }
+    if len(set(scales.values())) == 1:
+        return str(next(iter(scales.values())))
+
+    return ", ".join(f"{scale} ({area_name})" for area_name, scale in scales.items())
+
+
+def _format_escalation(escalation: dict) -> str:
+    """Describe the settings of an escalated reduction."""
+    settings = [f"tileScale {escalation.get('tile_scale', 1)}"]
+    if escalation.get("scale_factor", 1) > 1:
+        settings.append(f"scale x{escalation['scale_factor']}")
+    if escalation.get("best_effort"):
+        settings.append("bestEffort")
+
+    return ", ".join(settings)
+
+
 def _build_metadata(recipe_name: str, area_stats: dict) -> list:
     area_keys = list(area_stats.keys())
     primary_name = area_keys[0]
@@ -170,22 +208,64 @@ def _build_metadata(recipe_name: str, area_stats: dict) -> list:
     ]
     if sub_regions:
         lines.append("# Sub-regions: " + ", ".join(sub_regions))
-    lines.append(f"# Scale (m): {STATS_SCALE_M}")
+    lines.append(f"# Scale (m): {_format_scales(area_stats)}")
+
+    simplified = []
+    for area_name, area_data in area_stats.items():
+        analysis = area_data.get("analysis") or {}
+        if analysis.get("simplify_tolerance"):
+            simplified.append(
+                f"{area_name} ({analysis['simplify_tolerance']} m tolerance, "
+                f"{analysis['area_error']:.2%} area error)"
+            )
+    if simplified:
+        lines.append("# Simplified geometry: " + "; ".join(simplified))
+
+    estimated = [
+        f"{area_name} ({estimate['points']} points, "
+        f"{estimate['confidence']:.0%} confidence)"
+        for area_name, area_data in area_stats.items()
+        if (estimate := (area_data.get("analysis") or {}).get("estimate"))
+    ]
+    if estimated:
+        lines.append("# Estimated from sample points: " + "; ".join(estimated))
+
+    escalated = [
+        f"{area_name} {cell} ({_format_escalation(escalation)})"
+        for area_name, area_data in area_stats.items()
+        for cell, escalation in (
+            (area_data.get("analysis") or {}).get("escalations") or {}
+        ).items()
+    ]
+    if escalated:
+        lines.append("# Escalated reductions: " + "; ".join(escalated))
+
     lines.append(f"# Areas: {len(area_keys)}")
     return lines
 
 
-def export_as_csv(recipe_summary_stats: RecipeStatsDict):
+def export_as_csv(recipe_summary_stats: RecipeStatsDict, folder: Path = None):
     """Write the dashboard summary statistics to a real CSV file.
 
     Output layout: a metadata block of `# key: value` comment lines, followed
     by a tabular section with the columns in `CSV_COLUMNS`. Read back with
     `pd.read_csv(path, comment='#')`.
+
+    Args:
+        recipe_summary_stats: the statistics of the recipe.
+        folder: a local folder to write the file in, instead of the results
+            folder of the session.
     """
     recipe_name, area_stats = next(iter(recipe_summary_stats.items()))
 
-    sepal_session = get_current_sepal_client()
-    if sepal_session:
+    # the Solara session only exists in the app, not in the batch workers
+    from sepal_ui.solara import get_current_sepal_client
+
+    sepal_session = None if folder else get_current_sepal_client()
+    if folder:
+        csv_folder = Path(folder)
+        csv_folder.mkdir(parents=True, exist_ok=True)
+    elif sepal_session:
         csv_folder = sepal_session.get_remote_dir("module_results/se.plan/csv_results")
     else:
         csv_folder = result_dir / "results"
@@ -0,0 +1,212 @@
+"""Adaptive concurrency for the Earth Engine requests.
+
+Earth Engine limits the number of concurrent aggregations of an account and
+answers 429 / RESOURCE_EXHAUSTED beyond it. The limiter grows the number of
+requests in flight while they succeed and halves it on a rate-limit error
+(additive increase, multiplicative decrease), so large jobs run at the highest
+concurrency the account tolerates. Only the rejected request is retried, after a
+jittered exponential backoff.
+
+A reduction running out of memory or pixels is retried on its own too, with
+escalated settings (see ``run_escalated``).
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, NamedTuple, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger("SEPLAN")
+
+T = TypeVar("T")
+
+RATE_LIMIT_MARKERS = ("429", "resource_exhausted", "concurrent aggregation")
+"""Lower-case fragments of the error messages of a rate-limited request."""
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Tell if an error is Earth Engine rejecting a request for rate limits."""
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 8,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        """AIMD limiter of the number of concurrent requests.
+
+        Args:
+            initial: the number of concurrent requests to start with.
+            minimum: the floor of the concurrency when backing off.
+            maximum: the ceiling of the concurrency when growing.
+            max_retries: the number of retries of a rate-limited request before
+                its error is raised.
+            base_delay: the backoff of the first retry in seconds, doubled at
+                each retry.
+            max_delay: the cap of the backoff in seconds.
+        """
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit = float(min(max(initial, minimum), self.maximum))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self.limit)
+
+    async def _acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+
+    async def _release(self, succeeded: bool, rate_limited: bool = False) -> None:
+        """Free the slot of a request, adapting the limit to its outcome.
+
+        The slot is freed before any await, so a release cancelled again still
+        frees it. Failed and cancelled requests don't grow the limit.
+        """
+        self._active -= 1
+        if rate_limited:
+            self.limit = max(float(self.minimum), self.limit / 2)
+        elif succeeded:
+            # +1 request in flight per window of successful requests
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+
+        await asyncio.shield(self._notify())
+
+    async def _notify(self) -> None:
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff of a retry."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Run a request within the limits, retrying it when rate-limited.
+
+        Args:
+            request: a factory of the request coroutine, called for every try.
+
+        Returns:
+            The result of the request.
+
+        Raises:
+            The error of the request if it is not a rate-limit error or if the
+            retries are exhausted.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._acquire()
+            succeeded = rate_limited = False
+            try:
+                result = await request()
+                succeeded = True
+                return result
+            except Exception as e:
+                rate_limited = is_rate_limit_error(e)
+                if not rate_limited or attempt == self.max_retries:
+                    raise
+                error = e
+            finally:
+                # also when the request is cancelled
+                await self._release(succeeded, rate_limited)
+
+            delay = self._backoff(attempt)
+            logger.warning(
+                f"Rate limited by Earth Engine, retrying in {delay:.1f}s with "
+                f"{self.concurrency} concurrent request(s): {error}"
+            )
+            await asyncio.sleep(delay)
+
+
+RESOURCE_ERROR_MARKERS = ("user memory limit exceeded", "too many pixels")
+"""Lower-case fragments of the error messages of a reduction out of resources."""
+
+
+def is_resource_error(error: BaseException) -> bool:
+    """Tell if an error is Earth Engine running out of memory or pixels."""
+    message = str(error).lower()
+    return any(marker in message for marker in RESOURCE_ERROR_MARKERS)
+
+
+class Escalation(NamedTuple):
+    """The settings of a reduction on a rung of the escalation ladder."""
+
+    tile_scale: int = 1
+    scale_factor: int = 1
+    best_effort: bool = False
+
+    @property
+    def exact(self) -> bool:
+        """If the reduction gives the same result as without escalation."""
+        return self.scale_factor == 1 and not self.best_effort
+
+    def reduce_kwargs(self, scale: float, tile_scale: int = 1) -> dict:
+        """The ``reduceRegion`` arguments of a reduction.
+
+        Args:
+            scale: the scale of the reduction without escalation.
+            tile_scale: the tileScale of the reduction without escalation.
+        """
+        kwargs = {"scale": scale * self.scale_factor}
+        if max(tile_scale, self.tile_scale) > 1:
+            kwargs["tileScale"] = max(tile_scale, self.tile_scale)
+        if self.best_effort:
+            kwargs["bestEffort"] = True
+
+        return kwargs
+
+
+ESCALATION_LADDER = (
+    Escalation(),
+    Escalation(tile_scale=4),
+    Escalation(tile_scale=16),
+    Escalation(tile_scale=16, scale_factor=4),
+    Escalation(tile_scale=16, scale_factor=4, best_effort=True),
+)
+"""The settings a reduction is retried with, in order: more tiles first, then
+a coarser scale, then ``bestEffort``."""
+
+
+async def run_escalated(
+    request: Callable[[Escalation], Awaitable[T]],
+    ladder: Sequence[Escalation] = ESCALATION_LADDER,
+) -> Tuple[T, Escalation]:
+    """Run a reduction, escalating its settings when it runs out of resources.
+
+    Args:
+        request: a factory of the request coroutine, called with the settings
+            of every try.
+        ladder: the settings of the tries, in order.
+
+    Returns:
+        The result of the request and the settings it succeeded with.
+
+    Raises:
+        The error of the request if it is not a resource error or if the last
+        rung of the ladder fails too.
+    """
+    for rung, escalation in enumerate(ladder):
+        try:
+            return await request(escalation), escalation
+        except Exception as e:
+            if not is_resource_error(e) or rung == len(ladder) - 1:
+                raise
+
+            logger.warning(
+                f"Earth Engine ran out of resources, retrying with "
+                f"{ladder[rung + 1]}: {e}"
+            )
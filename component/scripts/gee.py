@@ -1,19 +1,20 @@
 import logging
 from pathlib import Path
-from typing import List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Literal, Optional, Tuple, Union
 
 import ee
-from ipyleaflet import TileLayer
-from sepal_ui import mapping as sm
-from sepal_ui.mapping.visualization import set_viz_params
-from sepal_ui.scripts.gee import get_ee_project
 from sepal_ui.scripts.gee_interface import GEEInterface
 
 from component import parameter as cp
 from component.message import cm
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import _aoi_bbox, mask_to_aoi
 from component.scripts.assets import default_asset_id
 
+# the map widgets are only needed to display layers, not to compute or export
+if TYPE_CHECKING:
+    from ipyleaflet import TileLayer
+    from sepal_ui.mapping.layer import EELayer
+
 logger = logging.getLogger("SEPLAN")
 
 
@@ -30,6 +31,8 @@ def get_ee_project_id(gee_interface: GEEInterface) -> str:
     Returns:
         The Cloud project id (e.g. ``ee-indonesia-gwl``).
     """
+    from sepal_ui.scripts.gee import get_ee_project
+
     session = getattr(gee_interface, "session", None)
     project_id = getattr(session, "project_id", None)
 
@@ -52,9 +55,9 @@ async def get_layer_min_max(
     Returns:
         A ``(min, max)`` tuple rounded to two decimals.
     """
-    # Clip to the AOI + reduce over its bbox; reducing over aoi.geometry()
+    # Mask to the AOI + reduce over its bbox; reducing over aoi.geometry()
     # would dissolve the collection and can exceed EE's 2M-edge limit.
-    clipped = image.clip(aoi)
+    clipped = mask_to_aoi(image, aoi)
     reduced = clipped.reduceRegion(
         reducer=ee.Reducer.minMax(),
         geometry=_aoi_bbox(aoi),
@@ -187,12 +190,18 @@ async def apply_export_viz(
     except Exception:
         logger.debug("band name resolution failed; exporting without bands")
 
+    from sepal_ui.mapping.visualization import set_viz_params
+
     viz_params = get_export_viz_params(theme, id_, min_max, bands)
 
     return set_viz_params(image, **viz_params)
 
 
-def create_layer(map_id_dict: dict, name: str = "", visible: bool = True) -> TileLayer:
+def create_layer(
+    map_id_dict: dict, name: str = "", visible: bool = True
+) -> "TileLayer":
+    from ipyleaflet import TileLayer
+
     return TileLayer(
         url=map_id_dict["tile_fetcher"].url_format,
         attribution="Google Earth Engine",
@@ -207,11 +216,12 @@ def get_layer(
     vis_params: dict = {},
     name: str = "",
     visible: bool = True,
-) -> sm.layer.EELayer:
+) -> "EELayer":
+    from sepal_ui.mapping.layer import EELayer
 
     map_id_dict = gee_interface.get_map_id(image, vis_params)
 
-    return sm.layer.EELayer(
+    return EELayer(
         ee_object=image,
         url=map_id_dict["tile_fetcher"].url_format,
         attribution="Google Earth Engine",
@@ -276,12 +286,12 @@ async def get_limits_async(
     # If scale is less than 30, set it to 30
     scale = ee.Algorithms.If(scale.lt(30), 30, scale)
 
-    # Clip to the AOI + reduce over its bbox to avoid dissolving the collection.
+    # Mask to the AOI + reduce over its bbox to avoid dissolving the collection.
     # Only continuous range sliders tolerate coarsening (bestEffort + a capped
     # maxPixels speeds up big AOIs); binary/categorical value discovery stays
     # exact so rare values present in the AOI aren't dropped from the choices.
     coarsen = data_type == "continuous"
-    reduction = ee_image.clip(aoi).reduceRegion(
+    reduction = mask_to_aoi(ee_image, aoi).reduceRegion(
         reducer=reducer,
         geometry=_aoi_bbox(aoi),
         scale=scale,
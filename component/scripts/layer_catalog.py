@@ -0,0 +1,124 @@
+"""Catalog of the default layers of se.plan.
+
+``utils/layer_list.csv`` and the legends of ``utils/known_legends.json`` are
+parsed once per process, the first time they are needed, and shared read-only
+by every session, model and widget.
+"""
+
+import csv
+import json
+import logging
+from functools import lru_cache
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+from component.parameter.file_params import layer_list, legends_path
+
+logger = logging.getLogger("SEPLAN")
+
+
+class LayerInfo(NamedTuple):
+    """A row of the layer list."""
+
+    layer_id: str
+    theme: str
+    subtheme: str
+    gee_asset: str
+    unit: str
+    data_type: str
+
+
+class LayerCatalog:
+    def __init__(self, layers: Sequence[LayerInfo], legends: Dict[str, dict]):
+        """Read-only lookups of the default layers.
+
+        Args:
+            layers: the layers, in the order of the layer list.
+            legends: the known legend of the categorical assets, by asset id.
+        """
+        self.layers: Tuple[LayerInfo, ...] = tuple(layers)
+        self.legends = legends
+
+        self._by_id = {layer.layer_id: layer for layer in self.layers}
+        self._by_asset = {layer.gee_asset: layer for layer in self.layers}
+        by_theme: Dict[str, list] = {}
+        for layer in self.layers:
+            by_theme.setdefault(layer.theme, []).append(layer)
+        self._by_theme = {theme: tuple(group) for theme, group in by_theme.items()}
+
+    def __iter__(self) -> Iterator[LayerInfo]:
+        return iter(self.layers)
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    def __contains__(self, layer_id: str) -> bool:
+        return layer_id in self._by_id
+
+    def __getitem__(self, layer_id: str) -> LayerInfo:
+        return self._by_id[layer_id]
+
+    @property
+    def ids(self) -> Tuple[str, ...]:
+        """The ids of all the layers."""
+        return tuple(self._by_id)
+
+    def get(self, layer_id: str, theme: Optional[str] = None) -> Optional[LayerInfo]:
+        """The layer of an id, None if it's not a default layer (of the theme)."""
+        return self._filter(self._by_id.get(layer_id), theme)
+
+    def by_asset(self, asset: str, theme: Optional[str] = None) -> Optional[LayerInfo]:
+        """The layer of an asset, None if it's not a default layer (of the theme)."""
+        return self._filter(self._by_asset.get(asset), theme)
+
+    def by_theme(
+        self, theme: str, subtheme: Optional[str] = None
+    ) -> Tuple[LayerInfo, ...]:
+        """The layers of a theme (and subtheme), in the order of the layer list."""
+        layers = self._by_theme.get(theme, ())
+        if subtheme is None:
+            return layers
+
+        return tuple(layer for layer in layers if layer.subtheme == subtheme)
+
+    @staticmethod
+    def _filter(
+        layer: Optional[LayerInfo], theme: Optional[str]
+    ) -> Optional[LayerInfo]:
+        if layer is None or theme not in (None, layer.theme):
+            return None
+
+        return layer
+
+    def subthemes(self, theme: str) -> Tuple[str, ...]:
+        """The distinct subthemes of a theme, in their order of appearance."""
+        subthemes = (layer.subtheme for layer in self.by_theme(theme))
+        return tuple(dict.fromkeys(s for s in subthemes if s))
+
+    def unit(self, layer_id: str) -> str:
+        """The unit of a layer, empty if it's not a default layer."""
+        layer = self.get(layer_id)
+        return layer.unit if layer else ""
+
+    def legend(self, asset: str) -> Optional[Dict[str, str]]:
+        """The labels of the pixel values of an asset, None if it has none."""
+        return self.legends.get(asset, {}).get("legend")
+
+
+def _read_legends() -> Dict[str, dict]:
+    try:
+        return json.loads(legends_path.read_text())
+    except (OSError, ValueError) as e:
+        logger.debug(f"No known legends: {e}")
+        return {}
+
+
+@lru_cache(maxsize=1)
+def get_layer_catalog() -> LayerCatalog:
+    """Return the catalog of the default layers, parsed on the first call."""
+    with layer_list.open(newline="") as f:
+        layers = [
+            LayerInfo(**{field: row[field] or "" for field in LayerInfo._fields})
+            for row in csv.DictReader(f)
+        ]
+
+    return LayerCatalog(layers, _read_legends())
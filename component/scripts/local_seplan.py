@@ -0,0 +1,474 @@
+"""Offline evaluation of the seplan index on local rasters.
+
+Mirrors :class:`component.scripts.seplan.Seplan` with NumPy instead of Earth
+Engine: quintile normalization of the benefits, theme-grouped weighted average,
+benefit/cost ratio, 3/97 percentile stretch and constraint masking. Every raster
+is read by windowed blocks aligned on a reference grid, so memory stays bounded
+whatever the size of the rasters. Percentiles are computed from fixed-size
+histograms accumulated over the blocks (the same approach as EE's percentile
+reducer), in two passes: one for the range and one for the counts.
+
+The layers are read from local GeoTIFFs given as an ``{asset_id: path}`` mapping,
+so the same models (or a loaded recipe) drive both engines.
+"""
+
+import logging
+from contextlib import ExitStack
+from os import PathLike
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import rasterio as rio
+from rasterio import features
+from rasterio.enums import Resampling
+from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
+from rasterio.windows import transform as window_transform
+
+from component.scripts.validation import validate_constraint_model_data
+
+logger = logging.getLogger("SEPLAN")
+
+HISTOGRAM_BINS = 2**16
+"""Number of bins of the histograms used to compute the percentiles."""
+
+QUINTILE_PERCENTILES = [20, 40, 60, 80]
+STRETCH_PERCENTILES = [3, 97]
+
+
+class _Histogram:
+    def __init__(self, bins: int = HISTOGRAM_BINS):
+        """Two-pass percentile accumulator over blocks of values.
+
+        The first pass (:meth:`add_range`) finds the range of the values, the
+        second one (:meth:`add_counts`) counts them in fixed-size bins.
+        """
+        self.bins = bins
+        self.min = np.inf
+        self.max = -np.inf
+        self.counts = np.zeros(bins, dtype="int64")
+
+    def add_range(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+
+    def add_counts(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if values.size and np.isfinite(self.min):
+            counts, _ = np.histogram(values, bins=self.bins, range=self._range())
+            self.counts += counts
+
+    def _range(self) -> Tuple[float, float]:
+        # np.histogram needs a non empty range
+        return self.min, self.max if self.max > self.min else self.min + 1
+
+    def percentiles(self, percentiles: Sequence[int]) -> List[Optional[float]]:
+        """Nearest-rank percentiles, as the upper edge of the matching bin.
+
+        Using the upper edge keeps ``value <= breakpoint`` true for every value
+        of the bin, so classes match the exact percentiles as long as distinct
+        values are further apart than a bin.
+        """
+        total = self.counts.sum()
+        if not total:
+            return [None for _ in percentiles]
+
+        low, high = self._range()
+        edges = np.linspace(low, high, self.bins + 1)
+        cumulative = np.cumsum(self.counts)
+
+        result = []
+        for p in percentiles:
+            rank = max(int(np.ceil(p / 100 * total)), 1)
+            idx = int(np.searchsorted(cumulative, rank))
+            result.append(float(min(edges[idx + 1], self.max)))
+
+        return result
+
+
+def apply_quintiles(values: np.ndarray, breakpoints: Sequence[float]) -> np.ndarray:
+    """Classify values in 5 classes, NaN where the EE version is masked."""
+    low, lowmed, highmed, high = breakpoints
+
+    classes = np.zeros(values.shape, dtype="float64")
+    with np.errstate(invalid="ignore"):
+        classes[(values > 0) & (values <= low)] = 1
+        classes[(values > low) & (values <= lowmed)] = 2
+        classes[(values > lowmed) & (values <= highmed)] = 3
+        classes[(values > highmed) & (values <= high)] = 4
+        classes[values > high] = 5
+
+    classes[classes == 0] = np.nan
+
+    return classes
+
+
+def weighted_average(
+    themes: List[str], images: List[np.ndarray], weights: List[float]
+) -> np.ndarray:
+    """NumPy mirror of :func:`component.scripts.seplan.get_weighted_average`.
+
+    NaN propagates like EE masks: a pixel masked in any image is masked in the
+    result.
+    """
+    theme_images = {}
+    for theme, image, weight in zip(themes, images, weights):
+        theme_image = theme_images.setdefault(theme, {"image": 0, "weight": 0, "nb": 0})
+        theme_image["image"] = theme_image["image"] + image
+        theme_image["weight"] += weight
+        theme_image["nb"] += 1
+
+    for v in theme_images.values():
+        v["image"] = v["image"] / v["nb"]
+        v["weight"] = round(v["weight"] / v["nb"], 5)
+
+    total_weight = sum(v["weight"] for v in theme_images.values())
+
+    weighted_image = 0
+    for v in theme_images.values():
+        weighted_image = weighted_image + v["image"] * (v["weight"] / total_weight)
+
+    return weighted_image
+
+
+def constraint_kept(
+    values: np.ndarray,
+    data_type: str,
+    maskout_values: list,
+) -> np.ndarray:
+    """NumPy mirror of :func:`component.scripts.seplan.mask_image`.
+
+    Args:
+        values: the constraint values, NaN where the raster has no data.
+        data_type: the constraint data type.
+        maskout_values: the values set by the user for this constraint.
+
+    Returns:
+        A boolean array, True where the pixel is kept by the constraint.
+    """
+    # mask_image unmasks the raster with 0 before comparing
+    values = np.nan_to_num(values, nan=0)
+
+    if data_type == "binary":
+        return values != maskout_values[0]
+
+    elif data_type == "categorical":
+        return ~np.isin(values, maskout_values)
+
+    elif data_type == "continuous":
+        min_, max_ = maskout_values
+        return ~((values > min_) & (values < max_))
+
+    raise ValueError(f"Unknown constraint data type: {data_type}")
+
+
+class LocalSeplan:
+    def __init__(
+        self,
+        benefit_model,
+        constraint_model,
+        cost_model,
+        asset_paths: Dict[str, Union[str, PathLike]],
+        aoi: Union[str, PathLike, Iterable, None] = None,
+        reference: Union[str, PathLike, None] = None,
+        block_size: int = 1024,
+    ):
+        """Evaluate the seplan index of the models on local rasters.
+
+        Args:
+            benefit_model: the benefit model (or any object with the same fields).
+            constraint_model: the constraint model.
+            cost_model: the cost model.
+            asset_paths: the local GeoTIFF of every asset used by the models.
+            aoi: the area of interest, either a vector file or GeoJSON-like
+                geometries in the reference CRS. Defaults to the whole grid.
+            reference: the raster defining the output grid. Defaults to the first
+                benefit raster. Rasters on another grid are warped on the fly.
+            block_size: the side of the square blocks read at once, in pixels.
+        """
+        self.benefit_model = benefit_model
+        self.constraint_model = constraint_model
+        self.cost_model = cost_model
+        self.asset_paths = {k: Path(v) for k, v in asset_paths.items()}
+        self.block_size = block_size
+
+        missing = [asset for asset in self._assets() if asset not in self.asset_paths]
+        if missing:
+            raise ValueError(f"No local raster for the assets: {', '.join(missing)}")
+
+        reference = reference or self.asset_paths[self.benefit_model.assets[0]]
+        with rio.open(reference) as src:
+            self.profile = src.profile.copy()
+
+        self.aoi = self.read_geometries(aoi)
+
+        self._quintiles: Optional[List[List[float]]] = None
+        self._stretch: Optional[List[float]] = None
+
+    @classmethod
+    def from_seplan(cls, seplan, asset_paths, aoi=None, **kwargs) -> "LocalSeplan":
+        """Build the local engine from the models of an Earth Engine seplan."""
+        return cls(
+            seplan.benefit_model,
+            seplan.constraint_model,
+            seplan.cost_model,
+            asset_paths,
+            aoi=aoi,
+            **kwargs,
+        )
+
+    def _assets(self) -> List[str]:
+        return [
+            *self.benefit_model.assets,
+            *self.cost_model.assets,
+            *self.constraint_model.assets,
+        ]
+
+    def read_geometries(self, aoi) -> Optional[List[dict]]:
+        """Return the geometries of a vector file or GeoJSON-like objects.
+
+        Vector files are reprojected in the reference CRS, other geometries are
+        expected to already be in it.
+        """
+        if aoi is None:
+            return None
+
+        if isinstance(aoi, (str, PathLike)):
+            import geopandas as gpd
+
+            gdf = gpd.read_file(aoi).to_crs(self.profile["crs"])
+            return [geom.__geo_interface__ for geom in gdf.geometry]
+
+        return [getattr(geom, "__geo_interface__", geom) for geom in aoi]
+
+    def _windows(self) -> Iterator[Window]:
+        height, width = self.profile["height"], self.profile["width"]
+        for row in range(0, height, self.block_size):
+            for col in range(0, width, self.block_size):
+                yield Window(
+                    col,
+                    row,
+                    min(self.block_size, width - col),
+                    min(self.block_size, height - row),
+                )
+
+    def _open(self, stack: ExitStack) -> Dict[str, rio.DatasetReader]:
+        """Open every raster, warped on the reference grid when needed."""
+        sources = {}
+        for asset in set(self._assets()):
+            src = stack.enter_context(rio.open(self.asset_paths[asset]))
+            aligned = (
+                src.crs == self.profile["crs"]
+                and src.transform == self.profile["transform"]
+                and src.shape == (self.profile["height"], self.profile["width"])
+            )
+            if not aligned:
+                src = stack.enter_context(
+                    WarpedVRT(
+                        src,
+                        crs=self.profile["crs"],
+                        transform=self.profile["transform"],
+                        width=self.profile["width"],
+                        height=self.profile["height"],
+                        resampling=Resampling.nearest,
+                    )
+                )
+            sources[asset] = src
+
+        return sources
+
+    def _read(self, src, window: Window) -> np.ndarray:
+        """Read the first band of a block as float, NaN where there is no data."""
+        return src.read(1, window=window, masked=True).astype("float64").filled(np.nan)
+
+    def _aoi_mask(self, window: Window) -> np.ndarray:
+        """True inside the AOI."""
+        shape = (int(window.height), int(window.width))
+        if self.aoi is None:
+            return np.ones(shape, dtype=bool)
+
+        return features.geometry_mask(
+            self.aoi,
+            out_shape=shape,
+            transform=window_transform(window, self.profile["transform"]),
+            invert=True,
+        )
+
+    def _benefit_blocks(
+        self, sources: dict
+    ) -> Iterator[Tuple[Window, np.ndarray, List[np.ndarray]]]:
+        """Yield the AOI mask and the raw benefits of every block."""
+        for window in self._windows():
+            aoi = self._aoi_mask(window)
+            benefits = []
+            for asset in self.benefit_model.assets:
+                values = self._read(sources[asset], window)
+                values[~aoi] = np.nan
+                benefits.append(values)
+
+            yield window, aoi, benefits
+
+    def resolve_breakpoints(self) -> None:
+        """Compute the quintile and the percentile stretch breakpoints.
+
+        Needs four passes over the rasters; the results are kept on the
+        instance so the blocks can then be evaluated in a single pass.
+        """
+        nb = len(self.benefit_model.assets)
+
+        with ExitStack() as stack:
+            sources = self._open(stack)
+
+            # all the benefits are normalized from the same passes
+            histograms = [_Histogram() for _ in range(nb)]
+            for add in ("add_range", "add_counts"):
+                for _, _, benefits in self._benefit_blocks(sources):
+                    for histogram, values in zip(histograms, benefits):
+                        getattr(histogram, add)(values)
+
+            self._quintiles = [h.percentiles(QUINTILE_PERCENTILES) for h in histograms]
+            for asset, breakpoints in zip(self.benefit_model.assets, self._quintiles):
+                if None in breakpoints:
+                    raise ValueError(f"The benefit {asset} has no data in the AOI")
+
+            histogram = _Histogram()
+            for add in ("add_range", "add_counts"):
+                for window, aoi, benefits in self._benefit_blocks(sources):
+                    ratio = self._ratio(sources, window, benefits)
+                    ratio[~aoi] = np.nan
+                    getattr(histogram, add)(ratio)
+
+            self._stretch = histogram.percentiles(STRETCH_PERCENTILES)
+
+    def _ratio(
+        self, sources: dict, window: Window, benefits: List[np.ndarray]
+    ) -> np.ndarray:
+        """Build the raw benefit/cost ratio of a block."""
+        normalized = [
+            apply_quintiles(values, breakpoints)
+            for values, breakpoints in zip(benefits, self._quintiles)
+        ]
+        benefit_index = weighted_average(
+            self.benefit_model.themes, normalized, self.benefit_model.weights
+        )
+
+        cost = np.zeros(benefits[0].shape)
+        for asset in self.cost_model.assets:
+            cost = cost + self._read(sources[asset], window)
+
+        # EE's divide returns 0 on a division by 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(cost == 0, 0, benefit_index / cost)
+
+        # keep the masks of both operands
+        ratio[np.isnan(benefit_index) | np.isnan(cost)] = np.nan
+
+        return ratio
+
+    def iter_blocks(self) -> Iterator[Tuple[Window, Dict[str, np.ndarray]]]:
+        """Evaluate the whole pipeline block by block.
+
+        Yields:
+            The window of the block and its layers: ``aoi`` (bool),
+            ``benefit_index``, ``benefit_cost_index``, ``constraint_index``, the
+            raw ``benefits`` and ``costs`` (lists in model order) and the
+            ``constraints`` kept masks (list of bool arrays in model order).
+            Masked pixels are NaN.
+        """
+        is_valid, errors = validate_constraint_model_data(
+            self.constraint_model.names,
+            self.constraint_model.ids,
+            self.constraint_model.values,
+            self.constraint_model.data_type,
+        )
+        if not is_valid:
+            raise ValueError(
+                "Cannot calculate constraint index due to invalid constraints:\n"
+                + "\n".join(errors)
+            )
+
+        if self._quintiles is None or self._stretch is None:
+            self.resolve_breakpoints()
+
+        low, high = self._stretch
+        high = high + 0.1e-13
+
+        with ExitStack() as stack:
+            sources = self._open(stack)
+
+            for window, aoi, benefits in self._benefit_blocks(sources):
+                normalized = [
+                    apply_quintiles(values, breakpoints)
+                    for values, breakpoints in zip(benefits, self._quintiles)
+                ]
+                benefit_index = weighted_average(
+                    self.benefit_model.themes, normalized, self.benefit_model.weights
+                )
+
+                ratio = self._ratio(sources, window, benefits)
+                benefit_cost_index = np.clip((ratio - low) / (high - low), 0, 1)
+
+                costs = [
+                    self._read(sources[asset], window)
+                    for asset in self.cost_model.assets
+                ]
+                constraints = [
+                    constraint_kept(self._read(sources[asset], window), type_, values)
+                    for asset, type_, values in zip(
+                        self.constraint_model.assets,
+                        self.constraint_model.data_type,
+                        self.constraint_model.values,
+                    )
+                ]
+
+                kept = np.logical_and.reduce(constraints) if constraints else aoi
+                constraint_index = benefit_cost_index * 4 + 1
+                constraint_index[~kept] = np.nan
+
+                for layer in (benefit_index, benefit_cost_index, constraint_index):
+                    layer[~aoi] = np.nan
+
+                yield window, {
+                    "aoi": aoi,
+                    "benefit_index": benefit_index,
+                    "benefit_cost_index": benefit_cost_index,
+                    "constraint_index": constraint_index,
+                    "benefits": benefits,
+                    "costs": costs,
+                    "constraints": constraints,
+                }
+
+    def export(
+        self,
+        path: Union[str, PathLike],
+        layers: Sequence[str] = ("constraint_index",),
+    ) -> Path:
+        """Write index layers as the bands of a float32 GeoTIFF.
+
+        Args:
+            path: the output file.
+            layers: the index layers to write, among ``benefit_index``,
+                ``benefit_cost_index`` and ``constraint_index``.
+        """
+        profile = self.profile.copy()
+        profile.update(
+            driver="GTiff",
+            count=len(layers),
+            dtype="float32",
+            nodata=np.nan,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            compress="deflate",
+        )
+
+        with rio.open(path, "w", **profile) as dst:
+            dst.descriptions = tuple(layers)
+            for window, block in self.iter_blocks():
+                for band, layer in enumerate(layers, 1):
+                    dst.write(block[layer].astype("float32"), band, window=window)
+
+        return Path(path)
@@ -0,0 +1,236 @@
+"""Zonal statistics of a :class:`LocalSeplan` computed with ``np.bincount``.
+
+Produces the same :data:`RecipeStatsDict` as
+:func:`component.scripts.statistics.get_summary_statistics_async`, so
+``export_as_csv`` and the plots consume it unchanged. The primary AOI and the
+sub-AOIs are rasterized into zone-id grids (overlapping AOIs go to separate
+grids) and every statistic of every zone is accumulated in one vectorized pass
+over the blocks of the index.
+
+The aggregations mirror the Earth Engine ones: suitability and constraint
+coverage are pixel-area sums (in ha), benefits are pixel means within the
+constraint mask (min/max only for the primary AOI) and costs are area-weighted
+sums divided by the AOI area.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+from rasterio import features
+from rasterio.windows import Window
+from rasterio.windows import transform as window_transform
+
+from component.scripts.local_seplan import LocalSeplan
+from component.types import RecipeStatsDict
+
+EARTH_RADIUS_M = 6371008.8
+"""Mean earth radius used to compute the area of geographic pixels."""
+
+NB_CLASSES = 7
+"""Suitability classes 1 to 5, 6 for the masked land (0 is unused)."""
+
+
+def _pixel_area_ha(local_seplan: LocalSeplan, window: Window) -> np.ndarray:
+    """Area of the pixels of a block in hectares."""
+    transform = window_transform(window, local_seplan.profile["transform"])
+    shape = (int(window.height), int(window.width))
+
+    if not local_seplan.profile["crs"].is_geographic:
+        return np.full(shape, abs(transform.a * transform.e) / 10000)
+
+    # area of a spherical cell: R² * dlon * (sin(lat_top) - sin(lat_bottom))
+    top = transform.f + transform.e * np.arange(shape[0])
+    lat_edges = np.radians(np.append(top, top[-1] + transform.e))
+    row_area = (
+        EARTH_RADIUS_M**2
+        * np.radians(abs(transform.a))
+        * np.abs(np.diff(np.sin(lat_edges)))
+    )
+
+    return np.broadcast_to(row_area[:, None] / 10000, shape)
+
+
+def _zone_groups(geometries: List[List[dict]]) -> List[List[int]]:
+    """Split the AOIs in groups of non-overlapping AOIs.
+
+    Each group is rasterized in its own zone-id grid, so a pixel can belong to
+    several AOIs (e.g. the primary AOI and a sub-AOI).
+    """
+    from shapely.geometry import shape
+    from shapely.ops import unary_union
+
+    shapes = [unary_union([shape(g) for g in geoms]) for geoms in geometries]
+
+    groups: List[List[int]] = []
+    for idx, geom in enumerate(shapes):
+        for group in groups:
+            if all(geom.intersection(shapes[i]).area == 0 for i in group):
+                group.append(idx)
+                break
+        else:
+            groups.append([idx])
+
+    return groups
+
+
+class _ZoneAccumulator:
+    def __init__(
+        self, nb_zones: int, nb_benefits: int, nb_costs: int, nb_constraints: int
+    ):
+        """Per-zone sums of every statistic, zone 0 being outside every AOI."""
+        size = nb_zones + 1
+        self.size = size
+        self.area = np.zeros(size)
+        self.suitability = np.zeros(size * NB_CLASSES)
+        self.benefit_sum = np.zeros((nb_benefits, size))
+        self.benefit_count = np.zeros((nb_benefits, size))
+        self.benefit_min = np.full((nb_benefits, size), np.inf)
+        self.benefit_max = np.full((nb_benefits, size), -np.inf)
+        self.cost_total = np.zeros((nb_costs, size))
+        self.cost_kept = np.zeros((nb_costs, size))
+        self.constraint_area = np.zeros((nb_constraints, size))
+
+    def _sum(self, zones: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        return np.bincount(zones, weights=weights, minlength=self.size)
+
+    def add(self, zones: np.ndarray, area: np.ndarray, block: dict) -> None:
+        """Accumulate the statistics of a block for one zone-id grid."""
+        zones, area = zones.ravel(), area.ravel()
+
+        kept = np.ones(zones.shape, dtype=bool)
+        for constraint in block["constraints"]:
+            kept &= constraint.ravel()
+
+        self.area += self._sum(zones, area)
+
+        # masked land is reported as the 6th class, like unmask(6) in EE
+        classes = np.nan_to_num(block["constraint_index"].ravel(), nan=6)
+        classes = np.round(classes).astype("int64")
+        self.suitability += np.bincount(
+            zones * NB_CLASSES + classes, weights=area, minlength=self.suitability.size
+        )
+
+        for i, values in enumerate(block["benefits"]):
+            values = values.ravel()
+            valid = kept & ~np.isnan(values)
+            self.benefit_sum[i] += self._sum(zones[valid], values[valid])
+            self.benefit_count[i] += np.bincount(zones[valid], minlength=self.size)
+            np.minimum.at(self.benefit_min[i], zones[valid], values[valid])
+            np.maximum.at(self.benefit_max[i], zones[valid], values[valid])
+
+        for i, values in enumerate(block["costs"]):
+            values = np.nan_to_num(values.ravel(), nan=0) * area
+            self.cost_total[i] += self._sum(zones, values)
+            self.cost_kept[i] += self._sum(zones[kept], values[kept])
+
+        for i, constraint in enumerate(block["constraints"]):
+            excluded = ~constraint.ravel()
+            self.constraint_area[i] += self._sum(zones[excluded], area[excluded])
+
+
+def get_summary_statistics_local(
+    local_seplan: LocalSeplan,
+    recipe_name: str,
+    aois: Dict[str, dict],
+) -> RecipeStatsDict:
+    """Compute the dashboard statistics of a local seplan in one pass.
+
+    Args:
+        local_seplan: the local engine to evaluate.
+        recipe_name: the name of the recipe, used as the top level key.
+        aois: the AOIs as ``{name: {"geometries": ..., "color": ...}}``, the
+            primary AOI first. Geometries take the same forms as the
+            ``LocalSeplan`` AOI (a vector file or GeoJSON-like geometries).
+
+    Returns:
+        The statistics in the same shape as the Earth Engine ones.
+    """
+    names = list(aois)
+    geometries = [local_seplan.read_geometries(aois[n]["geometries"]) for n in names]
+    groups = _zone_groups(geometries)
+
+    benefit_ids = local_seplan.benefit_model.ids
+    cost_ids = local_seplan.cost_model.ids
+    constraint_ids = local_seplan.constraint_model.ids
+    acc = _ZoneAccumulator(
+        len(names), len(benefit_ids), len(cost_ids), len(constraint_ids)
+    )
+
+    for window, block in local_seplan.iter_blocks():
+        area = _pixel_area_ha(local_seplan, window)
+        shape = area.shape
+        transform = window_transform(window, local_seplan.profile["transform"])
+
+        for group in groups:
+            # zone ids start at 1, 0 is outside every AOI of the group
+            zones = features.rasterize(
+                [(g, idx + 1) for idx in group for g in geometries[idx]],
+                out_shape=shape,
+                transform=transform,
+                fill=0,
+                dtype="int32",
+            ).astype("int64")
+            acc.add(zones, area, block)
+
+    result = {recipe_name: {}}
+    for idx, name in enumerate(names):
+        zone = idx + 1
+        area_ha = acc.area[zone]
+        suitability = acc.suitability[zone * NB_CLASSES : (zone + 1) * NB_CLASSES]
+
+        benefits = []
+        for i, id_ in enumerate(benefit_ids):
+            count = acc.benefit_count[i, zone]
+            mean = float(acc.benefit_sum[i, zone] / count) if count else None
+            # min/max are only reported for the primary AOI, like in EE
+            min_, max_ = 0, 0
+            if idx == 0 and count:
+                min_ = float(acc.benefit_min[i, zone])
+                max_ = float(acc.benefit_max[i, zone])
+            benefits.append(
+                {
+                    id_: {
+                        "total": [mean],
+                        "values": {"mean": mean, "max": max_, "min": min_},
+                    }
+                }
+            )
+
+        costs = [
+            {
+                id_: {
+                    "total": [float(acc.cost_total[i, zone] / area_ha)],
+                    "values": {"sum": float(acc.cost_kept[i, zone] / area_ha)},
+                }
+            }
+            for i, id_ in enumerate(cost_ids)
+        ]
+
+        constraints = [
+            {
+                id_: {
+                    "values": {
+                        "percent": float(acc.constraint_area[i, zone] / area_ha * 100)
+                    },
+                    "total": [float(area_ha)],
+                }
+            }
+            for i, id_ in enumerate(constraint_ids)
+        ]
+
+        result[recipe_name][name] = {
+            "suitability": {
+                "values": [
+                    {"image": code, "sum": float(suitability[code])}
+                    for code in range(1, NB_CLASSES)
+                    if suitability[code] > 0
+                ],
+                "total": float(suitability.sum()),
+            },
+            "benefit": benefits,
+            "cost": costs,
+            "constraint": constraints,
+            "color": aois[name].get("color", ""),
+        }
+
+    return result
@@ -20,6 +20,9 @@ import logging
 
 logger = logging.getLogger("SEPLAN")
 
+CI_KEY = {"benefit": "mean_ci", "cost": "sum_ci", "constraint": "percent_ci"}
+"""The half-width of the confidence interval of the values estimated from points."""
+
 
 def get_level_name(code: int) -> str:
     return SUITABILITY_LEVELS.get(code, f"Code {code}")
@@ -29,6 +32,18 @@ def get_level_color(code: int) -> str:
     return SUITABILITY_COLORS.get(code, "#000")  # Default to black if unknown
 
 
+def area_label(aoi_name: str, aoi_data: dict) -> str:
+    """The name of an area, flagged until its estimated statistics are refined."""
+    if (aoi_data.get("analysis") or {}).get("estimate"):
+        return f"{aoi_name} (estimated)"
+    return aoi_name
+
+
+def format_ci(ci: Optional[float], digits: int = 2, unit: str = "") -> str:
+    """The "± ci" suffix of an estimated value, empty for the exact ones."""
+    return "" if ci is None else f" ± {ci:,.{digits}f}{unit}"
+
+
 class EChartsWidget(EChartsWidget):
 
     def __init__(self, theme_toggle=None, *args, **kwargs):
@@ -62,6 +77,7 @@ def parse_suitability_data(
     """
 
     region_names = list(summary_results.keys())
+    region_labels = [area_label(r, summary_results[r]) for r in region_names]
     level_codes_set = set()
     level_data_dict: Dict[str, List[float]] = {}
 
@@ -106,7 +122,7 @@ def parse_suitability_data(
         }
         series_data.append(series_item)
 
-    return region_names, level_names, series_data
+    return region_labels, level_names, series_data
 
 
 def parse_layer_data(
@@ -130,7 +146,7 @@ def parse_layer_data(
     for aoi_name, aoi_data in summary_results.items():
         for theme, layers in aoi_data.items():
 
-            if theme in ["suitability", "color"]:
+            if theme not in data_type:
                 continue
 
             for layer_dict in layers:
@@ -143,13 +159,34 @@ def parse_layer_data(
                     min_ += data_values.get("min", 0)
                     max_ += data_values.get("max", 0)
 
-                    aoi_names.append(aoi_name)
+                    aoi_names.append(area_label(aoi_name, aoi_data))
                     values.append(data_values[data_type[theme]])
                     colors.append(summary_results[aoi_name]["color"])
 
     return aoi_names, values, colors, min_, max_
 
 
+def parse_layer_ci(
+    summary_results: SummaryStatsDict, layer_id: str
+) -> List[Optional[float]]:
+    """Returns the confidence intervals of a layer, in the order of ``parse_layer_data``.
+
+    The intervals are None for the areas with exact statistics.
+    """
+    cis = []
+    for aoi_data in summary_results.values():
+        for theme, layers in aoi_data.items():
+
+            if theme not in CI_KEY:
+                continue
+
+            for layer_dict in layers:
+                if layer_dict.get(layer_id):
+                    cis.append(layer_dict[layer_id]["values"].get(CI_KEY[theme]))
+
+    return cis
+
+
 def get_stacked_series(series_data: List[dict]) -> List[Bar]:
     """Create a list of echar bars from the series data."""
     bars = []
@@ -176,6 +213,7 @@ def get_bars_series(
     series_colors: List[str] = [],
     custom_item_color: bool = False,
     custom_item_colors: List[Tuple[str]] = None,
+    errors: List[List[Optional[float]]] = None,
 ) -> List[Bar]:
     """Create a list of bar series from the series data.
 
@@ -185,6 +223,7 @@ def get_bars_series(
         series_names: A list of names for each series.
         custom_item_color: A boolean indicating whether to use custom colors for each of the series item.
         custom_item_colors: A list of tuples containing the str colors for each of the elements of the series item.
+        errors: A list of the confidence intervals of each series item, labelled next to the estimated bars.
     """
 
     # Do sanity checks
@@ -204,6 +243,15 @@ def get_bars_series(
     if not custom_item_colors:
         custom_item_colors = [[None] * len(value) for value in values]
 
+    if not errors:
+        errors = [[None] * len(value) for value in values]
+
+    def label(value, error):
+        if error is None:
+            return {}
+        text = f"{value:,.2f}{format_ci(error)}"
+        return {"label": {"show": True, "position": "right", "formatter": text}}
+
     bars = []
     for i, series_name in enumerate(series_names):
         bars.append(
@@ -212,8 +260,11 @@ def get_bars_series(
                     {
                         "value": round(value, 2),
                         "itemStyle": {"color": color if custom_item_color else None},
+                        **label(value, error),
                     }
-                    for value, color in zip(values[i], custom_item_colors[i])
+                    for value, color, error in zip(
+                        values[i], custom_item_colors[i], errors[i]
+                    )
                 ],
                 itemStyle={"color": series_colors[i]},
                 name=series_name,
@@ -236,6 +287,7 @@ def get_bars_chart(
     min_value: Optional[float] = None,
     max_value: Optional[float] = None,
     theme_toggle=None,
+    errors: List[List[Optional[float]]] = None,
 ) -> EChartsWidget:
     """Create a simple, horizontal bar chart."""
 
@@ -256,6 +308,7 @@ def get_bars_chart(
         series_colors=series_colors,
         custom_item_color=custom_item_color,
         custom_item_colors=custom_item_colors,
+        errors=errors,
     )
 
     option = Option(
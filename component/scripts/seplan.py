@@ -1,15 +1,38 @@
 """All tools to build the suitability index."""
 
-from typing import List, Literal, Tuple, Union
+import logging
+from functools import partial
+from typing import Any, Callable, Dict, List, Literal, Sequence, Tuple, Union
 
 import ee
+from sepal_ui.scripts.gee_interface import GEEInterface
 
 from component import model as cmod
 from component.message import cm
 from component.model.aoi_model import SeplanAoi
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import _aoi_bbox, mask_to_aoi
+from component.scripts.breakpoints import (
+    breakpoint_key,
+    find_breakpoints,
+    set_breakpoints,
+)
+from component.scripts.concurrency import ESCALATION_LADDER, Escalation, run_escalated
 from component.scripts.validation import validate_mask_image_parameters
 
+logger = logging.getLogger("SEPLAN")
+
+
+STAGE_DEPENDENTS = {
+    "normalized_benefits": ["benefit_index"],
+    "benefit_index": ["benefit_cost_ratio"],
+    "cost_sum": ["benefit_cost_ratio"],
+    "benefit_cost_ratio": ["benefit_cost_index"],
+    "benefit_cost_index": ["constraint_index"],
+    "constraint_mask": ["constraint_index"],
+    "constraint_index": [],
+}
+"""The intermediate stages of the index and the stages built on top of them."""
+
 
 class Seplan:
 
@@ -22,7 +45,9 @@ class Seplan:
     ):
         """A class to compute the different indices of seplan.
 
-        We use a class instead of a comparaison to be able to compare multiple scenarios
+        We use a class instead of a comparaison to be able to compare multiple scenarios.
+        Every intermediate stage of the index is built once and shared by all the
+        consumers (map, export, dashboard) until one of the models it reads changes.
         """
         # save the models as members
         self.aoi_model = aoi_model
@@ -30,45 +55,169 @@ class Seplan:
         self.benefit_model = benefit_model
         self.constraint_model = constraint_model
 
-    def get_benefit_index(self, clip: bool = True) -> ee.Image:
-        """Build the index exclusively on the benefits weighted approach."""
-        aoi = self.aoi_model.feature_collection
+        self._stages: Dict[str, Any] = {}
+        """Memoized intermediate images, by stage name."""
+
+        self.breakpoint_escalations: Dict[str, Escalation] = {}
+        """The escalation of the normalization breakpoints approximated at a
+        coarser scale or with bestEffort, by normalization."""
+
+        # "updated" is fired when layers are added/removed/edited and "new_changes"
+        # on every change, including weights and constraint values.
+        self.aoi_model.observe(
+            lambda _: self._stages.clear(), ["updated", "simplification"]
+        )
+        self.benefit_model.observe(
+            lambda _: self.invalidate("normalized_benefits"), "updated"
+        )
+        self.benefit_model.observe(
+            lambda _: self.invalidate("benefit_index"), "new_changes"
+        )
+        self.cost_model.observe(
+            lambda _: self.invalidate("cost_sum"), ["updated", "new_changes"]
+        )
+        self.constraint_model.observe(
+            lambda _: self.invalidate("constraint_mask"), ["updated", "new_changes"]
+        )
+
+    def invalidate(self, *stages: str) -> None:
+        """Drop the memoized stages and every stage built on top of them."""
+        for stage in stages:
+            self._stages.pop(stage, None)
+            self._stages.pop(f"{stage}:clip", None)
+            self.invalidate(*STAGE_DEPENDENTS[stage])
+
+    def _memoize(self, stage: str, build: Callable[[], Any]) -> Any:
+        """Return the memoized value of a stage, building it on first use."""
+        if stage not in self._stages:
+            self._stages[stage] = build()
+
+        return self._stages[stage]
+
+    def _get_aoi(self) -> ee.FeatureCollection:
+        """Return the AOI feature collection, raising if there is none.
 
-        if not aoi:
+        It's the geometry used for the analysis, simplified when the recipe
+        opted in (see ``SeplanAoi.simplification``).
+        """
+        if not self.aoi_model.feature_collection:
             raise ValueError(cm.map.error.no_aoi)
 
-        # decompose benefit list to get only the image
-        normalize_benefits = [
-            quintiles(image, aoi) for image, _ in self.get_benefits_list()
-        ]
+        return self.aoi_model.get_analysis_feature_collection()
+
+    def _clip(self, stage: str, clip: bool) -> ee.Image:
+        """Return a memoized stage, optionally masked to the AOI."""
+        if clip is not True:
+            return self._stages[stage]
+
+        return self._memoize(
+            f"{stage}:clip", lambda: mask_to_aoi(self._stages[stage], self._get_aoi())
+        )
+
+    def get_normalized_benefits(self) -> List[ee.Image]:
+        """Return the quintile normalization of every benefit, in model order.
+
+        Only depends on the AOI and the benefit assets, never on the weights.
+        """
+        aoi = self._get_aoi()
+
+        # all the benefits are normalized from a single percentile reduction
+        return self._memoize(
+            "normalized_benefits",
+            lambda: normalize_benefits(
+                [image for image, _ in self.get_benefits_list()], aoi
+            ),
+        )
+
+    def get_constraint_mask(self) -> ee.Image:
+        """Return the reduced mask of every constraint."""
+        return self._memoize(
+            "constraint_mask",
+            lambda: reduce_constraints(self.get_masked_constraints_list()),
+        )
 
-        index = get_weighted_average(
-            self.benefit_model.themes, normalize_benefits, self.benefit_model.weights
+    def get_benefit_index(self, clip: bool = True) -> ee.Image:
+        """Build the index exclusively on the benefits weighted approach."""
+        self._memoize(
+            "benefit_index",
+            lambda: get_weighted_average(
+                self.benefit_model.themes,
+                self.get_normalized_benefits(),
+                self.benefit_model.weights,
+            ),
         )
 
-        return index.clip(aoi) if clip is True else index
+        return self._clip("benefit_index", clip)
+
+    def get_cost_sum(self) -> ee.Image:
+        """Build the sum of every cost."""
+
+        def build():
+            # unmask the images without normalizing as everything is in $/ha
+            images = [ee.Image(i) for i in self.cost_model.assets]
+
+            # create a normalized sum
+            norm_cost = ee.Image(0)
+            for v in images:
+                norm_cost = norm_cost.add(v)
+
+            # TODO: check if this is the best way to normalize
+            # norm_cost = _min_max(norm_cost, aoi)
+
+            return norm_cost
+
+        return self._memoize("cost_sum", build)
 
     def get_benefit_cost_index(self, clip: bool = True) -> ee.Image:
         """Build the benefit/cost ratio."""
         # This is 'benefit/cost ratio'
+        aoi = self._get_aoi()
+        self._memoize(
+            "benefit_cost_index",
+            lambda: _percentile(self._get_benefit_cost_ratio(), aoi),
+        )
 
-        # unmask the images without normalizing as everything is in $/ha
-        aoi = self.aoi_model.feature_collection
-        images = [ee.Image(i) for i in self.cost_model.assets]
-
-        # create a normalized sum
-        norm_cost = ee.Image(0)
-        for v in images:
-            norm_cost = norm_cost.add(v)
+        return self._clip("benefit_cost_index", clip)
 
-        # TODO: check if this is the best way to normalize
-        # norm_cost = _min_max(norm_cost, aoi)
+    def _get_benefit_cost_ratio(self) -> ee.Image:
+        """Build the raw benefit/cost ratio, before its percentile stretch."""
+        # the percentile stretch clips to the aoi, so the ratio is built from the
+        # unclipped benefit index to keep its graph (and breakpoint key) stable
+        return self._memoize(
+            "benefit_cost_ratio",
+            lambda: self.get_benefit_index(clip=False).divide(self.get_cost_sum()),
+        )
 
-        # create the benefits cost ratio
-        index = self.get_benefit_index(clip=clip).divide(norm_cost)
-        index = _percentile(index, aoi)
+    async def resolve_breakpoints_async(self, gee_interface: GEEInterface) -> None:
+        """Resolve and cache every normalization breakpoint of the index.
 
-        return index.clip(aoi) if clip is True else index
+        The benefit quintiles are resolved first so the benefit/cost ratio graph
+        already inlines them when its own percentile breakpoints are resolved.
+        Once cached, the index getters build graphs without any aggregation.
+        The simplified analysis AOI, if enabled, is resolved first as the
+        breakpoints are reduced over it. The approximated breakpoints are
+        recorded in ``breakpoint_escalations``.
+        """
+        self.breakpoint_escalations = {}
+        await self.aoi_model.resolve_simplification_async(gee_interface)
+        aoi = self._get_aoi()
+
+        images = [image for image, _ in self.get_benefits_list()]
+        computed, quintile = await resolve_quintiles_async(gee_interface, images, aoi)
+        if computed:
+            # rebuild the normalization with the breakpoints as constants
+            self.invalidate("normalized_benefits")
+
+        ratio = self._get_benefit_cost_ratio()
+        computed, percentile = await resolve_percentile_async(gee_interface, ratio, aoi)
+        if computed:
+            self.invalidate("benefit_cost_index")
+
+        self.breakpoint_escalations = {
+            name: escalation
+            for name, escalation in [("quintile", quintile), ("percentile", percentile)]
+            if not escalation.exact
+        }
 
     def get_constraint_index(self, clip: bool = True) -> ee.Image:
         """Get suitability index masked with constraints."""
@@ -81,17 +230,15 @@ class Seplan:
             )
             raise ValueError(error_msg)
 
-        aoi = self.aoi_model.feature_collection
-        mask_out_areas = reduce_constraints(self.get_masked_constraints_list())
-
-        index = (
-            self.get_benefit_cost_index(clip=clip)
+        self._memoize(
+            "constraint_index",
+            lambda: self.get_benefit_cost_index(clip=False)
             .multiply(4)
             .add(1)
-            .updateMask(mask_out_areas)
+            .updateMask(self.get_constraint_mask()),
         )
 
-        return index.clip(aoi) if clip is True else index
+        return self._clip("constraint_index", clip)
 
     def get_benefits_list(self) -> List[Tuple[ee.Image, str]]:
         """Returns a list of named ee_image benefits from user input."""
@@ -169,23 +316,133 @@ def reduce_constraints(masked_constraints_list: List[Tuple[ee.Image, str]]) -> e
     return ee.Image(constraints).mask().reduce(ee.Reducer.min()).gt(0).selfMask()
 
 
+MAX_PACKED_CONSTRAINTS = 30
+"""Number of constraints that fit in the bits of a signed int32 band."""
+
+
+def pack_constraints(masked_constraints_list: List[Tuple[ee.Image, str]]) -> ee.Image:
+    """Pack the state of every constraint in the bits of one integer band.
+
+    Bit ``i`` of the "code" band is set where the i-th constraint masks out the
+    land, so 0 is kept land and any other code tells which combination of
+    constraints excludes the pixel.
+    """
+    if len(masked_constraints_list) > MAX_PACKED_CONSTRAINTS:
+        raise ValueError(
+            f"Can't pack more than {MAX_PACKED_CONSTRAINTS} constraints in one band."
+        )
+
+    bits = [
+        constraint.unmask(0).eq(0).leftShift(i)
+        for i, (constraint, _) in enumerate(masked_constraints_list)
+    ]
+
+    return (
+        ee.Image.cat([ee.Image(0), *bits])
+        .reduce(ee.Reducer.sum())
+        .toInt()
+        .rename("code")
+    )
+
+
+async def prepare_breakpoints_async(
+    gee_interface: GEEInterface, seplan: Seplan
+) -> None:
+    """Resolve the breakpoints of a seplan model, never failing the caller.
+
+    The cache is only an optimization: if the breakpoints can't be resolved the
+    index getters keep computing them server-side within the same graph.
+    """
+    try:
+        await seplan.resolve_breakpoints_async(gee_interface)
+    except Exception as e:
+        logger.warning(f"Normalization breakpoints not cached, computing inline: {e}")
+
+
+def _coarsest(escalations: Sequence[Escalation]) -> Escalation:
+    """The escalation highest on the ladder, the plain reduction if none."""
+    return max(escalations, key=ESCALATION_LADDER.index, default=Escalation())
+
+
+PERCENTILE_SCALE = 10000
+"""Scale (in meters) of the percentile stretch of the benefit/cost ratio."""
+
+
+def _percentile_reduction(
+    ee_image: ee.Image,
+    aoi: ee.FeatureCollection,
+    scale: int,
+    percentile: Tuple[int, int],
+    escalation: Escalation = Escalation(),
+) -> ee.Dictionary:
+    """Reduce the percentiles of the first band of the image over the aoi."""
+    clipped = mask_to_aoi(ee_image.rename("img"), aoi)
+    return clipped.reduceRegion(
+        reducer=ee.Reducer.percentile(percentiles=percentile),
+        geometry=_aoi_bbox(aoi),
+        **escalation.reduce_kwargs(scale),
+        maxPixels=1e13,
+    )
+
+
+async def resolve_percentile_async(
+    gee_interface: GEEInterface,
+    ee_image: ee.Image,
+    aoi: ee.FeatureCollection,
+    scale: int = PERCENTILE_SCALE,
+    percentile: Tuple[int, int] = [3, 97],
+) -> Tuple[bool, Escalation]:
+    """Compute and cache the breakpoints used by ``_percentile``.
+
+    A reduction running out of memory or pixels is escalated (see
+    ``run_escalated``), the breakpoints approximated by a coarser scale or
+    bestEffort are cached under a key of their own.
+
+    Returns:
+        True if the breakpoints were computed, False if they were already cached,
+        and the escalation of the breakpoints.
+    """
+    ee_image = ee_image.select(0)
+    key = partial(breakpoint_key, ee_image, aoi, scale, percentile)
+
+    cached, escalation = find_breakpoints(key)
+    if cached is not None:
+        return False, escalation
+
+    percents, escalation = await run_escalated(
+        lambda escalation: gee_interface.get_info_async(
+            _percentile_reduction(ee_image, aoi, scale, percentile, escalation)
+        )
+    )
+    percents = percents or {}
+
+    set_breakpoints({key(escalation): [percents.get(f"img_p{p}") for p in percentile]})
+
+    return True, escalation
+
+
 def _percentile(
     ee_image: ee.Image,
     aoi: ee.FeatureCollection,
-    scale: int = 10000,
+    scale: int = PERCENTILE_SCALE,
     percentile: Tuple[int, int] = [3, 97],
 ) -> ee.Image:
-    """Return a normalized version of the layer image."""
+    """Return a normalized version of the layer image.
+
+    Cached breakpoints (see ``resolve_percentile_async``) are inlined as
+    constants, otherwise they are reduced within the returned graph.
+    """
     ee_image = ee_image.select(0)
-    clipped = ee_image.rename("img").clip(aoi)
-    percents = clipped.reduceRegion(
-        reducer=ee.Reducer.percentile(percentiles=percentile),
-        geometry=_aoi_bbox(aoi),
-        scale=scale,
-        maxPixels=1e13,
+    breakpoints, _ = find_breakpoints(
+        partial(breakpoint_key, ee_image, aoi, scale, percentile)
     )
-    low = ee.Number(percents.get(f"img_p{percentile[0]}"))
-    high = ee.Number(percents.get(f"img_p{percentile[1]}")).add(0.1e-13)
+
+    if breakpoints is None:
+        percents = _percentile_reduction(ee_image, aoi, scale, percentile)
+        breakpoints = [percents.get(f"img_p{p}") for p in percentile]
+
+    low = ee.Number(breakpoints[0])
+    high = ee.Number(breakpoints[1]).add(0.1e-13)
 
     return ee_image.unitScale(low, high).clamp(0, 1).float()
 
@@ -197,7 +454,7 @@ def _min_max(
 ) -> ee.Image:
     """Return a normalized version of the layer image."""
     ee_image = ee_image.select(0)
-    clipped = ee_image.rename("img").clip(aoi)
+    clipped = mask_to_aoi(ee_image.rename("img"), aoi)
     min_max = clipped.reduceRegion(
         reducer=ee.Reducer.minMax(),
         geometry=_aoi_bbox(aoi),
@@ -247,30 +504,126 @@ def get_weighted_average(
     return weighted_image
 
 
-def quintiles(
-    ee_image: ee.Image, ee_aoi: Union[ee.FeatureCollection, ee.Geometry]
-) -> ee.Image:
-    """Return a normalized quintile image of the input image over the aoi."""
-    # ee_image.projection().nominalScale().multiply(2)
+QUINTILE_PERCENTILES = [20, 40, 60, 80]
+"""Percentiles used as breakpoints of the quintile normalization."""
 
-    band_name = ee.String(ee_image.bandNames().get(0))
-    clipped = ee_image.clip(ee_aoi)
-    quintiles_dict = clipped.reduceRegion(
-        reducer=ee.Reducer.percentile(percentiles=[20, 40, 60, 80]),
+
+QUINTILES_SCALE = 100
+"""Scale (in meters) of the quintile breakpoints reduction."""
+
+
+def _quintiles_reduction(
+    images: List[ee.Image],
+    ee_aoi: Union[ee.FeatureCollection, ee.Geometry],
+    escalation: Escalation = Escalation(),
+) -> ee.Dictionary:
+    """Reduce the quintile breakpoints of every image in one aggregation.
+
+    Every image is stacked as a band ``b{i}`` of a single image so that all the
+    breakpoints come from one grouped percentile ``reduceRegion``. Percentile
+    reducers honor each band's own mask, so the breakpoints are the same as
+    reducing every image separately.
+    """
+    stack = ee.Image.cat(
+        [image.select(0).rename(f"b{i}") for i, image in enumerate(images)]
+    )
+
+    return mask_to_aoi(stack, ee_aoi).reduceRegion(
+        reducer=ee.Reducer.percentile(percentiles=QUINTILE_PERCENTILES),
         geometry=_aoi_bbox(ee_aoi),
-        tileScale=2,
-        scale=100,
+        **escalation.reduce_kwargs(QUINTILES_SCALE, tile_scale=2),
         maxPixels=1e13,
     )
 
-    quintiles_names = ee.List(["p20", "p40", "p60", "p80"]).map(
-        lambda quintile_name: band_name.cat("_").cat(ee.String(quintile_name))
+
+def _quintiles_key(
+    image: ee.Image,
+    ee_aoi: Union[ee.FeatureCollection, ee.Geometry],
+    escalation: Escalation = Escalation(),
+) -> str:
+    """Breakpoint cache key of the quintiles of an image."""
+    return breakpoint_key(
+        image, ee_aoi, QUINTILES_SCALE, QUINTILE_PERCENTILES, escalation
+    )
+
+
+async def resolve_quintiles_async(
+    gee_interface: GEEInterface,
+    images: List[ee.Image],
+    ee_aoi: Union[ee.FeatureCollection, ee.Geometry],
+) -> Tuple[bool, Escalation]:
+    """Compute and cache the quintile breakpoints of the images.
+
+    Only the images without cached breakpoints are reduced, all of them in a
+    single aggregation, escalated if it runs out of memory or pixels (see
+    ``resolve_percentile_async``).
+
+    Returns:
+        True if any breakpoint was computed, False if all were already cached,
+        and the coarsest escalation of the breakpoints.
+    """
+    found = [
+        find_breakpoints(partial(_quintiles_key, image, ee_aoi)) for image in images
+    ]
+    missing = [image for image, (cached, _) in zip(images, found) if cached is None]
+    escalations = [escalation for cached, escalation in found if cached is not None]
+
+    if not missing:
+        return False, _coarsest(escalations)
+
+    values, escalation = await run_escalated(
+        lambda escalation: gee_interface.get_info_async(
+            _quintiles_reduction(missing, ee_aoi, escalation)
+        )
+    )
+    values = values or {}
+
+    set_breakpoints(
+        {
+            _quintiles_key(image, ee_aoi, escalation): [
+                values.get(f"b{i}_p{p}") for p in QUINTILE_PERCENTILES
+            ]
+            for i, image in enumerate(missing)
+        }
     )
 
-    low = ee.Number(quintiles_dict.get(quintiles_names.get(0)))
-    lowmed = ee.Number(quintiles_dict.get(quintiles_names.get(1)))
-    highmed = ee.Number(quintiles_dict.get(quintiles_names.get(2)))
-    high = ee.Number(quintiles_dict.get(quintiles_names.get(3)))
+    return True, _coarsest([*escalations, escalation])
+
+
+def normalize_benefits(
+    images: List[ee.Image], ee_aoi: Union[ee.FeatureCollection, ee.Geometry]
+) -> List[ee.Image]:
+    """Return the quintile normalization of every image over the aoi.
+
+    Cached breakpoints (see ``resolve_quintiles_async``) are inlined as
+    constants. The remaining ones are computed within the graph, from a single
+    reduction shared by all the images.
+    """
+    if not images:
+        return []
+
+    cached = [
+        find_breakpoints(partial(_quintiles_key, image, ee_aoi))[0] for image in images
+    ]
+    missing = [image for image, breakpoints in zip(images, cached) if not breakpoints]
+    reduction = _quintiles_reduction(missing, ee_aoi) if missing else None
+
+    normalized, missing_idx = [], 0
+    for image, breakpoints in zip(images, cached):
+        if not breakpoints:
+            breakpoints = [
+                reduction.get(f"b{missing_idx}_p{p}") for p in QUINTILE_PERCENTILES
+            ]
+            missing_idx += 1
+
+        normalized.append(_apply_quintiles(image, [ee.Number(b) for b in breakpoints]))
+
+    return normalized
+
+
+def _apply_quintiles(ee_image: ee.Image, breakpoints: List[ee.Number]) -> ee.Image:
+    """Classify the image in 5 classes using the p20/p40/p60/p80 breakpoints."""
+    low, lowmed, highmed, high = breakpoints
 
     return (
         ee.Image(0)
@@ -280,3 +633,10 @@ def quintiles(
         .where(ee_image.gt(highmed).And(ee_image.lte(high)), 4)
         .where(ee_image.gt(high), 5)
     ).selfMask()
+
+
+def quintiles(
+    ee_image: ee.Image, ee_aoi: Union[ee.FeatureCollection, ee.Geometry]
+) -> ee.Image:
+    """Return a normalized quintile image of the input image over the aoi."""
+    return normalize_benefits([ee_image], ee_aoi)[0]
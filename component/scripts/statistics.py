@@ -1,17 +1,54 @@
 import asyncio
 import logging
-from typing import Dict
+import math
+from functools import partial
+from itertools import takewhile
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import ee
 from sepal_ui.scripts.gee_interface import GEEInterface
 
 from component.model.recipe import Recipe
-from component.scripts.aoi_geometry import _aoi_bbox
-from component.scripts.seplan import reduce_constraints
+from component.scripts.aoi_geometry import (
+    _aoi_bbox,
+    aoi_bounds_async,
+    aoi_fingerprint,
+    cached_aoi_bounds,
+    ee_fingerprint,
+    mask_to_aoi,
+)
+from component.scripts.concurrency import (
+    AdaptiveLimiter,
+    Escalation,
+    is_rate_limit_error,
+    is_resource_error,
+    run_escalated,
+)
+from component.scripts.seplan import (
+    MAX_PACKED_CONSTRAINTS,
+    pack_constraints,
+    prepare_breakpoints_async,
+    reduce_constraints,
+)
+from component.scripts.statistics_store import cell_key, load_cells, save_cells
 from component.types import (
+    AnalysisInfo,
+    AreaStats,
     MeanStatsDict,
     MeanStatsValues,
     PercentageStatsDict,
+    PercentageStatsValues,
     RecipeStatsDict,
     SumStatsDict,
 )
@@ -19,18 +56,82 @@ from component.types import (
 logger = logging.getLogger("SEPLAN")
 
 STATS_SCALE_M = 100
-"""Scale (in meters) used by every reduceRegion in this module. The dashboard
-CSV export reads this constant to report the actual computation scale."""
+"""Reference scale (in meters) of the statistics. It's used for every AOI when
+the dashboard asks for exact results, and when the extent of an AOI is unknown."""
 
+STATS_SCALES = (30, 100, 250, 500, 1000, 2000, 5000)
+"""Candidate scales (in meters) of the statistics of an AOI, finest first."""
 
-def _reduce_region_aoi(image: ee.Image, aoi, **reduce_kwargs) -> ee.Dictionary:
+STATS_PIXEL_BUDGET = 5e7
+"""Maximum number of pixels reduced over an AOI, see ``plan_stats_scale``."""
+
+
+def _reduce_region_aoi(
+    image: ee.Image,
+    aoi,
+    scale: Optional[int] = None,
+    escalation: Escalation = Escalation(),
+    **reduce_kwargs,
+) -> ee.Dictionary:
     """``reduceRegion`` over an AOI without dissolving it.
 
     Reducing over ``aoi.geometry()`` can exceed EE's 2M-edge limit for dense
-    AOIs. Clip the image to the AOI and reduce over its bounding box instead —
+    AOIs. Mask the image to the AOI and reduce over its bounding box instead —
     masked pixels don't contribute, so the result matches the exact polygon.
+    The reduction runs at ``STATS_SCALE_M`` unless a scale is given, with the
+    settings of its escalation (see ``run_escalated``).
     """
-    return image.clip(aoi).reduceRegion(geometry=_aoi_bbox(aoi), **reduce_kwargs)
+    return mask_to_aoi(image, aoi).reduceRegion(
+        geometry=_aoi_bbox(aoi),
+        **escalation.reduce_kwargs(scale or STATS_SCALE_M),
+        **reduce_kwargs,
+    )
+
+
+def _bounds_area(bounds: Sequence[float]) -> float:
+    """Approximate area (m²) of a ``[minx, miny, maxx, maxy]`` extent in degrees."""
+    minx, miny, maxx, maxy = bounds
+    width = (maxx - minx) * 111320 * abs(math.cos(math.radians((miny + maxy) / 2)))
+    height = (maxy - miny) * 110574
+
+    return width * height
+
+
+def plan_stats_scale(
+    bounds: Sequence[float],
+    pixel_budget: float = STATS_PIXEL_BUDGET,
+    scales: Sequence[int] = STATS_SCALES,
+) -> int:
+    """Choose the finest scale whose pixel count over an AOI fits the budget.
+
+    The reductions run over the bounding box of the AOI (see
+    ``_reduce_region_aoi``), so the pixel count is estimated from its extent:
+    continental AOIs are reduced at a coarser scale and small drawn sub-AOIs at
+    a finer one.
+
+    Args:
+        bounds: the ``[minx, miny, maxx, maxy]`` extent of the AOI.
+        pixel_budget: the maximum number of pixels of a reduction.
+        scales: the candidate scales in meters, finest first.
+
+    Returns:
+        The chosen scale, the coarsest candidate if none fits the budget.
+    """
+    area = _bounds_area(bounds)
+    for scale in scales:
+        if area / scale**2 <= pixel_budget:
+            return scale
+
+    return scales[-1]
+
+
+def _aoi_scale(aoi, exact: bool) -> int:
+    """Return the scale of the statistics of an AOI."""
+    bounds = cached_aoi_bounds(aoi)
+    if exact or bounds is None:
+        return STATS_SCALE_M
+
+    return plan_stats_scale(bounds)
 
 
 def is_main_aoi(main_aoi_name, aoi_name) -> bool:
@@ -39,50 +140,130 @@ def is_main_aoi(main_aoi_name, aoi_name) -> bool:
 
 
 async def get_summary_statistics_async(
-    gee_interface: GEEInterface, recipe: Recipe
+    gee_interface: GEEInterface,
+    recipe: Recipe,
+    mode: Literal["auto", "sequential", "collection"] = "auto",
 ) -> RecipeStatsDict:
     """Returns summary statistics using seplan inputs with automatic fallback.
 
     The statistics will be later parsed to be displayed in the dashboard.
 
-    This function first attempts sequential AOI processing. If it encounters a 429 error
-    (Too many concurrent aggregations), it automatically falls back to a batched processing
-    approach that processes statistics in smaller chunks.
+    All the requests share an adaptive limiter: they run concurrently, as many
+    as Earth Engine accepts, and a request rejected with a 429 error (Too many
+    concurrent aggregations) is retried on its own. An AOI that stays rate
+    limited is split in one request per layer; the AOIs already computed are
+    kept.
 
     Args:
         gee_interface: The GEE interface for async operations
         recipe: The recipe to compute statistics for
+        mode: "sequential" runs one request per AOI, "collection" one request for
+            all of them. "auto" uses the collection when there are sub-AOIs.
 
     """
-    try:
-        return await _get_summary_statistics_sequential(gee_interface, recipe)
-    except Exception as e:
-        error_msg = str(e).lower()
-
-        if (
-            "429" in error_msg
-            or "concurrent aggregation" in error_msg
-            or "resource_exhausted" in error_msg
-        ):
+    summary_stats = {}
+    async for summary_stats in iter_summary_statistics_async(
+        gee_interface, recipe, mode
+    ):
+        pass
+
+    return summary_stats
+
+
+async def iter_summary_statistics_async(
+    gee_interface: GEEInterface,
+    recipe: Recipe,
+    mode: Literal["auto", "sequential", "collection"] = "auto",
+) -> AsyncIterator[RecipeStatsDict]:
+    """Yields the summary statistics as the AOIs are computed.
+
+    Same computation as ``get_summary_statistics_async``, but every yield is a
+    partial ``RecipeStatsDict`` with the AOIs computed so far, so the dashboard
+    can be displayed before the last AOI is done. The AOIs are yielded in their
+    order, the primary AOI always first; the last yield holds all of them.
+
+    Every statistic is persisted as it is computed and only the ones missing
+    from the store are sent to Earth Engine: adding a layer or a sub-AOI only
+    computes its own statistics, an unchanged recipe is read back from the store
+    in a single yield.
+    """
+    inputs = await _get_stats_inputs(gee_interface, recipe)
+
+    summary_stats = _load_stored_statistics(inputs)
+    if summary_stats:
+        logger.info("Reusing the stored statistics of the recipe")
+        yield summary_stats
+        return
+
+    if mode == "auto":
+        # the collection computes every statistic at once, the per-AOI requests
+        # only the ones missing from the store
+        stored = any(load_cells(keys.values()) for keys in inputs.cell_keys.values())
+        many_aois = len(inputs.ee_features) > 1
+        mode = "collection" if many_aois and not stored else "sequential"
+
+    limiter = AdaptiveLimiter()
+
+    if mode == "collection":
+        try:
+            async for summary_stats in _iter_collection_statistics(
+                gee_interface, limiter, inputs
+            ):
+                yield summary_stats
+        except Exception as e:
+            if not (is_rate_limit_error(e) or is_resource_error(e)):
+                raise
+            # the AOIs already computed are read back from the store
             logger.warning(
-                "Hit concurrent aggregation limit with sequential processing. "
-                "Falling back to batched processing with smaller chunks..."
-            )
-            return await _get_summary_statistics_batched(
-                gee_interface, recipe, batch_size=2
+                f"The AOI collection failed ({e}). "
+                "Falling back to one request per AOI..."
             )
         else:
-            raise
+            return
 
+    async for summary_stats in _iter_summary_statistics_per_aoi(
+        gee_interface, limiter, inputs
+    ):
+        yield summary_stats
 
-async def _get_summary_statistics_sequential(
-    gee_interface: GEEInterface, recipe: Recipe
-) -> RecipeStatsDict:
-    """Sequential AOI processing (standard approach).
 
-    Processes each AOI sequentially to avoid overwhelming GEE with concurrent operations.
-    This is the primary method that should work for most cases.
+def load_summary_statistics(recipe: Recipe) -> Optional[RecipeStatsDict]:
+    """Read the statistics of a recipe from the store without computing them.
+
+    Returns:
+        The statistics of every AOI and layer of the recipe, None if any of them
+        is missing or the recipe can't be evaluated.
     """
+    try:
+        _check_recipe(recipe)
+        return _load_stored_statistics(_build_stats_inputs(recipe))
+    except Exception as e:
+        logger.debug(f"No stored statistics for the recipe: {e}")
+        return None
+
+
+Cell = Tuple[str, str]
+"""A statistic of an AOI, as (theme, layer name)."""
+
+
+class _StatsInputs(NamedTuple):
+    """The Earth Engine inputs shared by the statistics of every AOI."""
+
+    recipe_name: str
+    main_ee_name: str
+    ee_features: Dict[str, dict]
+    """The AOI feature, color and statistics ``scale`` of every AOI, by name."""
+    benefit_list: list
+    cost_list: list
+    constraint_list: list
+    mask_out_areas: ee.Image
+    wlc_out: ee.Image
+    cell_keys: Dict[str, Dict[Cell, str]]
+    """The store key of every cell of every AOI, empty if the store is skipped."""
+
+
+def _check_recipe(recipe: Recipe) -> None:
+    """Check that statistics can be computed from the recipe."""
     if not recipe:
         raise ValueError("There is no recipe to get statistics from.")
 
@@ -91,281 +272,1340 @@ async def _get_summary_statistics_sequential(
             "You can only export the dashboard data for the current recipe, load or create a recipe first in the recipe section"
         )
 
+
+async def _get_stats_inputs(
+    gee_interface: GEEInterface, recipe: Recipe
+) -> _StatsInputs:
+    """Validate the recipe and build the inputs of the statistics."""
+    _check_recipe(recipe)
+
+    # Get the restoration suitability index, with its normalization cached
+    await prepare_breakpoints_async(gee_interface, recipe.seplan)
+
+    # the statistics scale of each AOI is planned from its extent
+    if not recipe.dash_model.exact_scale:
+        await _resolve_aoi_bounds_async(gee_interface, recipe)
+
+    return _build_stats_inputs(recipe)
+
+
+async def _resolve_aoi_bounds_async(gee_interface: GEEInterface, recipe: Recipe):
+    """Resolve the extent of every AOI, the unresolved ones use ``STATS_SCALE_M``."""
+    main_ee_features, secondary_ee_features = recipe.seplan.aoi_model.get_ee_features()
+    ee_features = {**main_ee_features, **secondary_ee_features}
+
+    results = await asyncio.gather(
+        *[
+            aoi_bounds_async(gee_interface, data["ee_feature"])
+            for data in ee_features.values()
+        ],
+        return_exceptions=True,
+    )
+    for aoi_name, result in zip(ee_features, results):
+        if isinstance(result, Exception):
+            logger.debug(f"Extent of '{aoi_name}' unknown, using the reference scale")
+
+
+def _build_stats_inputs(recipe: Recipe) -> _StatsInputs:
+    """Build the inputs of the statistics from the recipe layers and AOIs."""
     seplan_model = recipe.seplan
-    recipe_name = recipe.get_recipe_name()
 
     # Get all inputs from the model
     main_ee_features, secondary_ee_features = seplan_model.aoi_model.get_ee_features()
     main_ee_name = list(main_ee_features.keys())[0]
 
-    ee_features = {**main_ee_features, **secondary_ee_features}
+    exact = recipe.dash_model.exact_scale
+    ee_features = {
+        aoi_name: {**data, "scale": _aoi_scale(data["ee_feature"], exact)}
+        for aoi_name, data in {**main_ee_features, **secondary_ee_features}.items()
+    }
+
+    # the breakpoints are reduced over the primary AOI
+    breakpoints = {
+        f"breakpoints: {name}": escalation._asdict()
+        for name, escalation in seplan_model.breakpoint_escalations.items()
+    }
+    if breakpoints:
+        ee_features[main_ee_name]["escalations"] = breakpoints
 
-    # get list of benefits and names. This is used to get statistics.
     benefit_list = seplan_model.get_benefits_list()
+    cost_list = seplan_model.get_costs_list()
 
     # List of masked out constraints and names
     constraint_list = seplan_model.get_masked_constraints_list()
 
     # Extract only the image from the constraint list and reduce to single mask
     mask_out_areas = reduce_constraints(constraint_list)
+    wlc_out = seplan_model.get_constraint_index()
 
-    # List of normalized costs and names
-    cost_list = seplan_model.get_costs_list()
+    return _StatsInputs(
+        recipe_name=recipe.get_recipe_name(),
+        main_ee_name=main_ee_name,
+        ee_features=ee_features,
+        benefit_list=benefit_list,
+        cost_list=cost_list,
+        constraint_list=constraint_list,
+        mask_out_areas=mask_out_areas,
+        wlc_out=wlc_out,
+        cell_keys=_get_cell_keys(
+            main_ee_name,
+            ee_features,
+            benefit_list,
+            cost_list,
+            constraint_list,
+            mask_out_areas,
+            wlc_out,
+        ),
+    )
+
+
+def _get_cell_keys(
+    main_ee_name: str,
+    ee_features: Dict[str, dict],
+    benefit_list: list,
+    cost_list: list,
+    constraint_list: list,
+    mask_out_areas: ee.Image,
+    wlc_out: ee.Image,
+) -> Dict[str, Dict[Cell, str]]:
+    """Key every cell by the AOI, its scale, the layer and the constraint mask.
+
+    The suitability index already embeds the mask. The benefits and costs are
+    reduced within the mask and the exclusive coverage of a constraint depends on
+    the other ones, so editing a constraint invalidates them, but not the
+    statistics of an unchanged layer when a layer or an AOI is added.
+
+    The store is only an optimization: if the inputs can't be fingerprinted, the
+    statistics are computed without it.
+    """
+    try:
+        mask = ee_fingerprint(mask_out_areas)
+        layers = [("suitability", "suitability", ee_fingerprint(wlc_out), "")]
+        for theme, layer_list in [
+            ("benefit", benefit_list),
+            ("cost", cost_list),
+            ("constraint", constraint_list),
+        ]:
+            layers += [
+                (theme, name, ee_fingerprint(image), mask) for image, name in layer_list
+            ]
+
+        cell_keys = {}
+        for aoi_name, data in ee_features.items():
+            aoi = aoi_fingerprint(data["ee_feature"])
+            # the benefits of the main aoi also report their range
+            main_aoi = is_main_aoi(main_ee_name, aoi_name)
+            cell_keys[aoi_name] = {
+                (theme, name): cell_key(
+                    aoi,
+                    theme,
+                    layer,
+                    mask_layer,
+                    main_aoi and theme == "benefit",
+                    data["scale"],
+                )
+                for theme, name, layer, mask_layer in layers
+            }
+    except Exception as e:
+        logger.debug(f"Statistics store skipped: {e}")
+        return {}
+
+    return cell_keys
+
+
+def _aoi_cells(inputs: _StatsInputs) -> List[Cell]:
+    """List the cells of an AOI in the order of the ``AreaStats``."""
+    cells = [("suitability", "suitability")]
+    cells += [("benefit", name) for _, name in inputs.benefit_list]
+    cells += [("cost", name) for _, name in inputs.cost_list]
+    cells += [("constraint", name) for _, name in inputs.constraint_list]
+
+    return cells
+
+
+def _area_stats_cells(area_stats: dict) -> Dict[Cell, dict]:
+    """Split a (possibly partial) ``AreaStats`` in cells."""
+    cells = {}
+    if area_stats.get("suitability") is not None:
+        cells[("suitability", "suitability")] = area_stats["suitability"]
+
+    for theme in ["benefit", "cost", "constraint"]:
+        for entry in area_stats.get(theme) or []:
+            for name, content in entry.items():
+                cells[(theme, name)] = content
+
+    return cells
+
+
+def _cells_area_stats(
+    inputs: _StatsInputs, cells: Dict[Cell, dict], data: dict
+) -> AreaStats:
+    """Assemble the cells of an AOI in an ``AreaStats``."""
+    area_stats = {
+        "suitability": cells.get(("suitability", "suitability")),
+        "benefit": [],
+        "cost": [],
+        "constraint": [],
+        "color": data["color"],
+    }
+    for theme, name in _aoi_cells(inputs)[1:]:
+        if (theme, name) in cells:
+            area_stats[theme].append({name: cells[(theme, name)]})
+
+    analysis = _aoi_analysis(data)
+    escalations = {
+        f"{theme}: {name}": content["escalation"]
+        for (theme, name), content in cells.items()
+        if content and content.get("escalation")
+    }
+    if escalations:
+        analysis["escalations"] = {**analysis.get("escalations", {}), **escalations}
+    if analysis:
+        area_stats["analysis"] = analysis
+
+    return area_stats
+
+
+def _aoi_analysis(data: dict) -> AnalysisInfo:
+    """Describe the scale and the geometry of the analysis of an AOI."""
+    analysis = {}
+    if data.get("scale"):
+        analysis["scale"] = data["scale"]
+
+    simplification = data.get("simplification")
+    if simplification:
+        analysis["simplify_tolerance"] = simplification["tolerance"]
+        analysis["area_error"] = simplification["area_error"]
+
+    if data.get("escalations"):
+        analysis["escalations"] = dict(data["escalations"])
+
+    return analysis
+
+
+def _load_aoi_cells(inputs: _StatsInputs, aoi_name: str) -> Dict[Cell, dict]:
+    """Read the stored cells of an AOI."""
+    keys = inputs.cell_keys.get(aoi_name, {})
+    stored = load_cells(keys.values())
+
+    return {cell: stored[key] for cell, key in keys.items() if key in stored}
+
+
+def _save_aoi_cells(inputs: _StatsInputs, aoi_name: str, cells: Dict[Cell, dict]):
+    """Store the computed cells of an AOI."""
+    save_cells(_storable_aoi_cells(inputs, aoi_name, cells))
+
+
+def _storable_aoi_cells(
+    inputs: _StatsInputs, aoi_name: str, cells: Dict[Cell, dict]
+) -> Dict[str, dict]:
+    """The computed cells of an AOI to store, by cell key.
+
+    The cells approximated by their escalation (coarser scale or bestEffort)
+    and the constraints reduced without their exclusive coverage are not
+    stored, they are computed again next time.
+    """
+    keys = inputs.cell_keys.get(aoi_name, {})
+    return {
+        keys[cell]: content
+        for cell, content in cells.items()
+        if cell in keys and _is_exact(content) and _is_complete(cell, content)
+    }
+
+
+def _is_complete(cell: Cell, content: Optional[dict]) -> bool:
+    """Tell if a cell has all its values, the exclusive coverage of a constraint."""
+    if cell[0] != "constraint":
+        return True
+
+    return "exclusive" in ((content or {}).get("values") or {})
+
+
+def _is_exact(content: Optional[dict]) -> bool:
+    """Tell if a cell wasn't approximated by the escalation of its reduction."""
+    return Escalation(**(content or {}).get("escalation", {})).exact
 
-    # Get the restoration suitability index
-    wlc_out = seplan_model.get_constraint_index()
 
-    # Log computation details for debugging
+def _load_stored_statistics(inputs: _StatsInputs) -> Optional[RecipeStatsDict]:
+    """Read the statistics of every AOI from the store, None if any is missing."""
+    if not inputs.cell_keys:
+        return None
+
+    nb_cells = len(_aoi_cells(inputs))
+    area_stats = {}
+    for aoi_name, data in inputs.ee_features.items():
+        cells = _load_aoi_cells(inputs, aoi_name)
+        if len(cells) < nb_cells:
+            return None
+        area_stats[aoi_name] = _cells_area_stats(inputs, cells, data)
+
+    return {inputs.recipe_name: area_stats}
+
+
+async def _get_aoi_delta_async(
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    compute: Callable[[List[Cell]], Awaitable[dict]],
+) -> AreaStats:
+    """Compute the cells of an AOI missing from the store and merge them.
+
+    Args:
+        inputs: the inputs of the statistics.
+        aoi_name: the name of the AOI.
+        data: the AOI feature, color and scale.
+        compute: computes the listed cells, returns them as a partial
+            ``AreaStats``.
+    """
+    cells = _load_aoi_cells(inputs, aoi_name)
+    missing = [cell for cell in _aoi_cells(inputs) if cell not in cells]
+
+    if missing:
+        if cells:
+            logger.debug(
+                f"Reusing {len(cells)} stored statistic(s) of '{aoi_name}', "
+                f"computing {len(missing)}"
+            )
+        computed = _area_stats_cells(await compute(missing))
+        _save_aoi_cells(inputs, aoi_name, computed)
+        cells.update(computed)
+
+    return _cells_area_stats(inputs, cells, data)
+
+
+def _log_inputs(inputs: _StatsInputs, mode: str) -> None:
     logger.info(
-        f"Computing statistics for {len(ee_features)} AOI(s) with "
-        f"{len(benefit_list)} benefit(s), {len(cost_list)} cost(s), "
-        f"{len(constraint_list)} constraint(s)"
+        f"[{mode}] Computing statistics for {len(inputs.ee_features)} AOI(s) with "
+        f"{len(inputs.benefit_list)} benefit(s), {len(inputs.cost_list)} cost(s), "
+        f"{len(inputs.constraint_list)} constraint(s)"
+    )
+
+
+def _aoi_stats_graph(
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    cells: Optional[List[Cell]] = None,
+) -> ee.Dictionary:
+    """Build the graph of the statistics of an AOI, computed in one request.
+
+    Args:
+        inputs: the inputs of the statistics.
+        aoi_name: the name of the AOI.
+        data: the AOI feature, color and scale.
+        cells: the cells to compute, all of them by default.
+    """
+    aoi, mask, scale = data["ee_feature"], inputs.mask_out_areas, data["scale"]
+    cells = set(_aoi_cells(inputs) if cells is None else cells)
+
+    def layers(theme, layer_list):
+        return [layer for layer in layer_list if (theme, layer[1]) in cells]
+
+    stats = {"color": data["color"]}
+
+    if ("suitability", "suitability") in cells:
+        stats["suitability"] = get_image_stats(inputs.wlc_out, mask, aoi, scale)
+
+    benefit_list = layers("benefit", inputs.benefit_list)
+    if benefit_list:
+        main_aoi = is_main_aoi(inputs.main_ee_name, aoi_name)
+        stats["benefit"] = get_benefits_mean(benefit_list, aoi, mask, main_aoi, scale)
+
+    cost_list = layers("cost", inputs.cost_list)
+    if cost_list:
+        stats["cost"] = get_costs_sum(cost_list, aoi, mask, scale)
+
+    # the exclusive coverage depends on every constraint, they are reduced together
+    if layers("constraint", inputs.constraint_list):
+        stats["constraint"] = get_constraints_cover(inputs.constraint_list, aoi, scale)
+
+    return ee.Dictionary(stats)
+
+
+def _aoi_stats_items(
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    cells: Optional[List[Cell]] = None,
+) -> List[Tuple[str, str, Callable[[Escalation], ee.ComputedObject]]]:
+    """List the statistics of an AOI as (theme, layer name, graph builder).
+
+    A builder returns the graph of its statistic reduced with the settings of
+    an escalation. The constraints are a single item, named by the tuple of
+    their names, as the exclusive coverage of each depends on all of them. Only
+    the items of the listed cells are built, all of them by default.
+    """
+    aoi, mask, scale = data["ee_feature"], inputs.mask_out_areas, data["scale"]
+    main_aoi = is_main_aoi(inputs.main_ee_name, aoi_name)
+
+    items = [
+        (
+            "suitability",
+            "suitability",
+            partial(get_image_stats, inputs.wlc_out, mask, aoi, scale),
+        )
+    ]
+    items += [
+        (
+            "benefit",
+            name,
+            partial(get_image_mean, image, aoi, mask, name, main_aoi, scale),
+        )
+        for image, name in inputs.benefit_list
+    ]
+    items += [
+        ("cost", name, partial(get_image_sum, image, aoi, mask, name, scale))
+        for image, name in inputs.cost_list
+    ]
+    if inputs.constraint_list:
+        items.append(
+            (
+                "constraint",
+                tuple(name for _, name in inputs.constraint_list),
+                partial(get_constraints_cover, inputs.constraint_list, aoi, scale),
+            )
+        )
+
+    if cells is not None:
+        items = [item for item in items if set(_item_cells(item)) & set(cells)]
+
+    return items
+
+
+def _item_cells(item: tuple) -> List[Cell]:
+    """The cells of a statistics item (see ``_aoi_stats_items``)."""
+    theme, names, _ = item
+    return [(theme, name) for name in (names if isinstance(names, tuple) else [names])]
+
+
+async def _get_aoi_items_async(
+    gee_interface: GEEInterface,
+    limiter: AdaptiveLimiter,
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    cells: Optional[List[Cell]] = None,
+) -> AreaStats:
+    """Compute the statistics of an AOI with one request per statistic.
+
+    A statistic running out of memory or pixels is retried on its own with
+    escalated settings, recorded in its ``escalation``. A layer failing for
+    another reason than rate limits is reported with an error entry instead of
+    failing the whole AOI.
+    """
+    items = _aoi_stats_items(inputs, aoi_name, data, cells)
+
+    async def request(theme, build):
+        def escalated(escalation):
+            graph = build(escalation=escalation)
+            return limiter.run(lambda: gee_interface.get_info_async(graph))
+
+        result, escalation = await run_escalated(escalated)
+        if escalation != Escalation():
+            # the statistics of a layer are wrapped in its name, not the suitability
+            if theme == "suitability":
+                contents = [result]
+            else:
+                layers = result if isinstance(result, list) else [result]
+                contents = [next(iter(layer.values())) for layer in layers]
+            for content in contents:
+                content["escalation"] = escalation._asdict()
+
+        return result
+
+    results = await asyncio.gather(
+        *[request(theme, build) for theme, _, build in items],
+        return_exceptions=True,
     )
 
-    # Process each AOI sequentially to avoid concurrent aggregation limits
-    # This prevents "Too many concurrent aggregations" errors with many layers
-    result = {recipe_name: {}}
+    aoi_result = {
+        "suitability": None,
+        "benefit": [],
+        "cost": [],
+        "constraint": [],
+        "color": data["color"],
+    }
+    for item, res in zip(items, results):
+        theme, name, _ = item
+        if isinstance(res, Exception):
+            logger.error(f"[BATCHED] Failed to process {theme} '{name}': {res}")
+            if theme == "suitability" or is_rate_limit_error(res):
+                raise res
+            aoi_result[theme] += [
+                {name: {"values": {}, "total": [0], "error": str(res)}}
+                for _, name in _item_cells(item)
+            ]
+        elif theme == "suitability":
+            aoi_result["suitability"] = res
+        elif isinstance(res, list):
+            aoi_result[theme] += res
+        else:
+            aoi_result[theme].append(res)
+
+    logger.debug(f"[BATCHED] Completed AOI: {aoi_name}")
+    return aoi_result
+
+
+async def _get_aoi_stats_async(
+    gee_interface: GEEInterface,
+    limiter: AdaptiveLimiter,
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    cells: Optional[List[Cell]] = None,
+) -> AreaStats:
+    """Compute the statistics of an AOI in one request.
+
+    If the request stays rate limited after its retries or runs out of memory
+    or pixels, the AOI is split in one request per statistic.
+    """
+    graph = _aoi_stats_graph(inputs, aoi_name, data, cells)
+
+    try:
+        result = await limiter.run(lambda: gee_interface.get_info_async(graph))
+    except Exception as e:
+        if not (is_rate_limit_error(e) or is_resource_error(e)):
+            raise
+        logger.warning(
+            f"Statistics of '{aoi_name}' failed ({e}), "
+            "computing them with one request per layer..."
+        )
+        return await _get_aoi_items_async(
+            gee_interface, limiter, inputs, aoi_name, data, cells
+        )
+
+    logger.debug(f"Completed statistics for AOI: {aoi_name}")
+    return result
+
+
+async def _iter_summary_statistics_per_aoi(
+    gee_interface: GEEInterface, limiter: AdaptiveLimiter, inputs: _StatsInputs
+) -> AsyncIterator[RecipeStatsDict]:
+    """Yield the AOIs computed so far each time the next AOI in order is done.
+
+    The requests of all the AOIs run concurrently within the limiter; an AOI
+    completed before the ones preceding it is kept until they are done. Only
+    the statistics missing from the store are requested.
+    """
+    _log_inputs(inputs, "PER AOI")
+
+    async def get_aoi_stats(aoi_name, data):
+        def compute(cells):
+            return _get_aoi_stats_async(
+                gee_interface, limiter, inputs, aoi_name, data, cells
+            )
+
+        stats = await _get_aoi_delta_async(inputs, aoi_name, data, compute)
+        return aoi_name, stats
+
+    aoi_names = list(inputs.ee_features)
+    tasks = [
+        asyncio.ensure_future(get_aoi_stats(aoi_name, data))
+        for aoi_name, data in inputs.ee_features.items()
+    ]
+
+    completed, nb_ready = {}, 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            aoi_name, stats = await next_done
+            completed[aoi_name] = stats
+
+            ready = list(takewhile(lambda name: name in completed, aoi_names))
+            if len(ready) > nb_ready:
+                nb_ready = len(ready)
+                yield {inputs.recipe_name: {name: completed[name] for name in ready}}
+    finally:
+        # stop the remaining requests if the consumer stops early or one fails
+        for task in tasks:
+            task.cancel()
+
+    logger.info(f"Successfully computed statistics for all {len(aoi_names)} AOI(s)")
+
+
+async def _get_summary_statistics_sequential(
+    gee_interface: GEEInterface,
+    recipe: Recipe,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> RecipeStatsDict:
+    """Per-AOI processing (standard approach).
+
+    Builds one request per AOI. The requests run concurrently within the limits
+    of the adaptive limiter, starting from a single request in flight.
+    """
+    inputs = await _get_stats_inputs(gee_interface, recipe)
+    limiter = limiter or AdaptiveLimiter(initial=1)
+
+    summary_stats = {}
+    async for summary_stats in _iter_summary_statistics_per_aoi(
+        gee_interface, limiter, inputs
+    ):
+        pass
+
+    return summary_stats
+
+
+AOI_KEY = "seplan_aoi"
+"""Property tagging each feature of the zone collection with its AOI index."""
+
+
+def _zone_reductions(
+    image: ee.Image,
+    code_image: Optional[ee.Image],
+    ee_features: Dict[str, dict],
+    scale: int,
+) -> ee.FeatureCollection:
+    """Reduce the zone images over every AOI, in features tagged with ``AOI_KEY``.
+
+    Each AOI is reduced as a whole, with the images masked to it (see
+    ``_reduce_region_aoi``): the pixels of overlapping features of an AOI count
+    once, and there is a single feature per AOI whatever its number of features.
+    The AOIs are not dissolved and only the statistics are downloaded, not the
+    AOI geometries.
+    """
+    escalation = Escalation(tile_scale=4)
+
+    def reduce(aoi, idx):
+        stats = _reduce_region_aoi(
+            image,
+            aoi,
+            scale,
+            escalation,
+            reducer=ee.Reducer.sum().combine(ee.Reducer.minMax(), sharedInputs=True),
+            maxPixels=1e12,
+        )
+
+        # the constraint areas grouped by code, downloaded in the same request
+        if code_image is not None:
+            groups = _reduce_region_aoi(
+                code_image,
+                aoi,
+                scale,
+                escalation,
+                reducer=ee.Reducer.sum().group(1, "code"),
+                maxPixels=1e12,
+            )
+            stats = stats.combine(groups)
+
+        return ee.Feature(None, stats).set(AOI_KEY, idx)
+
+    return ee.FeatureCollection(
+        [
+            reduce(data["ee_feature"], idx)
+            for idx, data in enumerate(ee_features.values())
+        ]
+    )
+
+
+def get_zone_image(
+    wlc_out: ee.Image,
+    mask: ee.Image,
+    benefit_list: list,
+    cost_list: list,
+    constraint_list: list,
+) -> ee.Image:
+    """Stack every statistic of the recipe as additive bands of one image.
+
+    Summing these bands over a zone gives the dashboard statistics: areas in ha
+    for the suitability classes, value sums and pixel counts for the benefit
+    means (minMax of the same bands for their range) and masked/unmasked value
+    sums for the costs. The constraints are reduced by ``get_constraint_code_image``
+    when they fit in a packed band, otherwise the excluded land of each of them
+    is a band too.
+    """
+    area = ee.Image.pixelArea().divide(10000)
+    suitability = wlc_out.unmask(6).round()
+
+    bands = [area.rename("area")]
+    bands += [
+        area.updateMask(suitability.eq(code)).rename(f"suitability_{code}")
+        for code in range(1, 7)
+    ]
+
+    for i, (image, _) in enumerate(benefit_list):
+        benefit = image.select(0).updateMask(mask)
+        bands += [
+            benefit.rename(f"benefit_{i}"),
+            ee.Image(1).updateMask(benefit.mask()).rename(f"benefit_{i}_count"),
+        ]
+
+    bands += _cost_bands(cost_list, mask)
+
+    if len(constraint_list) > MAX_PACKED_CONSTRAINTS:
+        bands += [
+            area.updateMask(image.unmask(0).eq(0)).rename(f"constraint_{i}")
+            for i, (image, _) in enumerate(constraint_list)
+        ]
+
+    return ee.Image.cat(bands)
 
-    for aoi_name, data in ee_features.items():
-        logger.debug(f"Computing statistics for AOI: {aoi_name}")
 
-        # Build the computation graph for this AOI
-        aoi_dict = ee.Dictionary(
+def get_constraint_code_image(constraint_list: list) -> Optional[ee.Image]:
+    """The area in ha and the packed constraints, to reduce grouped by code.
+
+    Same reduction as ``get_constraints_cover``: the areas grouped by code give
+    the coverage of every constraint and its exclusive coverage. None when
+    there is no constraint or when they don't fit in a band.
+    """
+    if not constraint_list or len(constraint_list) > MAX_PACKED_CONSTRAINTS:
+        return None
+
+    area = ee.Image.pixelArea().divide(10000)
+    return area.addBands(pack_constraints(constraint_list))
+
+
+def decode_constraint_groups(
+    groups: Dict[int, float], nb_constraints: int
+) -> Tuple[float, List[Optional[float]], List[Optional[float]]]:
+    """Decode the areas grouped by packed constraint code.
+
+    Args:
+        groups: the area of every code, as reduced by ``get_constraint_code_image``.
+        nb_constraints: the number of packed constraints.
+
+    Returns:
+        The total area, the percentage of it masked by each constraint and the
+        percentage masked by each constraint only.
+    """
+    total = sum(groups.values())
+
+    def percent(selected) -> Optional[float]:
+        if not total:
+            return None
+        area = sum(area for code, area in groups.items() if selected(code))
+        return area * 100 / total
+
+    percents, exclusives = [], []
+    for i in range(nb_constraints):
+        bit = 1 << i
+        percents.append(percent(lambda code: code & bit))
+        exclusives.append(percent(lambda code: code == bit))
+
+    return total, percents, exclusives
+
+
+def _aggregate_zones(features: List[dict], nb_aois: int) -> List[dict]:
+    """Aggregate the reduction properties of the features by AOI.
+
+    Sums are added, minimums and maximums are reduced, missing values (fully
+    masked features) are skipped. The areas grouped by constraint code are
+    added code by code in "groups".
+    """
+    aggregated = [{} for _ in range(nb_aois)]
+    for feature in features:
+        properties = dict(feature["properties"])
+        zone = aggregated[int(properties.pop(AOI_KEY))]
+        for key, value in properties.items():
+            if value is None:
+                continue
+            if key == "groups":
+                groups = zone.setdefault("groups", {})
+                for group in value:
+                    code = int(group["code"])
+                    groups[code] = groups.get(code, 0) + group["sum"]
+            elif key not in zone:
+                zone[key] = value
+            elif key.endswith("_sum"):
+                zone[key] += value
+            elif key.endswith("_min"):
+                zone[key] = min(zone[key], value)
+            elif key.endswith("_max"):
+                zone[key] = max(zone[key], value)
+
+    return aggregated
+
+
+def _zone_to_area_stats(
+    zone: dict,
+    benefit_list: list,
+    cost_list: list,
+    constraint_list: list,
+    main_aoi: bool,
+    color: str,
+) -> dict:
+    """Build the ``AreaStats`` of an AOI from its aggregated band sums."""
+    area = zone.get("area_sum", 0)
+
+    def ratio(numerator, denominator):
+        return numerator / denominator if denominator else None
+
+    suitability = [
+        {"image": code, "sum": zone[f"suitability_{code}_sum"]}
+        for code in range(1, 7)
+        if zone.get(f"suitability_{code}_sum")
+    ]
+
+    benefits = []
+    for i, (_, name) in enumerate(benefit_list):
+        mean = ratio(
+            zone.get(f"benefit_{i}_sum", 0), zone.get(f"benefit_{i}_count_sum")
+        )
+        # like get_image_mean, the range is only computed for the main aoi
+        min_ = zone.get(f"benefit_{i}_min", 0) if main_aoi else 0
+        max_ = zone.get(f"benefit_{i}_max", 0) if main_aoi else 0
+        benefits.append(
+            {
+                name: {
+                    "total": [mean],
+                    "values": {"mean": mean, "max": max_, "min": min_},
+                }
+            }
+        )
+
+    costs = [
+        {
+            name: {
+                "total": [ratio(zone.get(f"cost_{i}_total_sum", 0), area)],
+                "values": {"sum": ratio(zone.get(f"cost_{i}_kept_sum", 0), area)},
+            }
+        }
+        for i, (_, name) in enumerate(cost_list)
+    ]
+
+    if len(constraint_list) > MAX_PACKED_CONSTRAINTS:
+        constraints = [
             {
-                "suitability": get_image_stats(
-                    wlc_out, mask_out_areas, data["ee_feature"]
-                ),
-                "benefit": [
-                    get_image_mean(
-                        image,
-                        data["ee_feature"],
-                        mask_out_areas,
-                        name,
-                        is_main_aoi(main_ee_name, aoi_name),
-                    )
-                    for image, name in benefit_list
-                ],
-                "cost": [
-                    get_image_sum(image, data["ee_feature"], mask_out_areas, name)
-                    for image, name in cost_list
-                ],
-                "constraint": [
-                    get_image_percent_cover_pixelarea(image, data["ee_feature"], name)
-                    for image, name in constraint_list
-                ],
-                "color": data["color"],
+                name: {
+                    "values": {
+                        "percent": ratio(zone.get(f"constraint_{i}_sum", 0) * 100, area)
+                    },
+                    "total": [area],
+                }
             }
+            for i, (_, name) in enumerate(constraint_list)
+        ]
+    else:
+        total, percents, exclusives = decode_constraint_groups(
+            zone.get("groups", {}), len(constraint_list)
         )
+        constraints = [
+            {
+                name: {
+                    "values": {"percent": percents[i], "exclusive": exclusives[i]},
+                    "total": [total],
+                }
+            }
+            for i, (_, name) in enumerate(constraint_list)
+        ]
+
+    return {
+        "suitability": {
+            "values": suitability,
+            "total": sum(v["sum"] for v in suitability),
+        },
+        "benefit": benefits,
+        "cost": costs,
+        "constraint": constraints,
+        "color": color,
+    }
+
+
+async def _get_summary_statistics_collection(
+    gee_interface: GEEInterface,
+    recipe: Recipe,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> RecipeStatsDict:
+    """Grouped processing of the AOIs, one request per chunk of them.
+
+    Every statistic is a band of one image, reduced with a combined sum/minMax
+    reducer, so one request per chunk of sub-AOIs sharing a scale replaces
+    their per-AOI requests (see ``_zone_reductions``). The per-AOI results are
+    unpacked back into the ``RecipeStatsDict``.
+    """
+    inputs = await _get_stats_inputs(gee_interface, recipe)
+    limiter = limiter or AdaptiveLimiter(initial=1)
 
-        # Process this AOI's statistics (one AOI at a time)
-        result[recipe_name][aoi_name] = await gee_interface.get_info_async(aoi_dict)
-        logger.debug(f"Completed statistics for AOI: {aoi_name}")
+    return await _compute_collection_statistics(gee_interface, limiter, inputs)
+
+
+COLLECTION_CHUNK = 5
+"""Sub-AOIs reduced in one request of the collection, so the dashboard is
+updated as each chunk of them is done."""
+
+
+def _collection_groups(inputs: _StatsInputs) -> List[Tuple[int, Dict[str, dict]]]:
+    """Split the AOIs in the requests of the collection.
+
+    The AOIs are grouped by scale and in chunks of ``COLLECTION_CHUNK``, the
+    primary AOI in its own request so that it's displayed first.
+    """
+    by_scale: Dict[int, List[str]] = {}
+    groups = []
+    for aoi_name, data in inputs.ee_features.items():
+        if is_main_aoi(inputs.main_ee_name, aoi_name):
+            groups.append((data["scale"], {aoi_name: data}))
+        else:
+            by_scale.setdefault(data["scale"], []).append(aoi_name)
+
+    for scale, aoi_names in by_scale.items():
+        for i in range(0, len(aoi_names), COLLECTION_CHUNK):
+            chunk = aoi_names[i : i + COLLECTION_CHUNK]
+            groups.append((scale, {name: inputs.ee_features[name] for name in chunk}))
+
+    return groups
+
+
+async def _compute_collection_statistics(
+    gee_interface: GEEInterface, limiter: AdaptiveLimiter, inputs: _StatsInputs
+) -> RecipeStatsDict:
+    """Compute every statistic of every AOI and store them."""
+    result = {}
+    async for result in _iter_collection_statistics(gee_interface, limiter, inputs):
+        pass
 
-    logger.info(f"Successfully computed statistics for all {len(ee_features)} AOI(s)")
     return result
 
 
+async def _iter_collection_statistics(
+    gee_interface: GEEInterface, limiter: AdaptiveLimiter, inputs: _StatsInputs
+) -> AsyncIterator[RecipeStatsDict]:
+    """Compute every statistic of every AOI, yielding them as they are done.
+
+    The AOIs of a request (see ``_collection_groups``) are reduced together,
+    the requests run concurrently within the limiter. Like the per-AOI path,
+    every yield holds the AOIs done so far in their order and the statistics
+    are stored as each request is done.
+    """
+    _log_inputs(inputs, "COLLECTION MODE")
+    ee_features = inputs.ee_features
+
+    image = get_zone_image(
+        inputs.wlc_out,
+        inputs.mask_out_areas,
+        inputs.benefit_list,
+        inputs.cost_list,
+        inputs.constraint_list,
+    )
+    code_image = get_constraint_code_image(inputs.constraint_list)
+
+    async def reduce_group(scale, group):
+        reduced = _zone_reductions(image, code_image, group, scale)
+        info = await limiter.run(lambda: gee_interface.get_info_async(reduced))
+        features = info["features"]
+
+        stats, storable = {}, {}
+        for aoi_name, zone in zip(group, _aggregate_zones(features, len(group))):
+            data = group[aoi_name]
+            area_stats = _zone_to_area_stats(
+                zone,
+                inputs.benefit_list,
+                inputs.cost_list,
+                inputs.constraint_list,
+                is_main_aoi(inputs.main_ee_name, aoi_name),
+                data["color"],
+            )
+            cells = _area_stats_cells(area_stats)
+            storable.update(_storable_aoi_cells(inputs, aoi_name, cells))
+            stats[aoi_name] = _cells_area_stats(inputs, cells, data)
+
+        # a single write to the store for the whole chunk
+        save_cells(storable)
+
+        return stats
+
+    aoi_names = list(ee_features)
+    tasks = [
+        asyncio.ensure_future(reduce_group(scale, group))
+        for scale, group in _collection_groups(inputs)
+    ]
+
+    completed, nb_ready = {}, 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            completed.update(await next_done)
+
+            ready = list(takewhile(lambda name: name in completed, aoi_names))
+            if len(ready) > nb_ready:
+                nb_ready = len(ready)
+                yield {inputs.recipe_name: {name: completed[name] for name in ready}}
+    finally:
+        # stop the remaining requests if the consumer stops early or one fails
+        for task in tasks:
+            task.cancel()
+
+    logger.info(
+        f"[COLLECTION MODE] Successfully computed statistics for all {len(ee_features)} AOI(s)"
+    )
+
+
 async def _get_summary_statistics_batched(
-    gee_interface: GEEInterface, recipe: Recipe, batch_size: int = 3
+    gee_interface: GEEInterface,
+    recipe: Recipe,
+    batch_size: int = 3,
+    limiter: Optional[AdaptiveLimiter] = None,
 ) -> RecipeStatsDict:
-    """Batched parallel processing fallback for very complex recipes.
+    """Per-layer processing fallback for very complex recipes.
 
-    This method processes statistics in controlled parallel batches. Instead of running
-    all operations at once or one-by-one, it runs a limited number concurrently (batch_size).
-    This balances speed and reliability by staying under GEE's concurrent operation limits.
+    Every statistic of every AOI is its own request, so each aggregation stays
+    small. At most batch_size requests run concurrently; a request rejected for
+    rate limits is retried on its own with a backoff. Only the statistics
+    missing from the store are requested.
 
     Args:
         gee_interface: The GEE interface for async operations
         recipe: The recipe to compute statistics for
-        batch_size: Number of operations to run concurrently per batch (default: 3)
+        batch_size: Maximum number of concurrent requests (default: 3)
+        limiter: The limiter to share with other requests, one bounded by
+            batch_size is created by default.
 
     Returns:
         RecipeStatsDict with all computed statistics
     """
-    if not recipe:
-        raise ValueError("There is no recipe to get statistics from.")
+    inputs = await _get_stats_inputs(gee_interface, recipe)
+    limiter = limiter or AdaptiveLimiter(initial=batch_size, maximum=batch_size)
+    _log_inputs(inputs, "BATCHED MODE")
+
+    def get_aoi_stats(aoi_name, data):
+        def compute(cells):
+            return _get_aoi_items_async(
+                gee_interface, limiter, inputs, aoi_name, data, cells
+            )
 
-    if not recipe.recipe_session_path:
-        raise ValueError(
-            "You can only export the dashboard data for the current recipe, load or create a recipe first in the recipe section"
-        )
+        return _get_aoi_delta_async(inputs, aoi_name, data, compute)
 
-    seplan_model = recipe.seplan
-    recipe_name = recipe.get_recipe_name()
+    results = await asyncio.gather(
+        *[
+            get_aoi_stats(aoi_name, data)
+            for aoi_name, data in inputs.ee_features.items()
+        ]
+    )
 
-    # Get all inputs from the model
-    main_ee_features, secondary_ee_features = seplan_model.aoi_model.get_ee_features()
-    main_ee_name = list(main_ee_features.keys())[0]
+    logger.info(
+        f"[BATCHED MODE] Successfully computed statistics for all {len(inputs.ee_features)} AOI(s)"
+    )
+    return {inputs.recipe_name: dict(zip(inputs.ee_features, results))}
 
-    ee_features = {**main_ee_features, **secondary_ee_features}
 
-    # get list of benefits and names
-    benefit_list = seplan_model.get_benefits_list()
+ESTIMATE_POINTS = 4000
+"""Sample points of an AOI in the quick estimate. It's a ±1.5% margin on the
+proportions at 95% confidence, and stays under the 5000 elements a request can
+download."""
 
-    # List of masked out constraints and names
-    constraint_list = seplan_model.get_masked_constraints_list()
+ESTIMATE_Z = 1.96
+"""Normal quantile of the 95% confidence intervals of the quick estimate."""
 
-    # Extract only the image from the constraint list and reduce to single mask
-    mask_out_areas = reduce_constraints(constraint_list)
+ESTIMATE_SEED = 0
+"""Seed of the sample points, so an estimate is reproducible."""
 
-    # List of normalized costs and names
-    cost_list = seplan_model.get_costs_list()
+ESTIMATE_GRID = 4
+"""Cells per side of the grid splitting every feature of an AOI in strata."""
 
-    # Get the restoration suitability index
-    wlc_out = seplan_model.get_constraint_index()
 
-    logger.info(
-        f"[BATCHED MODE] Computing statistics for {len(ee_features)} AOI(s) with "
-        f"{len(benefit_list)} benefit(s), {len(cost_list)} cost(s), "
-        f"{len(constraint_list)} constraint(s) - parallel batch size: {batch_size}"
+async def get_estimated_statistics_async(
+    gee_interface: GEEInterface, recipe: Recipe, nb_points: int = ESTIMATE_POINTS
+) -> RecipeStatsDict:
+    """Quickly estimate the summary statistics from random points in the AOIs.
+
+    Every layer is read at stratified random points (see ``_estimate_strata``
+    and ``_estimate_points``) in one request per AOI, and the same
+    ``RecipeStatsDict`` fields are estimated, weighted by the area of the strata,
+    with the half-width of their 95% confidence interval (``ci``, ``mean_ci``,
+    ``sum_ci``, ``percent_ci``). The benefit range is the one of the sample. The
+    estimates are never stored.
+
+    Args:
+        gee_interface: The GEE interface for async operations
+        recipe: The recipe to estimate the statistics of
+        nb_points: The number of sample points of each AOI.
+    """
+    inputs = await _get_stats_inputs(gee_interface, recipe)
+    limiter = AdaptiveLimiter()
+    _log_inputs(inputs, "ESTIMATE")
+
+    image = get_estimate_image(
+        inputs.wlc_out,
+        inputs.mask_out_areas,
+        inputs.benefit_list,
+        inputs.cost_list,
+        inputs.constraint_list,
     )
 
-    # Process each AOI separately to reduce concurrent operations
-    result = {recipe_name: {}}
+    async def estimate(aoi_name, data):
+        areas = _estimate_strata(data["ee_feature"])
+        samples = image.reduceRegions(
+            collection=_estimate_points(areas, nb_points, ESTIMATE_SEED),
+            reducer=ee.Reducer.first(),
+            scale=data["scale"],
+            tileScale=4,
+        )
 
-    for aoi_name, data in ee_features.items():
-        logger.debug(f"[BATCHED] Processing AOI: {aoi_name}")
+        # only download the sampled values, not the point geometries
+        graph = ee.Dictionary(
+            {
+                "area": ee.Number(areas.aggregate_sum("area")).divide(10000),
+                "samples": samples.select([".*"], None, False),
+            }
+        )
+        info = await limiter.run(lambda: gee_interface.get_info_async(graph))
+        samples = [feature["properties"] for feature in info["samples"]["features"]]
 
-        aoi_result = {
-            "suitability": None,
-            "benefit": [],
-            "cost": [],
-            "constraint": [],
-            "color": data["color"],
-        }
+        return _estimate_area_stats(inputs, aoi_name, data, samples, info["area"])
 
-        # Process suitability first
-        suitability_dict = get_image_stats(wlc_out, mask_out_areas, data["ee_feature"])
-        aoi_result["suitability"] = await gee_interface.get_info_async(suitability_dict)
+    results = await asyncio.gather(
+        *[estimate(aoi_name, data) for aoi_name, data in inputs.ee_features.items()]
+    )
 
-        # Process benefits in parallel batches
-        if benefit_list:
-            logger.debug(
-                f"[BATCHED] Processing {len(benefit_list)} benefits in parallel batches of {batch_size}"
-            )
-            for i in range(0, len(benefit_list), batch_size):
-                batch = benefit_list[i : i + batch_size]
-
-                # Create all tasks for this batch
-                tasks = []
-                for image, name in batch:
-                    benefit_dict = get_image_mean(
-                        image,
-                        data["ee_feature"],
-                        mask_out_areas,
-                        name,
-                        is_main_aoi(main_ee_name, aoi_name),
-                    )
-                    tasks.append(gee_interface.get_info_async(benefit_dict))
-
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for idx, batch_res in enumerate(batch_results):
-                    if isinstance(batch_res, Exception):
-                        _, name = batch[idx]
-                        logger.error(
-                            f"[BATCHED] Failed to process benefit '{name}': {batch_res}"
-                        )
-                        error_msg = str(batch_res).lower()
-                        if "429" in error_msg or "resource_exhausted" in error_msg:
-                            raise batch_res
-                        aoi_result["benefit"].append(
-                            {name: {"values": {}, "total": [0], "error": str(batch_res)}}
-                        )
-                    else:
-                        aoi_result["benefit"].append(batch_res)
-
-                logger.debug(
-                    f"[BATCHED] Completed benefit batch {i//batch_size + 1} ({len(batch)} items)"
-                )
+    return {inputs.recipe_name: dict(zip(inputs.ee_features, results))}
 
-        if cost_list:
-            logger.debug(
-                f"[BATCHED] Processing {len(cost_list)} costs in parallel batches of {batch_size}"
-            )
-            for i in range(0, len(cost_list), batch_size):
-                batch = cost_list[i : i + batch_size]
-
-                tasks = []
-                for image, name in batch:
-                    cost_dict = get_image_sum(
-                        image, data["ee_feature"], mask_out_areas, name
-                    )
-                    tasks.append(gee_interface.get_info_async(cost_dict))
-
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for idx, batch_res in enumerate(batch_results):
-                    if isinstance(batch_res, Exception):
-                        _, name = batch[idx]
-                        logger.error(
-                            f"[BATCHED] Failed to process cost '{name}': {batch_res}"
-                        )
-                        error_msg = str(batch_res).lower()
-                        if "429" in error_msg or "resource_exhausted" in error_msg:
-                            raise batch_res
-                        aoi_result["cost"].append(
-                            {name: {"values": {}, "total": [0], "error": str(batch_res)}}
-                        )
-                    else:
-                        aoi_result["cost"].append(batch_res)
-
-                logger.debug(
-                    f"[BATCHED] Completed cost batch {i//batch_size + 1} ({len(batch)} items)"
-                )
 
-        if constraint_list:
-            logger.debug(
-                f"[BATCHED] Processing {len(constraint_list)} constraints in parallel batches of {batch_size}"
+def _estimate_strata(aoi, grid: int = ESTIMATE_GRID) -> ee.FeatureCollection:
+    """Split the features of an AOI in the strata of the quick estimate.
+
+    Every feature is cut along a ``grid`` x ``grid`` grid of its bounding box:
+    the non-empty parts are the strata, tagged with a ``stratum`` id and their
+    ``area`` in m². A single-polygon AOI is thus sampled evenly over its extent.
+    The features are never dissolved.
+    """
+
+    def split(feat):
+        geom = feat.geometry()
+        ring = ee.List(geom.bounds(maxError=100).coordinates().get(0))
+        lower, upper = ee.List(ring.get(0)), ee.List(ring.get(2))
+        xmin, ymin = lower.getNumber(0), lower.getNumber(1)
+        dx = upper.getNumber(0).subtract(xmin).divide(grid)
+        dy = upper.getNumber(1).subtract(ymin).divide(grid)
+
+        def cell(k):
+            k = ee.Number(k)
+            x = xmin.add(dx.multiply(k.mod(grid)))
+            y = ymin.add(dy.multiply(k.divide(grid).floor()))
+            rect = ee.Geometry.Rectangle([x, y, x.add(dx), y.add(dy)], None, False)
+            part = geom.intersection(rect, maxError=100)
+            stratum = ee.String(feat.id()).cat("_").cat(k.format("%d"))
+            return ee.Feature(
+                part, {"area": part.area(maxError=100), "stratum": stratum}
             )
-            for i in range(0, len(constraint_list), batch_size):
-                batch = constraint_list[i : i + batch_size]
-
-                tasks = []
-                for image, name in batch:
-                    constraint_dict = get_image_percent_cover_pixelarea(
-                        image, data["ee_feature"], name
-                    )
-                    tasks.append(gee_interface.get_info_async(constraint_dict))
-
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for idx, batch_res in enumerate(batch_results):
-                    if isinstance(batch_res, Exception):
-                        _, name = batch[idx]
-                        logger.error(
-                            f"[BATCHED] Failed to process constraint '{name}': {batch_res}"
-                        )
-                        error_msg = str(batch_res).lower()
-                        if "429" in error_msg or "resource_exhausted" in error_msg:
-                            raise batch_res
-                        aoi_result["constraint"].append(
-                            {name: {"values": {}, "total": [0], "error": str(batch_res)}}
-                        )
-                    else:
-                        aoi_result["constraint"].append(batch_res)
-
-                logger.debug(
-                    f"[BATCHED] Completed constraint batch {i//batch_size + 1} ({len(batch)} items)"
-                )
 
-        result[recipe_name][aoi_name] = aoi_result
-        logger.debug(f"[BATCHED] Completed AOI: {aoi_name}")
+        return ee.FeatureCollection(ee.List.sequence(0, grid * grid - 1).map(cell))
 
-    logger.info(
-        f"[BATCHED MODE] Successfully computed statistics for all {len(ee_features)} AOI(s)"
+    return (
+        ee.FeatureCollection(aoi).map(split).flatten().filter(ee.Filter.gt("area", 0))
     )
-    return result
 
 
-def get_image_stats(image, mask, geom):
+def _estimate_points(
+    areas: ee.FeatureCollection, nb_points: int, seed: int
+) -> ee.FeatureCollection:
+    """Stratified random points inside the strata of an AOI.
+
+    Every stratum gets a share of the points proportional to its area, rounded
+    randomly so the expected share is exact, and drawn with a seed of its own so
+    the strata of the same shape are sampled independently. The points carry
+    their ``stratum`` and its area (``stratum_area``) to weight the estimates.
+    """
+    total = ee.Number(areas.aggregate_sum("area"))
+
+    def allocate(feat):
+        share = ee.Number(feat.get("area")).divide(total).multiply(nb_points)
+        return feat.set("points", share.add(feat.get("random")).floor())
+
+    def points(feat):
+        stratum = {"stratum": feat.get("stratum"), "stratum_area": feat.get("area")}
+        stratum_seed = ee.Number(feat.get("seed")).multiply(2**31 - 1).toInt()
+        return ee.FeatureCollection.randomPoints(
+            feat.geometry(), ee.Number(feat.get("points")).int(), stratum_seed, 100
+        ).map(lambda point: point.set(stratum))
+
+    return (
+        areas.randomColumn("random", seed)
+        .randomColumn("seed", seed + 1)
+        .map(allocate)
+        .filter(ee.Filter.gt("points", 0))
+        .map(points)
+        .flatten()
+    )
+
+
+def get_estimate_image(
+    wlc_out: ee.Image,
+    mask: ee.Image,
+    benefit_list: list,
+    cost_list: list,
+    constraint_list: list,
+) -> ee.Image:
+    """Stack every layer of the recipe in the bands read at the sample points.
+
+    The suitability is 6 on the masked land, the benefits are masked by the
+    constraints, the costs are 0 where they are missing and the constraints are
+    1 on the land they exclude.
+    """
+    bands = [wlc_out.unmask(6).round().rename("suitability")]
+    bands += [
+        image.select(0).updateMask(mask).rename(f"benefit_{i}")
+        for i, (image, _) in enumerate(benefit_list)
+    ]
+    for i, (image, _) in enumerate(cost_list):
+        image = image.select(0)
+        bands += [
+            image.unmask(0).rename(f"cost_{i}_total"),
+            image.updateMask(mask).unmask(0).rename(f"cost_{i}_kept"),
+        ]
+    bands += [
+        image.unmask(0).eq(0).rename(f"constraint_{i}")
+        for i, (image, _) in enumerate(constraint_list)
+    ]
+
+    return ee.Image.cat(bands)
+
+
+def _variance(values: List[float]) -> float:
+    """The variance of the mean of a sample."""
+    n = len(values)
+    mean = sum(values) / n
+    return sum((value - mean) ** 2 for value in values) / (n - 1) / n
+
+
+def _estimate_mean(
+    samples: List[dict], value: Callable[[dict], Optional[float]]
+) -> Tuple[Optional[float], Optional[float]]:
+    """The stratified estimate of a mean and the half-width of its interval.
+
+    The strata are weighted by their area. A missing value (masked) leaves the
+    point out of the mean: the mean is the ratio of the estimated value total
+    to the estimated area with a value, and its variance is linearized. The
+    strata with a single point are collapsed to estimate their variance.
+
+    Args:
+        samples: the values at the points, with their ``stratum`` and
+            ``stratum_area``. Points without them are a single stratum.
+        value: the value of a point, None if it's missing.
+    """
+    strata: Dict[Optional[str], List[dict]] = {}
+    for sample in samples:
+        strata.setdefault(sample.get("stratum"), []).append(sample)
+
+    area = sum(points[0].get("stratum_area", 1) for points in strata.values())
+    totals, counts, weighted = 0.0, 0.0, []
+    for points in strata.values():
+        weight = points[0].get("stratum_area", 1) / area
+        values = [value(point) for point in points]
+        kept = [float(v is not None) for v in values]
+        values = [0.0 if v is None else float(v) for v in values]
+        totals += weight * sum(values) / len(points)
+        counts += weight * sum(kept) / len(points)
+        weighted.append((weight, values, kept))
+
+    if not counts:
+        return None, None
+
+    mean = totals / counts
+    if len(samples) == 1:
+        return mean, None
+
+    variance, single, single_weight = 0.0, [], 0.0
+    for weight, values, kept in weighted:
+        residuals = [(v - mean * k) / counts for v, k in zip(values, kept)]
+        if len(residuals) > 1:
+            variance += weight**2 * _variance(residuals)
+        else:
+            single += residuals
+            single_weight += weight
+
+    if len(single) > 1:
+        variance += single_weight**2 * _variance(single)
+
+    return mean, ESTIMATE_Z * math.sqrt(variance)
+
+
+def _estimate_area_stats(
+    inputs: _StatsInputs,
+    aoi_name: str,
+    data: dict,
+    samples: List[dict],
+    area: float,
+) -> AreaStats:
+    """Estimate the ``AreaStats`` of an AOI from the values at its sample points.
+
+    Args:
+        inputs: the inputs of the statistics.
+        aoi_name: the name of the AOI.
+        data: the AOI feature, color and scale.
+        samples: the band values of every point, a masked value is missing.
+        area: the area of the AOI in ha.
+    """
+
+    def values(band):
+        return [s[band] for s in samples if s.get(band) is not None]
+
+    def estimate(band):
+        return _estimate_mean(samples, lambda s: s.get(band))
+
+    def proportion(band, value=1):
+        """Share of the points where the band has the value, with its interval."""
+
+        def is_value(s):
+            return None if s.get(band) is None else float(s[band] == value)
+
+        return _estimate_mean(samples, is_value)
+
+    suitability = []
+    for code in range(1, 7):
+        share, ci = proportion("suitability", code)
+        if share:
+            ci = None if ci is None else ci * area
+            suitability.append({"image": code, "sum": share * area, "ci": ci})
+
+    main_aoi = is_main_aoi(inputs.main_ee_name, aoi_name)
+    benefits = []
+    for i, (_, name) in enumerate(inputs.benefit_list):
+        benefit = values(f"benefit_{i}")
+        mean, ci = estimate(f"benefit_{i}")
+        stats = {"mean": mean, "mean_ci": ci, "max": 0, "min": 0}
+        if main_aoi and benefit:
+            stats.update(max=max(benefit), min=min(benefit))
+        benefits.append({name: {"total": [mean], "values": stats}})
+
+    costs = []
+    for i, (_, name) in enumerate(inputs.cost_list):
+        total, _ = estimate(f"cost_{i}_total")
+        kept, ci = estimate(f"cost_{i}_kept")
+        costs.append({name: {"total": [total], "values": {"sum": kept, "sum_ci": ci}}})
+
+    # a point is excluded by a constraint only if no other one excludes it
+    bands = [f"constraint_{i}" for i in range(len(inputs.constraint_list))]
+
+    def excluded_only_by(s, i):
+        flags = [s.get(band) == 1 for band in bands]
+        return float(flags[i] and sum(flags) == 1)
+
+    constraints = []
+    for i, (_, name) in enumerate(inputs.constraint_list):
+        percent, ci = proportion(bands[i])
+        exclusive, _ = _estimate_mean(samples, partial(excluded_only_by, i=i))
+        constraints.append(
+            {
+                name: {
+                    "values": {
+                        "percent": None if percent is None else percent * 100,
+                        "percent_ci": None if ci is None else ci * 100,
+                        "exclusive": None if exclusive is None else exclusive * 100,
+                    },
+                    "total": [area],
+                }
+            }
+        )
+
+    analysis = _aoi_analysis(data)
+    analysis["estimate"] = {"points": len(samples), "confidence": 0.95}
+
+    return {
+        "suitability": {"values": suitability, "total": area},
+        "benefit": benefits,
+        "cost": costs,
+        "constraint": constraints,
+        "color": data["color"],
+        "analysis": analysis,
+    }
+
+
+def get_image_stats(image, mask, geom, scale=None, escalation=Escalation()):
     """Computes the summary areas of suitability image based on region and masked land in HA.
 
     Args:
         image (eeimage): restoration suitability values 1 to 5
         mask (eeimage): mask of unsuitable land
         geom (eegeomerty): an earth engine geometry
-        scale (int, optional): scale to reduce area by. Defaults to 100.
+        scale (int, optional): scale to reduce area by. Defaults to STATS_SCALE_M.
+        escalation (Escalation, optional): the settings of the reduction.
 
     Returns:
         eedictionary : a dictionary of suitability with the name of the region of intrest, list of values for each category, and total area.
@@ -380,7 +1620,8 @@ def get_image_stats(image, mask, geom):
         composite,
         geom,
         reducer=ee.Reducer.sum().group(1, "image"),
-        scale=STATS_SCALE_M,
+        scale=scale,
+        escalation=escalation,
         maxPixels=1e12,
     ).get("groups")
 
@@ -393,7 +1634,7 @@ def get_image_stats(image, mask, geom):
 
 
 def get_image_percent_cover_pixelarea(
-    image, aoi, name
+    image, aoi, name, scale=None, escalation=Escalation()
 ) -> Dict[str, PercentageStatsDict]:
     """Get the percentage of masked area over the total."""
     # Be sure the mask is 0
@@ -404,7 +1645,8 @@ def get_image_percent_cover_pixelarea(
         composite,
         aoi,
         reducer=ee.Reducer.sum().group(1, "image"),
-        scale=STATS_SCALE_M,
+        scale=scale,
+        escalation=escalation,
         maxPixels=1e12,
     ).get("groups")
     areas = ee.List(areas)
@@ -427,95 +1669,230 @@ def get_image_percent_cover_pixelarea(
     return ee.Dictionary({name: value})
 
 
-def get_image_mean(image, aoi, mask, name, main_aoi) -> Dict[str, MeanStatsDict]:
-    """Computes the mean of image values not masked by constraints in relation to the total aoi.
+def get_benefits_mean(
+    benefit_list: list,
+    aoi,
+    mask,
+    main_aoi,
+    scale: Optional[int] = None,
+    escalation: Escalation = Escalation(),
+) -> ee.List:
+    """Computes the mean of every benefit not masked by constraints in relation to the total aoi.
 
-    Returns dict name:{value:[],total:[]}.
+    The benefits share the constraint mask, so they are stacked as the bands of
+    one masked image and reduced together in a single reduceRegion.
 
     Args:
-        image: The Earth Engine image to process
+        benefit_list: The named benefit images
         aoi: Area of interest geometry
-        mask: Mask to apply to the image
-        name: Name for the output dictionary key
+        mask: Mask to apply to the images
         main_aoi (bool): If the main aoi is being used, then the min and max values are also returned.
+        scale: The scale of the reduction, STATS_SCALE_M by default.
+        escalation: The settings of the reduction.
 
-    Note: This function has been optimized to reduce the number of reduceRegion calls
-    from 2 to 1 by reusing the masked mean calculation for the total value.
+    Returns:
+        a list of dict name:{value:[],total:[]}, in the order of benefit_list.
     """
-    image = image.updateMask(mask)
-
-    # Set the default values for the output
-    result = ee.Dictionary(
-        {
-            "image_mean": 0,
-            "image_max": 0,
-            "image_min": 0,
-        }
-    )
+    bands = [f"benefit_{i}" for i in range(len(benefit_list))]
+    image = ee.Image.cat(
+        [image.select(0).rename(band) for (image, _), band in zip(benefit_list, bands)]
+    ).updateMask(mask)
 
     if main_aoi:
-        image = image.rename(["image"])
         reducer = ee.Reducer.mean().combine(ee.Reducer.minMax(), sharedInputs=True)
+        keys = {
+            stat: [f"{band}_{stat}" for band in bands]
+            for stat in ["mean", "max", "min"]
+        }
     else:
-        # if it is only one reducer, I have to rename the image.
-        image = image.rename(["image_mean"])
+        # a single reducer output is named after the bands only
         reducer = ee.Reducer.mean()
+        keys = {"mean": bands}
 
-    # Single reduceRegion call instead of two
-    result = result.combine(
+    # Set the default values for the output
+    defaults = {key: 0 for stat_keys in keys.values() for key in stat_keys}
+    result = ee.Dictionary(defaults).combine(
         _reduce_region_aoi(
             image,
             aoi,
             reducer=reducer,
-            scale=STATS_SCALE_M,
+            scale=scale,
+            escalation=escalation,
             maxPixels=1e13,
         )
     )
 
-    from_ = ["image_mean", "image_max", "image_min"]
-    to_ = ["mean", "max", "min"]
-
-    values: MeanStatsValues = result.rename(from_, to_)
+    benefits = []
+    for i, (_, name) in enumerate(benefit_list):
+        mean = result.get(keys["mean"][i])
+        values: MeanStatsValues = {
+            "mean": mean,
+            "max": result.get(keys["max"][i]) if main_aoi else 0,
+            "min": result.get(keys["min"][i]) if main_aoi else 0,
+        }
+        benefits.append(ee.Dictionary({name: {"total": [mean], "values": values}}))
 
-    value = ee.Dictionary({"total": [result.get("image_mean")], "values": values})
+    return ee.List(benefits)
 
-    return ee.Dictionary({name: value})
 
+def get_constraints_cover(
+    constraint_list: list,
+    aoi,
+    scale: Optional[int] = None,
+    escalation: Escalation = Escalation(),
+) -> ee.List:
+    """Get the percentage of area masked by each constraint in one reduction.
 
-def get_image_sum(image, aoi, mask, name) -> Dict[str, SumStatsDict]:
-    """Computes the sum of image values not masked by constraints in relation to the total aoi.
+    The constraints are packed in the bits of one band (see ``pack_constraints``)
+    and a single area reduction grouped by code gives the area of every
+    combination of constraints. It is decoded server side into the area masked
+    by each constraint ("percent") and the area masked by this constraint only
+    ("exclusive"). Falls back to one reduction per constraint when they don't fit
+    in a band.
 
-    returns dict name:{value:[],total:[]}.
+    returns a list of dict name:{value:[],total:[]}, in the order of constraint_list.
     """
-    area_ha = _reduce_region_aoi(
-        ee.Image.pixelArea().divide(10000),
-        aoi,
-        reducer=ee.Reducer.sum(),
-        scale=STATS_SCALE_M,
-        maxPixels=1e13,
-    ).get("area")
+    if len(constraint_list) > MAX_PACKED_CONSTRAINTS:
+        return ee.List(
+            [
+                get_image_percent_cover_pixelarea(image, aoi, name, scale, escalation)
+                for image, name in constraint_list
+            ]
+        )
 
-    sum_img = _reduce_region_aoi(
-        image.reproject("EPSG:4326").updateMask(mask),
-        aoi,
-        reducer=ee.Reducer.sum(),
-        scale=STATS_SCALE_M,
-        maxPixels=1e13,
+    composite = (
+        ee.Image.pixelArea().divide(10000).addBands(pack_constraints(constraint_list))
+    )
+    groups = ee.List(
+        _reduce_region_aoi(
+            composite,
+            aoi,
+            reducer=ee.Reducer.sum().group(1, "code"),
+            scale=scale,
+            escalation=escalation,
+            maxPixels=1e12,
+        ).get("groups")
     )
+    areas = groups.map(lambda group: ee.Dictionary(group).getNumber("sum"))
+    total = ee.Number(areas.reduce(ee.Reducer.sum()))
+
+    def percent(selected) -> ee.Number:
+        """Percentage of the total area in the groups whose code is selected."""
+
+        def selected_area(group):
+            group = ee.Dictionary(group)
+            return group.getNumber("sum").multiply(selected(group.getNumber("code")))
 
-    total_img = _reduce_region_aoi(
-        image,
+        area = groups.map(selected_area).reduce(ee.Reducer.sum())
+        return ee.Number(area).divide(total).multiply(100)
+
+    constraints = []
+    for i, (_, name) in enumerate(constraint_list):
+        bit = 1 << i
+        values: PercentageStatsValues = {
+            "percent": percent(lambda code, bit=bit: code.bitwiseAnd(bit).gt(0)),
+            "exclusive": percent(lambda code, bit=bit: code.eq(bit)),
+        }
+        constraints.append(ee.Dictionary({name: {"values": values, "total": [total]}}))
+
+    return ee.List(constraints)
+
+
+def get_image_mean(
+    image, aoi, mask, name, main_aoi, scale=None, escalation=Escalation()
+) -> Dict[str, MeanStatsDict]:
+    """Computes the mean of image values not masked by constraints in relation to the total aoi.
+
+    Returns dict name:{value:[],total:[]}.
+
+    Args:
+        image: The Earth Engine image to process
+        aoi: Area of interest geometry
+        mask: Mask to apply to the image
+        name: Name for the output dictionary key
+        main_aoi (bool): If the main aoi is being used, then the min and max values are also returned.
+        scale: The scale of the reduction, STATS_SCALE_M by default.
+        escalation: The settings of the reduction.
+    """
+    return ee.Dictionary(
+        get_benefits_mean([[image, name]], aoi, mask, main_aoi, scale, escalation).get(
+            0
+        )
+    )
+
+
+def _cost_bands(cost_list: list, mask: ee.Image) -> List[ee.Image]:
+    """Unmasked and constraint-masked value bands of every cost layer.
+
+    The values are weighted by the pixel area in ha, so their sum over the AOI
+    area doesn't depend on the statistics scale.
+    """
+    area = ee.Image.pixelArea().divide(10000)
+    bands = []
+    for i, (image, _) in enumerate(cost_list):
+        image = image.select(0).multiply(area)
+        bands += [
+            image.rename(f"cost_{i}_total"),
+            image.updateMask(mask).rename(f"cost_{i}_kept"),
+        ]
+
+    return bands
+
+
+def get_costs_sum(
+    cost_list: list,
+    aoi,
+    mask,
+    scale: Optional[int] = None,
+    escalation: Escalation = Escalation(),
+) -> ee.List:
+    """Computes the sum of every cost not masked by constraints in relation to the total aoi.
+
+    All the costs share a single sum reduction over a composite of the pixel area
+    and one unmasked/masked band pair per layer.
+
+    returns a list of dict name:{value:[],total:[]}, in the order of cost_list.
+    """
+    composite = ee.Image.cat(
+        [ee.Image.pixelArea().divide(10000).rename("area")]
+        + _cost_bands(cost_list, mask)
+    )
+    sums = _reduce_region_aoi(
+        composite,
         aoi,
         reducer=ee.Reducer.sum(),
-        scale=STATS_SCALE_M,
+        scale=scale,
+        escalation=escalation,
         maxPixels=1e13,
     )
-
-    value = ee.Dictionary(
-        {
-            "total": [ee.Number(total_img.values().get(0)).divide(area_ha)],
-            "values": {"sum": ee.Number(sum_img.values().get(0)).divide(area_ha)},
-        }
+    area_ha = ee.Number(sums.get("area"))
+
+    return ee.List(
+        [
+            ee.Dictionary(
+                {
+                    name: {
+                        "total": [
+                            ee.Number(sums.get(f"cost_{i}_total")).divide(area_ha)
+                        ],
+                        "values": {
+                            "sum": ee.Number(sums.get(f"cost_{i}_kept")).divide(area_ha)
+                        },
+                    }
+                }
+            )
+            for i, (_, name) in enumerate(cost_list)
+        ]
     )
 
-    return ee.Dictionary({name: value})
+
+def get_image_sum(
+    image, aoi, mask, name, scale=None, escalation=Escalation()
+) -> Dict[str, SumStatsDict]:
+    """Computes the sum of image values not masked by constraints in relation to the total aoi.
+
+    returns dict name:{value:[],total:[]}.
+    """
+    return ee.Dictionary(
+        get_costs_sum([[image, name]], aoi, mask, scale, escalation).get(0)
+    )
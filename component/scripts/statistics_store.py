@@ -0,0 +1,78 @@
+"""Persistent store of the dashboard statistics.
+
+Every statistic is stored as its own cell, keyed by what it depends on: the
+geometry of the AOI, the graph of the layer, the scale of the reduction and,
+for the layers reduced within the constraints, the graph of the constraint
+mask. Adding a layer or a sub-AOI to a recipe only leaves its own cells to
+compute, editing a constraint invalidates the cells reduced within the mask,
+and an unchanged recipe reopened in a later session, compared with another
+scenario or exported to CSV is read back without running any aggregation.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from component import parameter as cp
+from component.scripts.cache import JsonLRUCache
+
+logger = logging.getLogger("SEPLAN")
+
+STATS_VERSION = 4
+"""Version of the statistics computation, bump it to invalidate the store."""
+
+stats_cache = JsonLRUCache(cp.cache_dir / "statistics.json", max_entries=20000)
+"""Statistic cells of every recipe and session of the module."""
+
+
+def cell_key(
+    aoi_fingerprint: str,
+    theme: str,
+    layer_fingerprint: str,
+    mask_fingerprint: str = "",
+    main_aoi: bool = False,
+    scale: Optional[int] = None,
+) -> str:
+    """Build the key of a statistic cell.
+
+    Args:
+        aoi_fingerprint: the fingerprint of the AOI geometry.
+        theme: the statistic, one of suitability, benefit, cost or constraint.
+        layer_fingerprint: the fingerprint of the reduced layer graph.
+        mask_fingerprint: the fingerprint of the constraint mask the layer is
+            reduced within, empty if the statistic doesn't depend on it.
+        main_aoi: if the statistic is the one of the primary AOI, whose benefits
+            also report their range.
+        scale: the scale (m) the statistic is reduced at.
+    """
+    return json.dumps(
+        [
+            STATS_VERSION,
+            aoi_fingerprint,
+            theme,
+            layer_fingerprint,
+            mask_fingerprint,
+            main_aoi,
+            scale,
+        ]
+    )
+
+
+def load_cells(keys: Iterable[str]) -> Dict[str, Any]:
+    """Read the stored cells among the keys, the missing ones are left out."""
+    return {
+        key: content
+        for key, content in stats_cache.get_many(keys).items()
+        if content is not None
+    }
+
+
+def save_cells(cells: Dict[str, Any]) -> None:
+    """Store computed cells, skipping the layers that failed."""
+    values = {
+        key: content
+        for key, content in cells.items()
+        if content is not None and "error" not in content
+    }
+    if values:
+        stats_cache.update(values)
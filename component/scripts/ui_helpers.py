@@ -1,9 +1,8 @@
-import json
 from typing import Dict, List, Union
 
 from component.message import cm
 from sepal_ui.scripts import utils as su
-from component.parameter.file_params import legends_path
+from component.scripts.layer_catalog import get_layer_catalog
 import logging
 
 logger = logging.getLogger("SEPLAN")
@@ -38,20 +37,9 @@ def get_categorical_values(
         values (list): list of pixel values
     """
 
-    # Load legends JSON file
-    try:
-        with open(legends_path, "r") as file:
-            json_data = json.load(file)
-    except FileNotFoundError:
-        logger.debug("Error: The file was not found.")
-        return values
-    except json.JSONDecodeError:
-        logger.debug("Error: File is not a valid JSON.")
-        return values
-
-    # Check if the asset exists in the json data and has a legend
-    if asset in json_data and "legend" in json_data[asset]:
-        legend = json_data[asset]["legend"]
+    # Check if the asset has a known legend
+    legend = get_layer_catalog().legend(asset)
+    if legend is not None:
         # Create a list of dictionaries based on the legend and input values
 
         result = [
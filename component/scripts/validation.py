@@ -3,16 +3,16 @@
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from typing import List, Literal, Tuple
 
-from jsonschema import ValidationError, validate
-
 from component.parameter import recipe_schema_path
 from component.scripts.file_handler import read_file
 from component.types import RecipePaths
 import logging
-from sepal_ui.scripts.gee_task import GEETask
+
+if TYPE_CHECKING:
+    from sepal_ui.scripts.gee_task import GEETask
 
 
 logger = logging.getLogger("SEPLAN")
@@ -65,6 +65,9 @@ def validate_recipe(
     recipe_path: str, file_input=None, sepal_session=None
 ) -> Optional[Path]:
     """Read user file and performs all validation and corresponding checks."""
+    # jsonschema is slow to import, only the recipe files need it
+    from jsonschema import ValidationError, validate
+
     logger.debug(f"Validating recipe: {recipe_path}+++{sepal_session}")
     try:
         data = read_file(recipe_path, sepal_session=sepal_session)
@@ -525,7 +528,7 @@ def get_short_traceback(tb_string: str, num_lines: int = 3) -> str:
     return " | ".join([line.strip() for line in short_tb if line.strip()])
 
 
-def extract_task_error(task: GEETask) -> str:
+def extract_task_error(task: "GEETask") -> str:
     """Extract error message from a failed task, checking multiple sources."""
 
     # Try to get error message from various task attributes
@@ -1,24 +1,19 @@
-
 import logging
 
 import ee
 import pandas as pd
-import pygaul
 import sepal_ui.sepalwidgets as sw
 from sepal_ui.mapping import SepalMap
 from sepal_ui.scripts.gee_interface import GEEInterface
-from sepal_ui.scripts.utils import init_ee
 
 import component.parameter as cp
 from component.message import cm
 from component.model.recipe import Recipe
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import _aoi_bbox, mask_to_aoi
 from component.widget.custom_aoi_view import SeplanAoiView
 
 logger = logging.getLogger("SEPLAN")
 
-init_ee()
-
 
 class AoiView(sw.Layout):
     """Overwrite the map of the tile to replace it with a customMap."""
@@ -73,6 +68,8 @@ class AoiView(sw.Layout):
         # below (or the async GEE path) raise it again.
         seplan_aoi.aoi_lmic_warning = False
         if self.view.model.admin:
+            import pygaul
+
             logger.info("Checking if the aoi is in the LMIC country list")
             code = str(self.view.model.admin)
 
@@ -148,10 +145,10 @@ class AoiView(sw.Layout):
         # select(0)+rename so the verdict doesn't depend on the asset's band
         # name. Keep the raster MASKED (no unmask): masked ocean/no-data is
         # excluded, so ``fraction`` is the LMIC share of the AOI's land pixels.
-        # Clip to the AOI + reduce over its bbox rather than geometry=fc.geometry(),
+        # Mask to the AOI + reduce over its bbox rather than geometry=fc.geometry(),
         # which would dissolve the collection and can exceed the 2M-edge limit.
         lmic01 = lmic_raster.select(0).rename("lmic")
-        masked = lmic01.clip(fc)
+        masked = mask_to_aoi(lmic01, fc)
         fraction = masked.reduceRegion(
             reducer=ee.Reducer.mean(),
             geometry=_aoi_bbox(fc),
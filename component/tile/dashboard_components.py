@@ -8,15 +8,22 @@ import logging
 
 import sepal_ui.sepalwidgets as sw
 from sepal_ui.scripts.gee_interface import GEEInterface
+from traitlets import link
 
 from component import parameter as cp
 from component import widget as cw
 from component.message import cm
 from component.model.recipe import Recipe
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import aoi_bounds_async, mask_to_aoi
 from component.scripts.compute import export_as_csv
 from component.scripts.gee import create_layer
-from component.scripts.statistics import get_summary_statistics_async
+from component.scripts.seplan import prepare_breakpoints_async
+from component.scripts.statistics import (
+    get_estimated_statistics_async,
+    get_summary_statistics_async,
+    iter_summary_statistics_async,
+    load_summary_statistics,
+)
 from component.tile.dashboard_tile import OverallDashboard, ThemeDashboard
 from component.widget.alert_state import Alert
 from component.widget.base_dialog import MapDialog
@@ -76,7 +83,7 @@ class MapComputeComponent(sw.Layout):
                         f"All maps computed. Results: {len(map_id_dicts) if map_id_dicts else 0} maps"
                     )
 
-                    self.map_.zoom_bounds((*bounds[0], *bounds[2]))
+                    self.map_.zoom_bounds(bounds)
 
                     if map_id_dicts:
                         layer_names = [
@@ -114,14 +121,18 @@ class MapComputeComponent(sw.Layout):
 
         aoi = self.recipe.seplan_aoi.feature_collection
 
+        await prepare_breakpoints_async(self.gee_interface, self.recipe.seplan)
+
         benefit_index = self.recipe.seplan.get_benefit_index(clip=True)
         benefit_cost_index = (
             self.recipe.seplan.get_benefit_cost_index(clip=True).multiply(4).add(1)
         )
-        constraint_index = self.recipe.seplan.get_constraint_index().unmask(0).clip(aoi)
+        constraint_index = mask_to_aoi(
+            self.recipe.seplan.get_constraint_index().unmask(0), aoi
+        )
 
         tasks = [
-            self.gee_interface.get_info_async(_aoi_bbox(aoi).coordinates().get(0)),
+            aoi_bounds_async(self.gee_interface, aoi),
             self.gee_interface.get_map_id_async(benefit_index, cp.layer_vis),
             self.gee_interface.get_map_id_async(benefit_cost_index, cp.layer_vis),
             self.gee_interface.get_map_id_async(constraint_index, cp.layer_vis),
@@ -159,11 +170,13 @@ class MapDownloadComponent(sw.Layout):
 class DashboardDialog(MapDialog):
     """Dialog to display the dashboard results."""
 
-    def __init__(self, recipe, theme_toggle, **kwargs):
+    def __init__(self, recipe, theme_toggle, alert: Alert = None, **kwargs):
         super().__init__(persistent=False, **kwargs)
         self.max_width = "90vw"
         self.height = "80vh"
         self.recipe = recipe
+        self.alert = alert
+        self.summary_stats = None
 
         self.overall_dash = OverallDashboard(theme_toggle=theme_toggle)
         self.theme_dash = ThemeDashboard(theme_toggle=theme_toggle)
@@ -178,21 +191,55 @@ class DashboardDialog(MapDialog):
         close_btn = sw.Btn("Close", outlined=True, class_="ma-2")
         close_btn.on_event("click", self.close_dialog)
 
+        # Export the areas displayed so far, even while the others are computed
+        self.btn_csv = sw.Btn("Export CSV", outlined=True, class_="ma-2")
+        self.btn_csv.on_event("click", self._export_csv)
+
+        self.progress = sw.Html(tag="span", class_="text-caption ml-4")
+
         # Create dialog content
         self.children = [
             sw.Card(
                 children=[
-                    sw.CardTitle(children=["Dashboard Results"]),
+                    sw.CardTitle(children=["Dashboard Results", self.progress]),
                     sw.CardText(children=[content_layout]),
-                    sw.CardActions(children=[sw.Spacer(), close_btn]),
+                    sw.CardActions(children=[sw.Spacer(), self.btn_csv, close_btn]),
                 ]
             )
         ]
 
-    def set_results(self, summary_stats, recipes=None):
-        """Set the results for the dashboard."""
+    def set_results(
+        self, summary_stats, recipes=None, pending: int = 0, open_: bool = True
+    ):
+        """Set the results for the dashboard.
+
+        Args:
+            summary_stats: the statistics of the recipe, or the list of the
+                statistics of each recipe when comparing scenarios.
+            recipes: the compared recipes, None for the current recipe.
+            pending: the number of areas still computed, when the statistics
+                are partial. The dashboard is rendered again with each update.
+            open_: open the dialog. Only the first update of a stream opens it,
+                so a dialog closed while the statistics are computed stays closed.
+        """
         logger.debug(f"Setting results in DashboardDialog: {summary_stats}")
 
+        messages = [f"{pending} area(s) still computing..."] if pending else []
+        if not recipes:
+            areas = next(iter(summary_stats.values())).values()
+            nb_estimated = sum(
+                1 for area in areas if (area.get("analysis") or {}).get("estimate")
+            )
+            if nb_estimated:
+                messages.insert(
+                    0, f"{nb_estimated} area(s) estimated from sample points (95% CI)."
+                )
+        self.progress.children = messages
+
+        # only the statistics of the current recipe can be exported
+        self.summary_stats = None if recipes else summary_stats
+        self.btn_csv.disabled = self.summary_stats is None
+
         if not recipes:
             # Set summary for both dashboards
             self.overall_dash.set_summary([summary_stats])
@@ -202,8 +249,17 @@ class DashboardDialog(MapDialog):
             self.overall_dash.set_summary(summary_stats)
             self.theme_dash.set_summary(recipes, summary_stats)
 
-        logger.debug("Opening dialog")
-        self.open_dialog()
+        if open_:
+            logger.debug("Opening dialog")
+            self.open_dialog()
+
+    def _export_csv(self, *_):
+        """Export the statistics displayed in the dashboard."""
+        session_results_path = export_as_csv(self.summary_stats)
+        if self.alert:
+            self.alert.add_msg(
+                f"File successfully saved in {session_results_path}", "success"
+            )
 
 
 class DownloadComponent(sw.Layout):
@@ -283,6 +339,40 @@ class DashboardComputeComponent(sw.Layout):
         self.btn_view_dashboard = TextBtn("View Dashboard", block=True)
         self.btn_view_dashboard.on_event("click", self._open_existing_dashboard)
 
+        # opt-in simplification of the AOI geometries, stored in the recipe
+        self.w_simplify = sw.Checkbox(
+            label="Simplify the AOI geometry (faster, bounded area error)",
+            v_model=self.recipe.seplan_aoi.simplification["enabled"],
+            dense=True,
+            hide_details=True,
+        )
+        self.w_simplify.observe(self._on_simplify_change, "v_model")
+        self.recipe.seplan_aoi.observe(self._sync_simplify, "simplification")
+
+        # the statistics scale is planned from each AOI extent unless exact
+        # 100 m results are requested
+        self.w_exact_scale = sw.Checkbox(
+            label="Exact 100 m statistics (slower on large AOIs)",
+            dense=True,
+            hide_details=True,
+        )
+        link((self.recipe.dash_model, "exact_scale"), (self.w_exact_scale, "v_model"))
+
+        # a sampled estimate can be displayed first, then refined in the background
+        self.w_quick_estimate = sw.Checkbox(
+            label="Quick estimate first (sample points, about ±2%)",
+            dense=True,
+            hide_details=True,
+        )
+        self.w_refine_estimate = sw.Checkbox(
+            label="Refine the estimate to the exact values",
+            dense=True,
+            hide_details=True,
+        )
+        dash_model = self.recipe.dash_model
+        link((dash_model, "quick_estimate"), (self.w_quick_estimate, "v_model"))
+        link((dash_model, "refine_estimate"), (self.w_refine_estimate, "v_model"))
+
         self.children = [
             sw.Row(
                 children=[
@@ -290,10 +380,22 @@ class DashboardComputeComponent(sw.Layout):
                     sw.Col(children=[self.btn_view_dashboard], cols=6),
                 ]
             ),
+            self.w_simplify,
+            self.w_exact_scale,
+            self.w_quick_estimate,
+            self.w_refine_estimate,
         ]
 
         self._configure_dashboard()
 
+    def _on_simplify_change(self, change):
+        """Enable or disable the simplification of the analysis geometries."""
+        self.recipe.seplan_aoi.set_simplification(bool(change["new"]))
+
+    def _sync_simplify(self, change):
+        """Reflect the simplification of a loaded recipe in the checkbox."""
+        self.w_simplify.v_model = change["new"].get("enabled", False)
+
     def _configure_dashboard(self):
         """Configure the dashboard computation."""
 
@@ -303,23 +405,65 @@ class DashboardComputeComponent(sw.Layout):
                 if task:
                     self.summary_stats = task.result
 
-                    # Set content and open dialog
-                    self.dashboard_dialog.set_results(self.summary_stats)
-
             return self.gee_interface.create_task(
-                func=get_summary_statistics_async,
+                func=self._stream_summary_statistics,
                 key="create_dashboard_task",
                 on_done=callback,
                 on_error=lambda e: self.alert.add_msg(str(e), type_="error"),
             )
 
-        self.btn_dashboard.configure(
-            task_factory=create_dashboard_task,
-            start_args=(self.gee_interface, self.recipe),
-        )
+        self.btn_dashboard.configure(task_factory=create_dashboard_task)
+
+    async def _stream_summary_statistics(self):
+        """Compute the statistics, displaying the dashboard as each AOI is done.
+
+        With the quick estimate, the estimated statistics are displayed first and
+        each AOI is replaced by its exact statistics as they are computed, unless
+        the refinement is disabled. Stored statistics are never estimated.
+        """
+        self.summary_stats = None
+        dash_model = self.recipe.dash_model
+        _, secondary_ee_features = self.recipe.seplan.aoi_model.get_ee_features()
+        nb_aois = len(secondary_ee_features) + 1
+
+        estimate = {}
+        if dash_model.quick_estimate and not load_summary_statistics(self.recipe):
+            estimate = await get_estimated_statistics_async(
+                self.gee_interface, self.recipe
+            )
+            self.summary_stats = estimate
+            refine = dash_model.refine_estimate
+            self.dashboard_dialog.set_results(
+                estimate, pending=nb_aois if refine else 0
+            )
+            if not refine:
+                return self.summary_stats
+
+        # the dialog is opened by the first update only
+        opened = bool(estimate)
+        async for summary_stats in iter_summary_statistics_async(
+            self.gee_interface, self.recipe
+        ):
+            recipe_name, area_stats = next(iter(summary_stats.items()))
+            nb_done = len(area_stats)
+            if estimate:
+                summary_stats = {recipe_name: {**estimate[recipe_name], **area_stats}}
+            self.summary_stats = summary_stats
+            self.dashboard_dialog.set_results(
+                summary_stats, pending=nb_aois - nb_done, open_=not opened
+            )
+            opened = True
+
+        return self.summary_stats
 
     def _open_existing_dashboard(self, *_):
-        """Open dashboard with existing results."""
+        """Open dashboard with existing results.
+
+        The statistics stored for the current state of the recipe are used
+        first, they may come from a previous session.
+        """
+        self.summary_stats = load_summary_statistics(self.recipe) or self.summary_stats
+
         if self.summary_stats:
             self.dashboard_dialog.set_results(self.summary_stats)
 
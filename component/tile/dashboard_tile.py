@@ -16,6 +16,7 @@ from component.parameter.vis_params import PLOT_COLORS
 from component.scripts.plots import (
     get_bars_chart,
     get_suitability_charts,
+    parse_layer_ci,
     parse_layer_data,
 )
 from component.scripts.seplan import Seplan
@@ -76,6 +77,7 @@ class ThemeDashboard(sw.Card):
                 w_chart = get_bars_chart(
                     categories=aoi_names,
                     values=[values],
+                    errors=[parse_layer_ci(scenario_stats, layer_id)],
                     custom_item_color=True,
                     custom_item_colors=[colors],
                     series_names=[layer_data.get("name")],
@@ -98,12 +100,15 @@ class ThemeDashboard(sw.Card):
                     scenario_stats, layer_id
                 )
 
+                cis = parse_layer_ci(scenario_stats, layer_id)
+
                 constraint_charts[layer_id].append(
-                    (recipe_name, layer_data, values, colors)
+                    (recipe_name, layer_data, values, colors, cis)
                 )
 
             # Each of the series has to be one of the costs in the cost model
             layers_data, aoi_names, values, colors, series_names = [], [], [], [], []
+            errors = []
             for layer_id in recipe.seplan.cost_model.ids:
 
                 layer_data = recipe.seplan.cost_model.get_layer_data(layer_id)
@@ -112,6 +117,7 @@ class ThemeDashboard(sw.Card):
                 aoi_name, value, *_ = parse_layer_data(scenario_stats, layer_id)
                 aoi_names.append(aoi_name)
                 values.append(value)
+                errors.append(parse_layer_ci(scenario_stats, layer_id))
                 series_names.append(layer_data["name"])
                 # TODO: make the theme a traits
                 colors.append(
@@ -123,6 +129,7 @@ class ThemeDashboard(sw.Card):
                 values=values,
                 series_names=series_names,
                 series_colors=colors,
+                errors=errors,
                 bars_width=80,
                 theme_toggle=self.theme_toggle,
             )
@@ -184,11 +191,16 @@ class ThemeDashboard(sw.Card):
         constraint_charts_data = []
         for layer_id, constraint_charts in constraint_charts.items():
             layer_data = constraint_charts[0][1]
-            values, colors = zip(
-                *[(values, colors) for _, _, values, colors in constraint_charts]
+            values, colors, cis = zip(
+                *[
+                    (values, colors, cis)
+                    for _, _, values, colors, cis in constraint_charts
+                ]
             )
 
-            constraint_charts_data.append(LayerPercentage(layer_data, values, colors))
+            constraint_charts_data.append(
+                LayerPercentage(layer_data, values, colors, cis)
+            )
 
         const_content = v.ExpansionPanelContent(
             children=[const_txt, *constraint_charts_data]
@@ -23,11 +23,13 @@ def get_right_panel_content(
     no_admin=False,
 ):
 
-    dashboard_dialog = DashboardDialog(theme_toggle=theme_toggle, recipe=recipe)
-
     shared_alert = Alert()
     AlertDialog.element(w_alert=shared_alert)
 
+    dashboard_dialog = DashboardDialog(
+        theme_toggle=theme_toggle, recipe=recipe, alert=shared_alert
+    )
+
     download_component = DownloadComponent(
         gee_interface=gee_interface, recipe=recipe, alert=shared_alert
     )
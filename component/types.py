@@ -1,5 +1,16 @@
-from typing import Dict, List, Literal, Tuple, TypedDict
-from ipecharts import EChartsWidget
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Literal,
+    NotRequired,
+    Optional,
+    Tuple,
+    TypedDict,
+)
+
+if TYPE_CHECKING:
+    from ipecharts import EChartsWidget
 
 
 class MeanStatsValues(TypedDict):
@@ -8,6 +19,8 @@ class MeanStatsValues(TypedDict):
     mean: float
     max: float
     min: float
+    mean_ci: NotRequired[float]
+    """Half-width of the 95% confidence interval of an estimated mean."""
 
 
 class MeanStatsDict(TypedDict):
@@ -21,6 +34,10 @@ class PercentageStatsValues(TypedDict):
     """The values returned by get_image_percent_cover_pixelarea function for constraint."""
 
     percent: float
+    exclusive: NotRequired[float]
+    """Percentage of the area masked by this constraint only (packed constraints)."""
+    percent_ci: NotRequired[float]
+    """Half-width of the 95% confidence interval of an estimated percentage."""
 
 
 class PercentageStatsDict(TypedDict):
@@ -34,6 +51,8 @@ class SumStatsValues(TypedDict):
     """The values returned by get_image_sum function for costs theme."""
 
     sum: float
+    sum_ci: NotRequired[float]
+    """Half-width of the 95% confidence interval of an estimated sum."""
 
 
 class SumStatsDict(TypedDict):
@@ -48,6 +67,8 @@ class SuitabilityLevel(TypedDict):
 
     image: Literal[1, 2, 3, 4, 5, 6]
     sum: float
+    ci: NotRequired[float]
+    """Half-width of the 95% confidence interval of an estimated area."""
 
 
 class SuitabilityDict(TypedDict):
@@ -57,6 +78,33 @@ class SuitabilityDict(TypedDict):
     values: List[SuitabilityLevel]
 
 
+class EstimateInfo(TypedDict):
+    """The sample of the quick estimate of the statistics of an area."""
+
+    points: int
+    confidence: float
+
+
+class AnalysisInfo(TypedDict, total=False):
+    """How the statistics of an area were computed, reported in the CSV metadata."""
+
+    scale: int
+    """Scale (m) of the reductions, chosen from the AOI extent and pixel budget."""
+
+    simplify_tolerance: float
+    """Tolerance (m) of the simplified AOI geometry, when the recipe opted in."""
+    area_error: float
+    """Area error of the simplified geometry, as a fraction of the AOI area."""
+
+    estimate: EstimateInfo
+    """Set when the statistics are estimated from sample points."""
+
+    escalations: Dict[str, dict]
+    """The settings of the reductions escalated after running out of memory or
+    pixels, by "theme: layer name" or "breakpoints: normalization" (see
+    ``Escalation``)."""
+
+
 class AreaStats(TypedDict):
     """The data structure for the summary statistics of a given area."""
 
@@ -66,6 +114,7 @@ class AreaStats(TypedDict):
 
     suitability: SuitabilityDict
     color: str
+    analysis: NotRequired[AnalysisInfo]
 
 
 SummaryStatsDict = Dict[str, AreaStats]
@@ -135,15 +184,18 @@ RecipePaths = Dict[str, RecipeInfo]
 
 
 # Set the default structure, based on the type
-BenefitChartsData = Dict[str, List[Tuple[str, BenefitLayerData, EChartsWidget]]]
+BenefitChartsData = Dict[str, List[Tuple[str, BenefitLayerData, "EChartsWidget"]]]
 """Where the key is the layer_id and the value is a tuple with the recipe name, the layer data and the echarts widget"""
 
 ConstraintChartsData = Dict[
-    str, List[Tuple[str, ConstraintLayerData, List[float], List[str]]]
+    str,
+    List[
+        Tuple[str, ConstraintLayerData, List[float], List[str], List[Optional[float]]]
+    ],
 ]
-"""Where the key is the layer_id and the value is a list of tuple with the recipe name, the layer data, the values and the colors"""
+"""Where the key is the layer_id and the value is a list of tuple with the recipe name, the layer data, the values, the colors and the confidence intervals of the estimated values"""
 
 CostChartData = Dict[
-    Literal["cost_layers"], List[Tuple[str, Tuple[CostLayerData], EChartsWidget]]
+    Literal["cost_layers"], List[Tuple[str, Tuple[CostLayerData], "EChartsWidget"]]
 ]
 """Where the key is "cost_layers" and the value is a tuple with the recipe name, a tuple with all the cost layer's data and the echarts widget"""
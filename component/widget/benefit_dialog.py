@@ -1,14 +1,13 @@
 from typing import Union
 
-import pandas as pd
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.scripts import decorator as sd
 from sepal_ui.scripts.gee_interface import GEEInterface
 from traitlets import Bool, link
 
-from component import parameter as cp
 from component.message import cm
 from component.model.benefit_model import BenefitModel
+from component.scripts.layer_catalog import get_layer_catalog
 from component.scripts.ui_helpers import set_default_asset
 from component.widget.alert_state import Alert
 from component.widget.base_dialog import BaseDialog
@@ -16,9 +15,6 @@ from component.widget.buttons import TextBtn
 
 
 class BenefitDialog(BaseDialog):
-    _BENEFITS = pd.read_csv(cp.layer_list)
-    _BENEFITS = _BENEFITS[_BENEFITS.theme == "benefit"]
-
     count = 0
 
     loading = Bool(False).tag(sync=True)
@@ -39,7 +35,7 @@ class BenefitDialog(BaseDialog):
         w_title = sw.CardTitle(children=[cm.benefit.dialog.title])
 
         # create the content
-        default_theme = self._BENEFITS.subtheme.unique().tolist()
+        default_theme = get_layer_catalog().subthemes("benefit")
         theme_names = [
             {"text": cm.subtheme[ly], "value": ly} for ly in default_theme if ly
         ]
@@ -106,7 +102,7 @@ class BenefitDialog(BaseDialog):
         """Set the default data type depending on the asset."""
         # check if the asset is in the default list of layers
 
-        if change["new"] in self._BENEFITS.gee_asset.tolist():
+        if get_layer_catalog().by_asset(change["new"], theme="benefit"):
             self.set_readonly(True)
         else:
             self.set_readonly(False)
@@ -170,9 +166,10 @@ class BenefitDialog(BaseDialog):
 
     def theme_change(self, *args) -> None:
         """edit the list of default theme."""
-        default_layers = self._BENEFITS[self._BENEFITS.subtheme == self.w_theme.v_model]
-        default_layers = default_layers.layer_id.unique().tolist()
-        self.w_name.items = [cm.layers[ly].name for ly in default_layers]
+        default_layers = get_layer_catalog().by_theme(
+            "benefit", subtheme=self.w_theme.v_model
+        )
+        self.w_name.items = [cm.layers[ly.layer_id].name for ly in default_layers]
         self.w_name.v_model = next(iter(self.w_name.items), "")
 
     def name_change(self, *args) -> None:
@@ -182,15 +179,15 @@ class BenefitDialog(BaseDialog):
             return
 
         if self.w_name.v_model not in self.w_name.items:
-            if self.w_id.v_model in self._BENEFITS.layer_id.tolist():
+            if get_layer_catalog().get(self.w_id.v_model, theme="benefit"):
                 self.w_id.v_model = None
             return
 
-        # get the information from the dataframe
+        # get the information from the layer catalog
         layer_id = next(
             k for k, ly in cm.layers.items() if ly.name == self.w_name.v_model
         )
-        benefit = self._BENEFITS[self._BENEFITS.layer_id == layer_id].iloc[0]
+        benefit = get_layer_catalog()[layer_id]
 
         # fill the different widgets
         self.w_id.v_model = layer_id
@@ -1,4 +1,3 @@
-import pandas as pd
 from component.frontend.icons import icon
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.scripts import decorator as sd
@@ -16,8 +15,6 @@ from .preview_map_dialog import PreviewMapDialog
 
 
 class BenefitRow(sw.Html):
-    _DEFAULT_THEMES = pd.read_csv(cp.layer_list).layer_id
-
     def __init__(
         self,
         model: BenefitModel,
@@ -27,7 +24,7 @@ class BenefitRow(sw.Html):
         alert: Alert,
         preview_map: PreviewMapDialog,
         *_,
-        **__
+        **__,
     ) -> None:
         self.tag = "tr"
         self.layer_id = layer_id
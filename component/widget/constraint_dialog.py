@@ -1,6 +1,5 @@
 from typing import Union, Optional
 
-import pandas as pd
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.scripts import decorator as sd
 from sepal_ui.scripts.gee_interface import GEEInterface
@@ -9,6 +8,7 @@ from traitlets import Bool, link
 import component.model as cmod
 from component import parameter as cp
 from component.message import cm
+from component.scripts.layer_catalog import get_layer_catalog
 from component.scripts.ui_helpers import set_default_asset
 from component.widget.alert_state import Alert
 from component.widget.base_dialog import BaseDialog
@@ -16,9 +16,6 @@ from component.widget.buttons import TextBtn
 
 
 class ConstraintDialog(BaseDialog):
-    _CONSTRAINTS = pd.read_csv(cp.layer_list)
-    _CONSTRAINTS = _CONSTRAINTS[_CONSTRAINTS.theme == "constraint"]
-
     count = 0
     loading = Bool(False).tag(sync=True)
 
@@ -40,7 +37,7 @@ class ConstraintDialog(BaseDialog):
         w_title = sw.CardTitle(children=[cm.constraint.dialog.title])
 
         # create the content
-        default_theme = self._CONSTRAINTS.subtheme.dropna().unique().tolist()
+        default_theme = get_layer_catalog().subthemes("constraint")
         theme_names = [
             {"text": cm.subtheme[ly], "value": ly} for ly in default_theme if ly
         ]
@@ -118,14 +115,11 @@ class ConstraintDialog(BaseDialog):
         """Set the default data type depending on the asset."""
         # check if the asset is in the default list of layers, and set its default
         # values
-        if change["new"] in self._CONSTRAINTS.gee_asset.tolist():
-            layer_id, units, data_type = self._CONSTRAINTS[
-                self._CONSTRAINTS.gee_asset == change["new"]
-            ][["layer_id", "unit", "data_type"]].values[0]
-
-            self.w_desc.v_model = cm.layers[layer_id].detail
-            self.w_unit.v_model = units
-            self.w_data_type.v_model = data_type
+        layer = get_layer_catalog().by_asset(change["new"], theme="constraint")
+        if layer:
+            self.w_desc.v_model = cm.layers[layer.layer_id].detail
+            self.w_unit.v_model = layer.unit
+            self.w_data_type.v_model = layer.data_type
             self.set_readonly(True)
 
         else:
@@ -194,11 +188,10 @@ class ConstraintDialog(BaseDialog):
 
     def theme_change(self, *args) -> None:
         """edit the list of default theme."""
-        default_layers = self._CONSTRAINTS[
-            self._CONSTRAINTS.subtheme == self.w_theme.v_model
-        ]
-        default_layers = default_layers.layer_id.unique().tolist()
-        self.w_name.items = [cm.layers[ly].name for ly in default_layers]
+        default_layers = get_layer_catalog().by_theme(
+            "constraint", subtheme=self.w_theme.v_model
+        )
+        self.w_name.items = [cm.layers[ly.layer_id].name for ly in default_layers]
         self.w_name.v_model = next(iter(self.w_name.items), "")
 
     def name_change(self, *args) -> None:
@@ -208,16 +201,16 @@ class ConstraintDialog(BaseDialog):
             return
 
         if self.w_name.v_model not in self.w_name.items:
-            if self.w_id.v_model in self._CONSTRAINTS.layer_id.tolist():
+            if get_layer_catalog().get(self.w_id.v_model, theme="constraint"):
                 self.w_id.v_model = None
             return
 
-        # get the information from the dataframe
+        # get the information from the layer catalog
         layer_id = next(
             k for k, ly in cm.layers.items() if ly.name == self.w_name.v_model
         )
 
-        constraint = self._CONSTRAINTS[self._CONSTRAINTS.layer_id == layer_id].iloc[0]
+        constraint = get_layer_catalog()[layer_id]
 
         # fill the different widgets
         self.w_id.v_model = layer_id
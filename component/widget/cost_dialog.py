@@ -1,14 +1,13 @@
 from typing import Union, Optional
 
-import pandas as pd
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.scripts import decorator as sd
 from sepal_ui.scripts.gee_interface import GEEInterface
 from traitlets import Bool, link
 
 from component import model as cmod
-from component import parameter as cp
 from component.message import cm
+from component.scripts.layer_catalog import get_layer_catalog
 from component.scripts.ui_helpers import set_default_asset
 from component.widget.alert_state import Alert
 from component.widget.base_dialog import BaseDialog
@@ -16,9 +15,6 @@ from component.widget.buttons import TextBtn
 
 
 class CostDialog(BaseDialog):
-    _COSTS = pd.read_csv(cp.layer_list)
-    _COSTS = _COSTS[_COSTS.theme == "cost"]
-
     count = 0
 
     loading = Bool(False).tag(sync=True)
@@ -41,8 +37,8 @@ class CostDialog(BaseDialog):
 
         # create the content
         self.w_name = sw.Combobox(label=cm.cost.dialog.name, items=[], v_model=None)
-        default_layers = self._COSTS.layer_id.unique().tolist()
-        self.w_name.items = [cm.layers[ly].name for ly in default_layers]
+        default_layers = get_layer_catalog().by_theme("cost")
+        self.w_name.items = [cm.layers[ly.layer_id].name for ly in default_layers]
         self.w_id = sw.TextField(v_model=None, readonly=True, viz=False)
         self.w_asset = sw.AssetSelect(types=["IMAGE"], gee_interface=gee_interface)
         self.w_desc = sw.Textarea(label=cm.cost.dialog.desc, v_model=None)
@@ -101,7 +97,7 @@ class CostDialog(BaseDialog):
         """Set the default data type depending on the asset."""
         # check if the asset is in the default list of layers
 
-        if change["new"] in self._COSTS.gee_asset.tolist():
+        if get_layer_catalog().by_asset(change["new"], theme="cost"):
             self.set_readonly(True)
         else:
             self.set_readonly(False)
@@ -167,15 +163,15 @@ class CostDialog(BaseDialog):
             return
 
         if self.w_name.v_model not in self.w_name.items:
-            if self.w_id.v_model in self._COSTS.layer_id.tolist():
+            if get_layer_catalog().get(self.w_id.v_model, theme="cost"):
                 self.w_id.v_model = None
             return
 
-        # get the information from the dataframe
+        # get the information from the layer catalog
         layer_id = next(
             k for k, ly in cm.layers.items() if ly.name == self.w_name.v_model
         )
-        cost = self._COSTS[self._COSTS.layer_id == layer_id].iloc[0]
+        cost = get_layer_catalog()[layer_id]
 
         # fill the different widgets
         self.w_id.v_model = layer_id
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from ipecharts import EChartsWidget
 
 from component.frontend.icons import icon
@@ -6,6 +6,7 @@ from sepal_ui import sepalwidgets as sw
 from sepal_ui.frontend.resize_trigger import rt
 
 from component.message import cm
+from component.scripts.plots import format_ci
 from component.types import ConstraintLayerData, ModelLayerData
 
 
@@ -92,6 +93,7 @@ class LayerPercentage(sw.Layout):
         layer_data: ModelLayerData,
         values: List[List[float]],
         colors: List[List[str]],
+        cis: Optional[List[List[Optional[float]]]] = None,
     ):
 
         detail = layer_data.get("desc")
@@ -110,12 +112,14 @@ class LayerPercentage(sw.Layout):
         w_panel = sw.ExpansionPanel(children=[w_header, w_content])
         w_details = sw.ExpansionPanels(xs12=True, class_="mt-3", children=[w_panel])
 
+        cis = cis or [[None] * len(i_val) for i_val in values]
+
         rows = []
         for i, i_val in enumerate(values):
             spans = []
             for j, j_val in enumerate(i_val):
                 c = f"color: {colors[i][j]}"
-                round_val = f"{round(j_val,2)}%"
+                round_val = f"{round(j_val,2)}%{format_ci(cis[i][j], unit='%')}"
                 w_span = sw.Html(
                     tag="span", class_="ml-1 mr-1", style_=c, children=[round_val]
                 )
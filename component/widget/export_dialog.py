@@ -3,23 +3,26 @@ from pathlib import Path
 from typing import Literal
 
 import ee
-import rasterio as rio
-from matplotlib.colors import to_rgba
 from sepal_ui import sepalwidgets as sw
 from sepal_ui.scripts import gee
-from sepal_ui.scripts import utils as su
 
 from component import parameter as cp
 from component import scripts as cs
 from component.message import cm
 from component.model.recipe import Recipe
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import _aoi_bbox, mask_to_aoi
 from component.scripts.gee import (
     apply_export_viz,
     get_ee_project_id,
     get_gee_recipe_folder_async,
 )
-from component.scripts.seplan import asset_to_image, mask_image, quintiles
+from component.scripts.seplan import (
+    asset_to_image,
+    mask_image,
+    prepare_breakpoints_async,
+    quintiles,
+    resolve_quintiles_async,
+)
 from component.scripts.ui_helpers import parse_export_name
 from component.widget.alert_state import Alert
 from component.widget.base_dialog import BaseDialog
@@ -27,8 +30,6 @@ from component.widget.buttons import TextBtn
 
 logger = logging.getLogger("SEPLAN")
 
-su.init_ee()
-
 
 class ExportMapDialog(BaseDialog):
     def __init__(self, recipe: Recipe, alert: Alert, **kwargs):
@@ -223,12 +224,26 @@ class ExportMapDialog(BaseDialog):
 
         # The value from the w_asset is a tuple with (theme, id_)
         theme, id_ = self.w_asset.v_model
+
+        # inline the cached normalization breakpoints in the exported graph
+        if theme == "index":
+            await prepare_breakpoints_async(gee_interface, self.recipe.seplan)
+        elif theme == "benefit":
+            model = self.recipe.seplan.benefit_model
+            asset = model.assets[model.get_index(id=id_)]
+            try:
+                await resolve_quintiles_async(
+                    gee_interface, [asset_to_image(asset)], aoi
+                )
+            except Exception as e:
+                logger.warning(f"Quintile breakpoints not cached: {e}")
+
         ee_image = self.get_ee_image(theme, id_)
         # Mask to the AOI so the bbox region below exports nodata outside it (a
-        # polygon region masks to its shape, a bbox region doesn't). clip(fc)
-        # rasterises per feature, so it doesn't dissolve the AOI like
+        # polygon region masks to its shape, a bbox region doesn't). The AOI
+        # mask is rasterized, so it doesn't dissolve the AOI like
         # aoi.geometry() would.
-        ee_image = ee_image.clip(aoi)
+        ee_image = mask_to_aoi(ee_image, aoi)
 
         recipe_name = str(Path(self.recipe.recipe_session_path).stem)
 
@@ -281,6 +296,9 @@ class ExportMapDialog(BaseDialog):
             self.alert.add_msg(msg, "success")
 
         elif self.w_method.v_model == "sepal":
+            import rasterio as rio
+            from matplotlib.colors import to_rgba
+
             description = f"{name}_sepal"
             export_params.update(description=description)
             gdrive = cs.gdrive()
@@ -15,7 +15,7 @@ from traitlets import Dict, Int, link
 from component import widget as cw
 from component.frontend.icons import icon
 from component.model.aoi_model import SeplanAoi
-from component.scripts.aoi_geometry import _aoi_bbox, fc_from_source
+from component.scripts.aoi_geometry import aoi_bounds_async, fc_from_source
 from component.widget.admin_aoi_dialog import AdminAoiDialog, _is_admin_eligible
 from component.widget.buttons import TextBtn
 from component.widget.custom_geometries_dialog import CustomGeometriesDialog
@@ -321,11 +321,8 @@ class SeplanMap(sm.SepalMap):
             for feat in features
         ]
         merged = ee.FeatureCollection(fcs).flatten()
-        # per-feature bbox (see _aoi_bbox) -> overall extent ring -> [minx,miny,maxx,maxy]
-        coords = await self.gee_interface.get_info_async(
-            _aoi_bbox(merged).coordinates().get(0)
-        )
-        bounds = [coords[0][0], coords[0][1], coords[2][0], coords[2][1]]
+        # per-feature bbox (see _aoi_bbox) -> overall extent [minx,miny,maxx,maxy]
+        bounds = await aoi_bounds_async(self.gee_interface, merged)
         self.zoom_bounds(bounds)
 
     def remove_custom_layer(self, layer_id):
@@ -11,7 +11,7 @@ from sepal_ui.scripts.gee_task import GEETask
 
 from component import parameter as cp
 from component.message import cm
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import _aoi_bbox, aoi_bounds_async, mask_to_aoi
 from component.scripts.gee import create_layer
 from component.widget.base_dialog import MapDialog
 from component.widget.buttons import TextBtn
@@ -84,12 +84,14 @@ class PreviewMapDialog(MapDialog):
         """Returns the map and the legend."""
         coros = [
             self.gee_interface.get_map_id_async(aoi),
-            self.gee_interface.get_info_async(_aoi_bbox(aoi).coordinates().get(0)),
-            self.gee_interface.get_map_id_async(ee_map.clip(aoi), vis_params),
+            aoi_bounds_async(self.gee_interface, aoi),
+            self.gee_interface.get_map_id_async(mask_to_aoi(ee_map, aoi), vis_params),
         ]
 
         if base_layer:
-            coros.append(self.gee_interface.get_map_id_async(base_layer.clip(aoi)))
+            coros.append(
+                self.gee_interface.get_map_id_async(mask_to_aoi(base_layer, aoi))
+            )
         else:
             coros.append(asyncio.sleep(0, result=None))
 
@@ -125,10 +127,10 @@ class PreviewMapDialog(MapDialog):
         self.map_card.loading = True
 
         def maps_callback(_):
-            aoi_map_id, coords, layer_map_id, base_layer_map_id = self._tasks[
+            aoi_map_id, bounds, layer_map_id, base_layer_map_id = self._tasks[
                 "maps"
             ].result
-            self.map_.zoom_bounds((*coords[0], *coords[2]))
+            self.map_.zoom_bounds(bounds)
             self.map_.add_layer(create_layer(aoi_map_id, "AOI"))
             if base_layer_map_id:
                 self.map_.add_layer(create_layer(base_layer_map_id, "Base Layer", True))
@@ -179,7 +181,7 @@ class PreviewMapDialog(MapDialog):
             vis_params.update(min=0, max=1)
             layer = layer.unmask(0)
             if base_layer:
-                layer = layer.clip(aoi)
+                layer = mask_to_aoi(layer, aoi)
 
         if type_ in ["benefit", "cost"]:
             self._tasks["minmax"].start(layer, aoi)
@@ -195,9 +197,9 @@ class PreviewMapDialog(MapDialog):
             geometry (ee.Geometry): the geometry of the AOI
 
         """
-        # clip image to the AOI, then reduce over its bbox: reducing over
+        # mask image to the AOI, then reduce over its bbox: reducing over
         # geometry=geometry would dissolve the AOI and can exceed the 2M-edge limit.
-        ee_image = image.clip(geometry)
+        ee_image = mask_to_aoi(image, geometry)
 
         # get minmax
         min_max = ee_image.reduceRegion(
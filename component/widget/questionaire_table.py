@@ -122,49 +122,49 @@ class Table(sw.Layout):
         view_ids = [row.layer_id for row in self.tbody.children]
         model_ids = self.model.ids
 
-        new_ids = [id_ for id_ in model_ids if id_ not in view_ids]
-        old_ids = [id_ for id_ in view_ids if id_ not in model_ids]
+        view_set, model_set = set(view_ids), set(model_ids)
+        new_ids = [id_ for id_ in model_ids if id_ not in view_set]
+        old_ids = [id_ for id_ in view_ids if id_ not in model_set]
 
         edited_id = (
-            self.dialog.w_id.v_model if self.dialog.w_id.v_model in view_ids else False
+            self.dialog.w_id.v_model if self.dialog.w_id.v_model in view_set else False
         )
-        # Add new rows from the model
+        # Add new rows from the model, all the rows in a single update of the table
         if new_ids:
-            for new_id in new_ids:
-                try:
-                    row = self.Row(
-                        self.model,
-                        new_id,
-                        self.dialog,
-                        aoi_model=self.aoi_model,
-                        alert=self.alert,
-                        preview_map=self.preview_map,
-                        gee_interface=self.gee_interface,
-                    )
-                except Exception as e:
-                    # remove the asset from the model if it fails
-                    self.model.remove(new_id, update=False)
-                    raise e
-
-                self.tbody.children = [*self.tbody.children, row]
+            new_rows = []
+            try:
+                for new_id in new_ids:
+                    try:
+                        new_rows.append(
+                            self.Row(
+                                self.model,
+                                new_id,
+                                self.dialog,
+                                aoi_model=self.aoi_model,
+                                alert=self.alert,
+                                preview_map=self.preview_map,
+                                gee_interface=self.gee_interface,
+                            )
+                        )
+                    except Exception as e:
+                        # remove the asset from the model if it fails
+                        self.model.remove(new_id, update=False)
+                        raise e
+            finally:
+                self.tbody.children = [*self.tbody.children, *new_rows]
         # Remove rows
         if old_ids:
-            for old_id in old_ids:
-                # Find row by layer_id property (works with VuetifyTemplate)
-                row_to_remove = None
-                for row in self.tbody.children:
-                    if hasattr(row, "layer_id") and row.layer_id == old_id:
-                        row_to_remove = row
-                        break
-
-                if row_to_remove:
+            old_set = set(old_ids)
+            kept_rows = []
+            for row in self.tbody.children:
+                if getattr(row, "layer_id", None) in old_set:
                     # unobserve the row to avoid ghost listeners
                     if self.type_ == "constraint":
-                        row_to_remove.unobserve_all()
+                        row.unobserve_all()
+                else:
+                    kept_rows.append(row)
 
-                    self.tbody.children = [
-                        row for row in self.tbody.children if row != row_to_remove
-                    ]
+            self.tbody.children = kept_rows
         if edited_id:
             if edited_id:
                 # Find row by layer_id property (works with VuetifyTemplate)
@@ -19,7 +19,8 @@ from component import parameter as cp
 from component.frontend.icons import icon
 from component.model.recipe import Recipe
 from component.scripts import gee
-from component.scripts.aoi_geometry import _aoi_bbox
+from component.scripts.aoi_geometry import aoi_bounds_async, mask_to_aoi
+from component.scripts.seplan import prepare_breakpoints_async
 from component.scripts.statistics import get_summary_statistics_async
 from component.scripts.validation import are_comparable, validate_scenarios_recipes
 from component.tile.dashboard_components import DashboardDialog
@@ -152,8 +153,7 @@ class CompareScenariosDialog(BaseDialog):
         recipes = await self.read_recipes_async()
 
         # Use the bounds to center the map
-        coords = bounds_result
-        map_.zoom_bounds((*coords[0], *coords[2]))
+        map_.zoom_bounds(bounds_result)
 
         layers = []
 
@@ -243,20 +243,24 @@ class CompareScenariosDialog(BaseDialog):
 
     async def get_maps(self, recipes):
         """Get map IDs for the recipes asynchronously."""
+        for recipe in recipes:
+            await prepare_breakpoints_async(self.gee_interface, recipe.seplan)
+
         # Get map IDs for both recipes
         map_tasks = [
             self.gee_interface.get_map_id_async(
-                recipe.seplan.get_constraint_index()
-                .unmask(0)
-                .clip(recipe.seplan_aoi.feature_collection),
+                mask_to_aoi(
+                    recipe.seplan.get_constraint_index().unmask(0),
+                    recipe.seplan_aoi.feature_collection,
+                ),
                 cp.layer_vis,
             )
             for recipe in recipes
         ]
 
         # Get the bounds for centering the map (using the first recipe's AOI)
-        bounds_task = self.gee_interface.get_info_async(
-            _aoi_bbox(recipes[0].seplan_aoi.feature_collection).coordinates().get(0)
+        bounds_task = aoi_bounds_async(
+            self.gee_interface, recipes[0].seplan_aoi.feature_collection
         )
 
         # Combine all tasks
@@ -3,6 +3,7 @@ import ipyvuetify as v
 from component.frontend.icons import icon
 from component.parameter.gui_params import SUITABILITY_LEVELS
 from component.parameter.vis_params import SUITABILITY_COLORS
+from component.scripts.plots import area_label, format_ci
 from component.types import SummaryStatsDict, RecipeStatsDict
 from component.widget.buttons import IconBtn
 from component.message import cm
@@ -40,12 +41,16 @@ def get_table_table_body(
                 image_sums = {
                     v["image"]: v["sum"] for v in area_data["suitability"]["values"]
                 }
+                image_cis = {
+                    v["image"]: v.get("ci") for v in area_data["suitability"]["values"]
+                }
                 total_sum = sum(
                     image_sums.get(level, 0) for level in suitability_levels
                 )
 
                 # Create table cells
-                tds = [v.Html(tag="td", children=[area_name], style_="width: 20%")]
+                label = area_label(area_name, area_data)
+                tds = [v.Html(tag="td", children=[label], style_="width: 20%")]
 
                 if include_recipe_column:
                     tds.append(
@@ -58,17 +63,22 @@ def get_table_table_body(
 
                 for level in suitability_levels:
                     value = image_sums.get(level, 0)
+                    ci = image_cis.get(level)
                     if total_sum > 0:
                         percentage = (value / total_sum) * 100
+                        percentage_ci = None if ci is None else ci / total_sum * 100
                     else:
                         percentage = 0.0
+                        percentage_ci = None
 
+                    absolute = f"{value:,.1f}{format_ci(ci, 1)}"
+                    relative = f"{percentage:.1f}%{format_ci(percentage_ci, 1, '%')}"
                     if display_type == "absolute":
-                        cell_content = f"{value:,.1f}"
+                        cell_content = absolute
                     elif display_type == "percentage":
-                        cell_content = f"{percentage:.1f}%"
+                        cell_content = relative
                     else:
-                        cell_content = f"{value:,.1f} ({percentage:.1f}%)"
+                        cell_content = f"{absolute} ({relative})"
                     tds.append(
                         v.Html(
                             tag="td",
@@ -75,3 +75,10 @@ def jupyter(session):
     session.install("-e", ".")
     session.run("jupyter", "trust", "no_ui.ipynb")
     session.run("jupyter", "notebook", "no_ui.ipynb")
+
+
+@nox.session(reuse_venv=True)
+def benchmark(session):
+    """Measure the startup of the app, e.g. ``nox -s benchmark -- --baseline old.json``."""
+    session.install("-e", ".")
+    session.run("python", "benchmarks/startup.py", *session.posargs)
@@ -1,8 +1,17 @@
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import ee
+import numpy as np
 import pytest
+import rasterio as rio
+from rasterio.transform import from_origin
 from component.model.recipe import Recipe
-from component.scripts import validation
+from component.scripts import statistics_store, validation
+from component.scripts.cache import JsonLRUCache
 from component.widget.alert_state import AlertState
+from component.scripts.local_seplan import LocalSeplan
 from sepal_ui.scripts import utils as su
 
 su.init_ee()
@@ -20,6 +29,68 @@ def load_recipe(recipe: Recipe, path: Path) -> Recipe:
     return recipe
 
 
+@pytest.fixture(autouse=True)
+def stats_store(monkeypatch, tmp_path):
+    """Isolate the persistent store of the dashboard statistics in every test."""
+    cache = JsonLRUCache(tmp_path / "statistics.json")
+    monkeypatch.setattr(statistics_store, "stats_cache", cache)
+
+    return cache
+
+
+def _ee_aoi() -> ee.FeatureCollection:
+    """A real, constructable ee.FeatureCollection standing in for an AOI."""
+    return ee.FeatureCollection([ee.Feature(ee.Geometry.Point([0, 0]).buffer(100))])
+
+
+@pytest.fixture
+def ee_aoi() -> ee.FeatureCollection:
+    """An AOI to build Earth Engine graphs with."""
+    return _ee_aoi()
+
+
+@pytest.fixture
+def mock_recipe():
+    """Build recipe mocks with real Earth Engine layers, for the statistics.
+
+    The factory takes the number of sub-AOIs ("Sub AOI <i>"), the names of the
+    benefits, costs and constraints, and the value of the constraint images.
+    """
+
+    def create(
+        nb_sub_aois=0,
+        benefits=("benefit",),
+        costs=("cost",),
+        constraints=("constraint",),
+        constraint_value=1,
+    ):
+        recipe = Mock()
+        recipe.recipe_session_path = "/tmp/test_recipe"
+        recipe.get_recipe_name.return_value = "test_recipe"
+        recipe.seplan.aoi_model.get_ee_features.return_value = (
+            {"Main AOI": {"ee_feature": _ee_aoi(), "color": "#FF0000"}},
+            {
+                f"Sub AOI {i}": {"ee_feature": _ee_aoi(), "color": "#00FF00"}
+                for i in range(nb_sub_aois)
+            },
+        )
+        recipe.seplan.get_benefits_list.return_value = [
+            (ee.Image(i), name) for i, name in enumerate(benefits)
+        ]
+        recipe.seplan.get_costs_list.return_value = [
+            (ee.Image(1), name) for name in costs
+        ]
+        recipe.seplan.get_masked_constraints_list.return_value = [
+            (ee.Image(constraint_value), name) for name in constraints
+        ]
+        recipe.seplan.get_constraint_index.return_value = ee.Image(1)
+        recipe.seplan.breakpoint_escalations = {}
+
+        return recipe
+
+    return create
+
+
 @pytest.fixture(scope="session")
 def empty_recipe() -> Recipe:
     """Create an empty recipe."""
@@ -42,3 +113,55 @@ def full_recipe() -> Recipe:
 @pytest.fixture(scope="session")
 def alert():
     return AlertState()
+
+
+SHAPE = (10, 10)
+
+
+def _write(path, array, nodata=None):
+    profile = {
+        "driver": "GTiff",
+        "height": SHAPE[0],
+        "width": SHAPE[1],
+        "count": 1,
+        "dtype": "float32",
+        "crs": "EPSG:4326",
+        "transform": from_origin(0, 10, 1, 1),
+        "nodata": nodata,
+    }
+    with rio.open(path, "w", **profile) as dst:
+        dst.write(array.astype("float32"), 1)
+
+    return path
+
+
+@pytest.fixture
+def local_seplan(tmp_path):
+    """A small recipe on synthetic rasters, read with 4x4 blocks."""
+    values = np.arange(1, 101, dtype="float32").reshape(SHAPE)
+    assets = {
+        "benefit_a": _write(tmp_path / "a.tif", values),
+        "benefit_b": _write(tmp_path / "b.tif", values[::-1]),
+        "cost": _write(tmp_path / "cost.tif", np.full(SHAPE, 2)),
+        "forest": _write(tmp_path / "forest.tif", (values % 2 == 0)),
+    }
+
+    benefit_model = SimpleNamespace(
+        assets=["benefit_a", "benefit_b"],
+        themes=["carbon", "bio"],
+        weights=[4, 2],
+        ids=["benefit_a", "benefit_b"],
+    )
+    cost_model = SimpleNamespace(assets=["cost"], ids=["cost"])
+    constraint_model = SimpleNamespace(
+        assets=["forest"],
+        ids=["forest"],
+        names=["forest"],
+        data_type=["binary"],
+        values=[[0]],
+    )
+
+    return (
+        LocalSeplan(benefit_model, constraint_model, cost_model, assets, block_size=4),
+        values,
+    )
@@ -3,7 +3,7 @@
 import pygaul
 import pytest
 
-from component.model.aoi_model import AoiModel
+from component.model.sepal_aoi_model import AoiModel
 
 
 @pytest.mark.asyncio
@@ -19,3 +19,32 @@ async def test_total_bounds_async_handles_dense_aoi():
     assert -12 < miny < -10
     assert 140 < maxx < 142
     assert 5 < maxy < 7
+
+
+@pytest.mark.asyncio
+async def test_aoi_bounds_are_resolved_once(monkeypatch, tmp_path):
+    """The bounds of an AOI are cached and reused as a constant rectangle."""
+    from unittest.mock import AsyncMock, Mock
+
+    import ee
+
+    from component.scripts import aoi_geometry
+    from component.scripts.cache import JsonLRUCache
+
+    monkeypatch.setattr(
+        aoi_geometry, "bounds_cache", JsonLRUCache(tmp_path / "aoi_bounds.json")
+    )
+    aoi = ee.FeatureCollection([ee.Feature(ee.Geometry.Point([0, 0]).buffer(100))])
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(
+        return_value=[[1, 2], [3, 2], [3, 4], [1, 4], [1, 2]]
+    )
+
+    assert '"Collection.map"' in aoi_geometry._aoi_bbox(aoi).serialize()
+
+    for _ in range(2):
+        bounds = await aoi_geometry.aoi_bounds_async(gee_interface, aoi)
+        assert bounds == [1, 2, 3, 4]
+
+    gee_interface.get_info_async.assert_awaited_once()
+    assert '"Collection.map"' not in aoi_geometry._aoi_bbox(aoi).serialize()
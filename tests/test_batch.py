@@ -0,0 +1,153 @@
+"""Test the resumable progress of the headless batch runner."""
+
+import csv
+import json
+from concurrent.futures import Future
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from component.scripts import batch, validation
+
+
+class _InlineExecutor:
+    """Run the recipes in the test process, one after the other."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _invalid_recipe(monkeypatch):
+    """Load every recipe as one with a validation error."""
+    result = validation.ValidationResult(
+        benefits_errors=[{"layer": "missing"}], raw_data={}, recipe_path="KEN.json"
+    )
+    recipe = Mock()
+    recipe.load_async = AsyncMock(return_value=result)
+    recipe.load_sanitized_async = AsyncMock()
+    recipe.get_recipe_name.return_value = "KEN"
+
+    monkeypatch.setattr(batch, "GEEInterface", Mock())
+    monkeypatch.setattr(batch, "Recipe", Mock(return_value=recipe))
+    monkeypatch.setattr(batch.validation, "sanitize_recipe_data", Mock(return_value={}))
+    monkeypatch.setattr(batch, "get_summary_statistics_async", AsyncMock())
+    monkeypatch.setattr(batch, "export_as_csv", Mock(return_value="KEN.csv"))
+
+    return recipe
+
+
+def test_batch_resumes_the_recipes_done(tmp_path):
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir()
+    for name in ["KEN", "RWA"]:
+        (recipe_dir / f"{name}.json").write_text("{}")
+
+    output = tmp_path / "output"
+    output.mkdir()
+    done = {
+        name: {"recipe": name, "status": "done", "csv": f"{name}.csv"}
+        for name in ["KEN", "RWA"]
+    }
+    (output / batch.PROGRESS_FILE).write_text(json.dumps(done))
+
+    # nothing is left to run, no worker is started
+    options = batch.BatchOptions(output=output)
+    progress = batch.run_batch(recipe_dir, options)
+    assert progress == done
+
+    summary = batch.write_summary(output, progress)
+    with summary.open() as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["recipe"] for row in rows] == ["KEN", "RWA"]
+    assert {row["status"] for row in rows} == {"done"}
+
+
+def test_batch_skips_its_own_progress_file(tmp_path):
+    (tmp_path / "KEN.json").write_text("{}")
+    (tmp_path / batch.PROGRESS_FILE).write_text("{}")
+
+    assert batch.find_recipes(tmp_path) == [tmp_path / "KEN.json"]
+
+
+def test_a_failing_recipe_is_a_failed_record(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        batch, "run_recipe_async", AsyncMock(side_effect=RuntimeError("boom"))
+    )
+
+    record = batch.run_recipe(tmp_path / "KEN.json", batch.BatchOptions(tmp_path))
+
+    assert record["recipe"] == "KEN"
+    assert record["status"] == "failed"
+    assert record["error"] == "RuntimeError: boom"
+    assert record["duration"] >= 0
+
+
+@pytest.mark.parametrize("sanitize,status", [(False, "invalid"), (True, "done")])
+def test_an_invalid_recipe_only_runs_sanitized(tmp_path, monkeypatch, sanitize, status):
+    recipe = _invalid_recipe(monkeypatch)
+    options = batch.BatchOptions(tmp_path, sanitize=sanitize)
+
+    record = batch.run_recipe(tmp_path / "KEN.json", options)
+
+    assert record["status"] == status
+    assert recipe.load_sanitized_async.await_count == int(sanitize)
+    assert batch.get_summary_statistics_async.await_count == int(sanitize)
+
+
+def test_progress_round_trip(tmp_path):
+    progress = {"KEN": {"recipe": "KEN", "status": "failed", "error": "boom"}}
+
+    batch._save_progress(tmp_path, progress)
+
+    assert batch.load_progress(tmp_path) == progress
+    assert [path.name for path in tmp_path.iterdir()] == [batch.PROGRESS_FILE]
+
+
+def test_unreadable_progress_is_ignored(tmp_path):
+    (tmp_path / batch.PROGRESS_FILE).write_text("{not json")
+
+    assert batch.load_progress(tmp_path) == {}
+
+
+def test_progress_is_saved_after_every_recipe(tmp_path, monkeypatch):
+    recipe_dir = tmp_path / "recipes"
+    recipe_dir.mkdir()
+    for name in ["KEN", "RWA"]:
+        (recipe_dir / f"{name}.json").write_text("{}")
+
+    async def run(recipe_path, options):
+        if recipe_path.stem == "RWA":
+            raise RuntimeError("boom")
+        return {"status": "done", "csv": "KEN.csv"}
+
+    saved = []
+    save_progress = batch._save_progress
+
+    def spy(output, progress):
+        save_progress(output, progress)
+        saved.append(batch.load_progress(output))
+
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(batch, "run_recipe_async", run)
+    monkeypatch.setattr(batch, "_save_progress", spy)
+
+    output = tmp_path / "output"
+    progress = batch.run_batch(recipe_dir, batch.BatchOptions(output=output))
+
+    # the recipes complete in any order
+    assert [len(snapshot) for snapshot in saved] == [1, 2]
+    assert batch.load_progress(output) == progress
+    assert progress["KEN"]["status"] == "done"
+    assert progress["RWA"]["status"] == "failed"
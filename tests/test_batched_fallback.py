@@ -55,6 +55,7 @@ def create_mock_recipe():
         (_img(), "Constraint 2"),
     ]
     mock_seplan.get_constraint_index.return_value = _img()
+    mock_seplan.breakpoint_escalations = {}
 
     return mock_recipe
 
@@ -137,3 +138,43 @@ async def test_fallback_on_429_error():
     assert "test_recipe" in result
     assert "Main AOI" in result["test_recipe"]
     assert attempt[0] > 1, "Should have retried after 429 error"
+
+
+@pytest.mark.asyncio
+async def test_escalation_on_memory_errors(stats_store):
+    """Only the reductions out of memory are retried, with a larger tileScale."""
+    from component.scripts.statistics import get_summary_statistics_async
+
+    mock_recipe = create_mock_recipe()
+    main_features = {"Main AOI": {"ee_feature": _fc(), "color": "#FF0000"}}
+    mock_recipe.seplan.aoi_model.get_ee_features.return_value = (main_features, {})
+    mock_recipe.seplan.get_benefits_list.return_value = [(_img(), "Benefit 1")]
+    mock_recipe.seplan.get_costs_list.return_value = [(_img(), "Cost 1")]
+    mock_recipe.seplan.get_masked_constraints_list.return_value = []
+
+    async def mock_get_info_async(obj):
+        # the AOI graph and the first try of every reduction run out of memory
+        graph = obj.serialize()
+        if '"tileScale"' not in graph:
+            raise Exception("User memory limit exceeded.")
+        if "Reducer.group" in graph:
+            return {"values": [{"image": 1, "sum": 10}], "total": 10}
+        return {"Item": {"values": {"mean": 50}, "total": [1000]}}
+
+    mock_gee_interface = Mock()
+    mock_gee_interface.get_info_async = AsyncMock(side_effect=mock_get_info_async)
+
+    result = await get_summary_statistics_async(
+        mock_gee_interface, mock_recipe, mode="sequential"
+    )
+
+    escalations = result["test_recipe"]["Main AOI"]["analysis"]["escalations"]
+    assert set(escalations) == {
+        "suitability: suitability",
+        "benefit: Item",
+        "cost: Item",
+    }
+    assert all(e["tile_scale"] == 4 for e in escalations.values())
+
+    # a larger tileScale gives the exact statistics, they are stored
+    assert len(stats_store) > 0
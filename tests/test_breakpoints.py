@@ -0,0 +1,71 @@
+"""Test the cache of the normalization breakpoints."""
+
+from unittest.mock import AsyncMock, Mock
+
+import ee
+import pytest
+
+from component.scripts import breakpoints
+from component.scripts.cache import JsonLRUCache
+from component.scripts.concurrency import ESCALATION_LADDER, Escalation
+
+OUT_OF_MEMORY = Exception("User memory limit exceeded.")
+
+
+@pytest.fixture(autouse=True)
+def breakpoint_cache(monkeypatch, tmp_path):
+    """Cache the breakpoints in a temporary file instead of the user cache."""
+    cache = JsonLRUCache(tmp_path / "breakpoints.json")
+    monkeypatch.setattr(breakpoints, "breakpoint_cache", cache)
+
+    return cache
+
+
+def _key(escalation=Escalation()):
+    aoi = ee.Geometry.Rectangle([0, 0, 1, 1])
+    return breakpoints.breakpoint_key(ee.Image(1), aoi, 100, [3, 97], escalation)
+
+
+def test_only_the_approximated_breakpoints_have_their_own_key():
+    assert _key(Escalation(tile_scale=16)) == _key()
+    assert _key(Escalation(tile_scale=16, scale_factor=4)) != _key()
+    assert _key(Escalation(16, 4, best_effort=True)) != _key(Escalation(16, 4))
+
+
+def test_find_breakpoints_prefers_the_exact_ones():
+    coarse = Escalation(tile_scale=16, scale_factor=4)
+    breakpoints.set_breakpoints({_key(coarse): [1.0, 2.0]})
+
+    assert breakpoints.find_breakpoints(_key) == ([1.0, 2.0], coarse)
+
+    breakpoints.set_breakpoints({_key(): [1.5, 2.5]})
+
+    assert breakpoints.find_breakpoints(_key) == ([1.5, 2.5], Escalation())
+
+
+@pytest.mark.asyncio
+async def test_escalated_percentile_is_recorded_not_cached_as_exact():
+    from component.scripts.seplan import resolve_percentile_async
+
+    # only the coarser scale fits in memory
+    coarse = ESCALATION_LADDER[3]
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(
+        side_effect=[OUT_OF_MEMORY] * 3 + [{"img_p3": 1.0, "img_p97": 2.0}]
+    )
+    aoi = ee.Geometry.Rectangle([0, 0, 1, 1])
+    image = ee.Image(1)
+
+    computed, escalation = await resolve_percentile_async(
+        gee_interface, image, aoi, scale=100
+    )
+
+    assert (computed, escalation) == (True, coarse)
+    assert breakpoints.get_breakpoints(_key()) is None
+    assert breakpoints.find_breakpoints(_key) == ([1.0, 2.0], coarse)
+
+    # the cached breakpoints keep their escalation
+    assert await resolve_percentile_async(gee_interface, image, aoi, scale=100) == (
+        False,
+        coarse,
+    )
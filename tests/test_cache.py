@@ -0,0 +1,61 @@
+"""Tests for the on-disk LRU cache backing the persistent caches."""
+
+from component.scripts.cache import JsonLRUCache
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.json"
+    JsonLRUCache(path).set("key", [1.0, 2.0])
+
+    assert JsonLRUCache(path).get("key") == [1.0, 2.0]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = JsonLRUCache(tmp_path / "cache.json", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_ignores_corrupted_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+
+    cache = JsonLRUCache(path)
+    assert cache.get("key", "default") == "default"
+
+    cache.set("key", "value")
+    assert JsonLRUCache(path).get("key") == "value"
+
+
+def test_cache_merges_writes_of_other_processes(tmp_path):
+    path = tmp_path / "cache.json"
+    first, second = JsonLRUCache(path), JsonLRUCache(path)
+    assert first.get("a") is None and second.get("b") is None
+
+    # both caches read the file before either wrote to it
+    first.set("a", 1)
+    second.set("b", 2)
+
+    assert JsonLRUCache(path).get("a") == 1
+    assert JsonLRUCache(path).get("b") == 2
+
+
+def test_cache_reads_the_writes_of_other_processes(tmp_path):
+    path = tmp_path / "cache.json"
+    first, second = JsonLRUCache(path), JsonLRUCache(path)
+    assert first.get("a") is None
+
+    # written after the first cache read the file
+    second.update({"a": 1, "b": 2})
+
+    assert first.get("a") == 1
+    assert first.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
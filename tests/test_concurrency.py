@@ -0,0 +1,152 @@
+"""Test the adaptive limiter of the Earth Engine requests."""
+
+import asyncio
+
+import pytest
+
+from component.scripts.concurrency import AdaptiveLimiter, is_rate_limit_error
+
+RATE_LIMIT = Exception("{'code': 429, 'message': 'Too many concurrent aggregations.'}")
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(RATE_LIMIT)
+    assert is_rate_limit_error(Exception("RESOURCE_EXHAUSTED"))
+    assert not is_rate_limit_error(ValueError("Image.select: band not found"))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_grows_within_bounds():
+    limiter = AdaptiveLimiter(initial=1, maximum=4)
+    in_flight, peak = [0], [0]
+
+    async def request():
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+
+    await asyncio.gather(*[limiter.run(request) for _ in range(40)])
+
+    assert limiter.concurrency == 4
+    assert 1 < peak[0] <= 4
+
+
+@pytest.mark.asyncio
+async def test_only_the_rate_limited_request_is_retried():
+    limiter = AdaptiveLimiter(initial=4, base_delay=0)
+    calls = {"ok": 0, "limited": 0}
+
+    async def ok():
+        calls["ok"] += 1
+        return "ok"
+
+    async def limited():
+        calls["limited"] += 1
+        if calls["limited"] < 3:
+            raise RATE_LIMIT
+        return "limited"
+
+    results = await asyncio.gather(limiter.run(ok), limiter.run(limited))
+
+    assert results == ["ok", "limited"]
+    assert calls == {"ok": 1, "limited": 3}
+    assert limiter.concurrency < 4
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried():
+    limiter = AdaptiveLimiter(base_delay=0)
+    calls = [0]
+
+    async def failing():
+        calls[0] += 1
+        raise ValueError("Image.select: band not found")
+
+    with pytest.raises(ValueError):
+        await limiter.run(failing)
+
+    assert calls[0] == 1
+    # the error frees its slot without growing the limit
+    assert limiter._active == 0
+    assert limiter.concurrency == 2
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_request_frees_its_slot():
+    limiter = AdaptiveLimiter(initial=1, maximum=1)
+    started = asyncio.Event()
+
+    async def hanging():
+        started.set()
+        await asyncio.sleep(3600)
+
+    task = asyncio.create_task(limiter.run(hanging))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter._active == 0
+
+    async def ok():
+        return "ok"
+
+    assert await asyncio.wait_for(limiter.run(ok), timeout=1) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded():
+    limiter = AdaptiveLimiter(max_retries=2, base_delay=0)
+    calls = [0]
+
+    async def limited():
+        calls[0] += 1
+        raise RATE_LIMIT
+
+    with pytest.raises(Exception, match="429"):
+        await limiter.run(limited)
+
+    assert calls[0] == 3
+
+
+MEMORY_LIMIT = Exception("User memory limit exceeded.")
+
+
+@pytest.mark.asyncio
+async def test_escalation_climbs_the_ladder():
+    from component.scripts.concurrency import (
+        ESCALATION_LADDER,
+        Escalation,
+        run_escalated,
+    )
+
+    tries = []
+
+    async def reduction(escalation):
+        tries.append(escalation)
+        if escalation.tile_scale < 16:
+            raise MEMORY_LIMIT
+        return escalation.reduce_kwargs(100, tile_scale=2)
+
+    result, escalation = await run_escalated(reduction)
+
+    assert tries == list(ESCALATION_LADDER[:3])
+    assert escalation == Escalation(tile_scale=16) and escalation.exact
+    assert result == {"scale": 100, "tileScale": 16}
+
+
+@pytest.mark.asyncio
+async def test_escalation_only_on_resource_errors():
+    from component.scripts.concurrency import run_escalated
+
+    tries = []
+
+    async def reduction(escalation):
+        tries.append(escalation)
+        raise ValueError("Image.select: band not found")
+
+    with pytest.raises(ValueError):
+        await run_escalated(reduction)
+
+    assert len(tries) == 1
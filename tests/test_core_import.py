@@ -0,0 +1,74 @@
+"""Test that the recipe and statistics layer imports without the UI."""
+
+import subprocess
+import sys
+
+import pytest
+
+CORE_MODULES = [
+    "component.model.recipe",
+    "component.scripts.statistics",
+    "component.scripts.compute",
+    "component.scripts.batch",
+]
+
+UI_MODULES = [
+    "component.widget",
+    "component.tile",
+    "sepal_ui.aoi",
+    "sepal_ui.mapping",
+    "sepal_ui.solara",
+    "ipecharts",
+    "ipyleaflet",
+]
+
+WIDGET_MODULES = ["ipyvuetify", "ipywidgets"]
+"""Loaded by any import of sepal_ui, as its ``__init__`` imports its styles."""
+
+LAZY_MODULES = ["jsonschema"]
+"""Slow to import, only imported when a recipe file is validated."""
+
+IMPORT_BUDGET = 5.0
+"""Seconds allowed to import the core modules in a fresh interpreter."""
+
+
+def _loaded_after_core_imports(modules):
+    """The modules loaded by the core modules, and the time to import them."""
+    # in a fresh interpreter: the other tests already imported the widgets
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        + "".join(f"import {module}\n" for module in CORE_MODULES)
+        + "print(time.perf_counter() - start)\n"
+        + f"print(sorted(m for m in sys.modules if m.startswith({tuple(modules)})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    duration, loaded = result.stdout.strip().splitlines()[-2:]
+
+    return loaded, float(duration)
+
+
+def test_core_imports_no_ui_module():
+    loaded, _ = _loaded_after_core_imports(UI_MODULES)
+
+    assert loaded == "[]"
+
+
+def test_core_imports_no_slow_module_within_budget():
+    loaded, duration = _loaded_after_core_imports(LAZY_MODULES)
+
+    assert loaded == "[]"
+    assert duration < IMPORT_BUDGET
+
+
+@pytest.mark.xfail(
+    reason="sepal_ui loads its widgets on import: its __init__ imports "
+    "frontend.styles, which loads ipyvuetify, ipywidgets and matplotlib",
+    strict=True,
+)
+def test_core_imports_no_widget_module():
+    loaded, _ = _loaded_after_core_imports(WIDGET_MODULES)
+
+    assert loaded == "[]"
@@ -0,0 +1,109 @@
+"""Test the quick estimate of the statistics from sample points."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+SAMPLES = [
+    {
+        "suitability": 1,
+        "benefit_0": 2,
+        "cost_0_total": 1,
+        "cost_0_kept": 1,
+        "constraint_0": 0,
+        "constraint_1": 0,
+    },
+    {
+        "suitability": 1,
+        "benefit_0": 4,
+        "cost_0_total": 1,
+        "cost_0_kept": 1,
+        "constraint_0": 0,
+        "constraint_1": 0,
+    },
+    # masked benefits are missing from the sampled values
+    {
+        "suitability": 2,
+        "cost_0_total": 1,
+        "cost_0_kept": 1,
+        "constraint_0": 0,
+        "constraint_1": 1,
+    },
+    {
+        "suitability": 6,
+        "cost_0_total": 1,
+        "cost_0_kept": 0,
+        "constraint_0": 1,
+        "constraint_1": 1,
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_estimate_from_sample_points(mock_recipe):
+    from component.scripts.statistics import get_estimated_statistics_async
+
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(
+        return_value={
+            "area": 100.0,
+            "samples": {"features": [{"properties": p} for p in SAMPLES]},
+        }
+    )
+
+    result = await get_estimated_statistics_async(
+        gee_interface, mock_recipe(constraints=["constraint 0", "constraint 1"])
+    )
+    main = result["test_recipe"]["Main AOI"]
+
+    suitability = {v["image"]: v["sum"] for v in main["suitability"]["values"]}
+    assert suitability == {1: 50, 2: 25, 6: 25}
+
+    benefit = main["benefit"][0]["benefit"]["values"]
+    assert (benefit["mean"], benefit["min"], benefit["max"]) == (3, 2, 4)
+    assert benefit["mean_ci"] > 0
+
+    cost = main["cost"][0]["cost"]
+    assert cost["total"] == [1] and cost["values"]["sum"] == 0.75
+
+    constraints = [next(iter(c.values()))["values"] for c in main["constraint"]]
+    assert [c["percent"] for c in constraints] == [25, 50]
+    assert [c["exclusive"] for c in constraints] == [0, 25]
+
+    assert main["analysis"]["estimate"] == {"points": 4, "confidence": 0.95}
+
+
+def test_estimate_weights_the_strata_by_area():
+    from component.scripts.statistics import _estimate_mean
+
+    # the small stratum is oversampled: the sample mean (0.25) is biased
+    samples = [{"stratum": "a", "stratum_area": 3, "value": 1.0}] * 2 + [
+        {"stratum": "b", "stratum_area": 1, "value": 0.0}
+    ] * 6
+
+    mean, ci = _estimate_mean(samples, lambda s: s["value"])
+
+    assert mean == pytest.approx(0.75)
+    assert ci == pytest.approx(0)
+
+
+def test_estimate_collapses_the_strata_with_a_single_point():
+    from component.scripts.statistics import _estimate_mean
+
+    samples = [
+        {"stratum": str(i), "stratum_area": 1, "value": float(i % 2)} for i in range(4)
+    ]
+
+    mean, ci = _estimate_mean(samples, lambda s: s["value"])
+
+    assert mean == pytest.approx(0.5)
+    assert ci > 0
+
+
+def test_estimate_draws_every_stratum_with_its_own_seed(ee_aoi):
+    from component.scripts.statistics import _estimate_points, _estimate_strata
+
+    graph = _estimate_points(_estimate_strata(ee_aoi), 10, seed=0).serialize()
+
+    # the points of a stratum are seeded by a random column of the strata
+    assert '"constantValue": "seed"' in graph
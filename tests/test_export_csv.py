@@ -16,6 +16,7 @@ EXPECTED_COLUMNS = [
     "Unit",
     "Aggregation",
     "Value",
+    "95% CI",
 ]
 
 
@@ -312,3 +313,104 @@ def test_returned_path_has_csv_extension(single_aoi_stats, patch_result_dir):
     path = export_as_csv(single_aoi_stats)
     assert Path(path).suffix == ".csv"
     assert Path(path).exists()
+
+
+def test_exclusive_constraint_coverage_row(single_aoi_stats, patch_result_dir):
+    """Packed constraint stats add the area masked by each constraint only."""
+    from component.scripts.compute import export_as_csv
+
+    stats = copy.deepcopy(single_aoi_stats)
+    for entry in stats["peru"]["PER_Amazonas"]["constraint"]:
+        for content in entry.values():
+            content["values"]["exclusive"] = 12.5
+
+    path = export_as_csv(stats)
+    _, df = read_csv_with_metadata(Path(path))
+
+    constraints = df[df["Theme"] == "Constraint"]
+    coverage = constraints[constraints["Aggregation"] == "coverage"]
+    exclusive = constraints[constraints["Aggregation"] == "exclusive coverage"]
+    assert list(exclusive["Indicator"]) == list(coverage["Indicator"])
+    assert (exclusive["Value"] == 12.5).all()
+    assert (exclusive["Unit"] == "% of AOI").all()
+
+
+def test_simplified_geometry_metadata(multi_aoi_stats, patch_result_dir):
+    """The tolerance and area error of simplified AOIs are reported."""
+    from component.scripts.compute import export_as_csv
+
+    stats = copy.deepcopy(multi_aoi_stats)
+    stats["peru"]["PER_Amazonas"]["analysis"] = {
+        "simplify_tolerance": 250,
+        "area_error": 0.0012,
+    }
+
+    path = export_as_csv(stats)
+    metadata, df = read_csv_with_metadata(Path(path))
+
+    assert (
+        "# Simplified geometry: PER_Amazonas (250 m tolerance, 0.12% area error)"
+        in metadata
+    )
+    assert set(df["Area"]) == {"PER — Amazonas", "site_north", "site_south"}
+
+
+def test_planned_scales_metadata(multi_aoi_stats, patch_result_dir):
+    """The scale of each area is reported when they differ."""
+    from component.scripts.compute import export_as_csv
+
+    stats = copy.deepcopy(multi_aoi_stats)
+    for area_name, scale in zip(stats["peru"], [500, 30, 30]):
+        stats["peru"][area_name]["analysis"] = {"scale": scale}
+
+    path = export_as_csv(stats)
+    metadata, _ = read_csv_with_metadata(Path(path))
+
+    assert (
+        "# Scale (m): 500 (PER_Amazonas), 30 (site_north), 30 (site_south)" in metadata
+    )
+
+
+def test_escalated_breakpoints_metadata(single_aoi_stats, patch_result_dir):
+    """Breakpoints approximated at a coarser scale are reported."""
+    from component.scripts.compute import export_as_csv
+
+    stats = copy.deepcopy(single_aoi_stats)
+    stats["peru"]["PER_Amazonas"]["analysis"] = {
+        "escalations": {
+            "breakpoints: quintile": {
+                "tile_scale": 16,
+                "scale_factor": 4,
+                "best_effort": False,
+            }
+        }
+    }
+
+    path = export_as_csv(stats)
+    metadata, _ = read_csv_with_metadata(Path(path))
+
+    assert (
+        "# Escalated reductions: PER_Amazonas breakpoints: quintile "
+        "(tileScale 16, scale x4)" in metadata
+    )
+
+
+def test_confidence_intervals_of_estimated_values(single_aoi_stats, patch_result_dir):
+    """The values estimated from sample points carry their confidence interval."""
+    from component.scripts.compute import export_as_csv
+
+    stats = copy.deepcopy(single_aoi_stats)
+    area = stats["peru"]["PER_Amazonas"]
+    area["benefit"][0]["biodiversity_intactness"]["values"]["mean_ci"] = 0.25
+    area["constraint"][0]["treecover_with_potential"]["values"]["percent_ci"] = 1.5
+    area["cost"][0]["opportunity_cost"]["values"]["sum_ci"] = 12.0
+    area["suitability"]["values"][0]["ci"] = 5000.0
+
+    path = export_as_csv(stats)
+    _, df = read_csv_with_metadata(Path(path))
+
+    intervals = df.dropna(subset=["95% CI"])
+    assert list(intervals["Theme"]) == ["Benefit", "Constraint", "Cost", "Suitability"]
+    assert list(intervals["95% CI"]) == [0.25, 1.5, 12.0, 5000.0]
+    # the exact values have no interval
+    assert df["95% CI"].isna().sum() == len(df) - 4
@@ -0,0 +1,51 @@
+"""Tests of the shared catalog of the default layers."""
+
+import csv
+
+from component.parameter.file_params import layer_list
+from component.scripts.layer_catalog import LayerCatalog, LayerInfo, get_layer_catalog
+
+
+def _layer(layer_id, theme, subtheme="", unit=""):
+    return LayerInfo(layer_id, theme, subtheme, f"assets/{layer_id}", unit, "")
+
+
+def test_catalog_is_parsed_once():
+    """Every caller shares the same catalog."""
+    assert get_layer_catalog() is get_layer_catalog()
+
+
+def test_catalog_matches_the_layer_list():
+    """The catalog keeps every row of the layer list, in order."""
+    with layer_list.open(newline="") as f:
+        ids = [row["layer_id"] for row in csv.DictReader(f)]
+
+    catalog = get_layer_catalog()
+    assert list(catalog.ids) == ids
+    assert catalog["treecover_with_potential"].theme == "constraint"
+
+
+def test_catalog_lookups():
+    """The layers are indexed by id, asset and theme."""
+    catalog = LayerCatalog(
+        [
+            _layer("a", "benefit", "carbon", "t/ha"),
+            _layer("b", "benefit", "local"),
+            _layer("c", "benefit", "carbon"),
+            _layer("d", "constraint"),
+        ],
+        {"assets/d": {"legend": {"1": "yes"}}},
+    )
+
+    assert "a" in catalog and "z" not in catalog
+    assert catalog.get("a", theme="benefit").layer_id == "a"
+    assert catalog.get("a", theme="cost") is None
+    assert catalog.by_asset("assets/d").layer_id == "d"
+    assert catalog.by_asset("assets/d", theme="benefit") is None
+    assert [ly.layer_id for ly in catalog.by_theme("benefit", "carbon")] == ["a", "c"]
+    assert catalog.by_theme("cost") == ()
+    assert catalog.subthemes("benefit") == ("carbon", "local")
+    assert catalog.subthemes("constraint") == ()
+    assert catalog.unit("a") == "t/ha" and catalog.unit("z") == ""
+    assert catalog.legend("assets/d") == {"1": "yes"}
+    assert catalog.legend("assets/a") is None
@@ -0,0 +1,63 @@
+"""Tests for the offline NumPy/rasterio evaluation of the seplan index."""
+
+import numpy as np
+import rasterio as rio
+
+from component.scripts.local_seplan import apply_quintiles
+
+
+def _expected_index(values):
+    """Whole-array reference of the EE pipeline on the synthetic rasters."""
+
+    def quintile(v):
+        breakpoints = np.percentile(v, [20, 40, 60, 80], method="inverted_cdf")
+        return apply_quintiles(v, breakpoints)
+
+    a, b = quintile(values.astype("float64")), quintile(values[::-1].astype("float64"))
+    benefit_index = a * (4 / 6) + b * (2 / 6)
+    ratio = benefit_index / 2
+    low, high = np.percentile(ratio, [3, 97], method="inverted_cdf")
+    stretched = np.clip((ratio - low) / (high - low), 0, 1)
+    constraint_index = stretched * 4 + 1
+    constraint_index[values % 2 != 0] = np.nan
+
+    return benefit_index, constraint_index
+
+
+def test_quintiles_match_exact_percentiles(local_seplan):
+    seplan, values = local_seplan
+    seplan.resolve_breakpoints()
+
+    # 1..100 splits in 5 classes of 20 values
+    classes = apply_quintiles(values, seplan._quintiles[0])
+    np.testing.assert_array_equal(classes, np.ceil(values / 20))
+
+
+def test_blocks_match_whole_array_reference(local_seplan):
+    seplan, values = local_seplan
+    benefit_index, constraint_index = _expected_index(values)
+
+    result = {
+        "benefit_index": np.empty(values.shape),
+        "constraint_index": np.empty(values.shape),
+    }
+    for window, block in seplan.iter_blocks():
+        rows, cols = window.toslices()
+        for layer in result:
+            result[layer][rows, cols] = block[layer]
+
+    np.testing.assert_allclose(result["benefit_index"], benefit_index)
+    np.testing.assert_allclose(
+        result["constraint_index"], constraint_index, atol=1e-3, equal_nan=True
+    )
+
+
+def test_export_writes_masked_index(local_seplan, tmp_path):
+    seplan, values = local_seplan
+    path = seplan.export(tmp_path / "index.tif")
+
+    with rio.open(path) as src:
+        index = src.read(1)
+
+    assert np.isnan(index[values % 2 != 0]).all()
+    assert ((index[values % 2 == 0] >= 1) & (index[values % 2 == 0] <= 5)).all()
@@ -0,0 +1,57 @@
+"""Tests for the local zonal statistics of the offline engine."""
+
+import pytest
+from shapely.geometry import box
+
+from component.scripts.local_statistics import get_summary_statistics_local
+
+
+@pytest.fixture
+def stats(local_seplan):
+    seplan, values = local_seplan
+    aois = {
+        "primary": {"geometries": [box(0, 0, 10, 10)], "color": "#000000"},
+        # overlaps the primary AOI, so it is rasterized in another zone grid
+        "west": {"geometries": [box(0, 0, 5, 10)], "color": "#ff0000"},
+    }
+
+    return get_summary_statistics_local(seplan, "recipe", aois)["recipe"], values
+
+
+def test_summary_shape(stats):
+    area_stats, _ = stats
+
+    assert list(area_stats) == ["primary", "west"]
+    for data in area_stats.values():
+        assert set(data) == {"suitability", "benefit", "cost", "constraint", "color"}
+        assert [list(d) for d in data["benefit"]] == [["benefit_a"], ["benefit_b"]]
+
+
+def test_areas_add_up(stats):
+    area_stats, _ = stats
+    primary, west = area_stats["primary"], area_stats["west"]
+
+    suitability_total = sum(v["sum"] for v in primary["suitability"]["values"])
+    assert suitability_total == pytest.approx(primary["suitability"]["total"])
+    assert west["suitability"]["total"] == pytest.approx(
+        primary["suitability"]["total"] / 2, rel=1e-2
+    )
+
+    # every odd value is excluded by the binary forest constraint
+    forest = primary["constraint"][0]["forest"]
+    assert forest["values"]["percent"] == pytest.approx(50, rel=1e-2)
+    masked = next(v for v in primary["suitability"]["values"] if v["image"] == 6)
+    assert masked["sum"] == pytest.approx(forest["total"][0] / 2, rel=1e-2)
+
+
+def test_benefit_means_use_constraint_mask(stats):
+    area_stats, values = stats
+    benefit = area_stats["primary"]["benefit"][0]["benefit_a"]
+    kept = values[values % 2 == 0]
+
+    assert benefit["values"]["mean"] == pytest.approx(kept.mean())
+    assert benefit["values"]["min"] == kept.min()
+    assert benefit["values"]["max"] == kept.max()
+
+    # min/max are only reported for the primary AOI
+    assert area_stats["west"]["benefit"][0]["benefit_a"]["values"]["max"] == 0
@@ -0,0 +1,83 @@
+"""Tests of the layer tables of the benefit, constraint and cost models."""
+
+import pytest
+
+from component.model.benefit_model import BenefitModel
+from component.model.constraint_model import ConstraintModel
+from component.model.cost_model import CostModel
+
+
+def _benefit(i):
+    return {
+        "theme": "custom",
+        "name": f"Layer {i}",
+        "id": f"custom_{i}",
+        "asset": f"projects/test/assets/layer_{i}",
+        "desc": "",
+        "unit": "ha",
+    }
+
+
+def _columns(model):
+    return [getattr(model, column) for column in model._columns]
+
+
+def test_columns_stay_aligned():
+    """Every operation keeps the same number of rows in all the columns."""
+    model = BenefitModel()
+    model.add_layers(_benefit(i) for i in range(5))
+    model.remove_layers(["custom_1", "custom_3"])
+    model.update_layers([{"id": "custom_4", "name": "Renamed"}])
+
+    assert len({len(column) for column in _columns(model)}) == 1
+    data = model.get_layer_data("custom_4")
+    assert data["name"] == "Renamed"
+    assert data["weight"] == 4
+    assert model.ids[-3:] == ["custom_0", "custom_2", "custom_4"]
+
+
+def test_get_index_follows_the_rows():
+    """The id index is kept up to date when rows move or lists are replaced."""
+    model = CostModel()
+    model.add_layers(
+        {"name": "", "id": f"c{i}", "asset": "", "desc": ""} for i in range(3)
+    )
+    model.remove(model.ids[0])
+
+    for i, id_ in enumerate(model.ids):
+        assert model.get_index(id_) == i
+
+    model.import_data({**model.export_data(), "ids": list(reversed(model.ids))})
+    assert model.get_index(model.ids[0]) == 0
+
+    with pytest.raises(ValueError):
+        model.get_index("missing")
+
+
+def test_batches_trigger_a_single_update():
+    """A batch fires "updated" and "new_changes" once, whatever its size."""
+    model = BenefitModel()
+    events = []
+    model.observe(
+        lambda change: events.append(change["name"]), ["updated", "new_changes"]
+    )
+
+    model.add_layers(_benefit(i) for i in range(50))
+    assert events == ["updated", "new_changes"]
+
+    events.clear()
+    model.remove_layers([f"custom_{i}" for i in range(50)], update=False)
+    assert events == ["new_changes"]
+
+    with pytest.raises(ValueError):
+        model.remove_layers(["missing"])
+
+
+def test_added_layers_do_not_share_defaults():
+    """Every constraint gets its own list of values."""
+    model = ConstraintModel()
+    for i in range(2):
+        model.add("custom", f"Layer {i}", f"c{i}", "asset", "", "", "binary")
+
+    model.update_value("c0", [1])
+    assert model.get_layer_data("c1")["value"] == []
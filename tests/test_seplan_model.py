@@ -24,3 +24,54 @@ def test_get_weighted_benefits():
     ]["min"]
 
     assert weighted_val == 0.7330072945915163
+
+
+def test_weight_edit_reuses_memoized_stages():
+    """Weight edits must not rebuild the normalized benefits nor the mask."""
+    from component.model.recipe import Recipe
+
+    recipe = Recipe()
+    recipe.seplan_aoi.feature_collection = ee.FeatureCollection(
+        ee.Geometry.Rectangle([107, -7.5, 108, -6.5])
+    )
+    seplan = recipe.seplan
+
+    normalized = seplan.get_normalized_benefits()
+    mask = seplan.get_constraint_mask()
+
+    benefit_id = recipe.benefit_model.ids[0]
+    recipe.benefit_model.update_value(benefit_id, 1)
+    seplan.get_benefit_index()
+
+    assert seplan.get_normalized_benefits() is normalized
+    assert seplan.get_constraint_mask() is mask
+
+    # removing a benefit changes the assets, so the normalization is rebuilt
+    recipe.benefit_model.remove(benefit_id)
+    assert seplan.get_normalized_benefits() is not normalized
+
+
+def test_index_getters_share_stages():
+    """Every consumer must get the same stage objects until a model changes."""
+    from component.model.recipe import Recipe
+
+    recipe = Recipe()
+    recipe.seplan_aoi.feature_collection = ee.FeatureCollection(
+        ee.Geometry.Rectangle([107, -7.5, 108, -6.5])
+    )
+    seplan = recipe.seplan
+
+    constraint_index = seplan.get_constraint_index()
+    benefit_index = seplan.get_benefit_index()
+
+    assert seplan.get_constraint_index() is constraint_index
+    assert seplan.get_benefit_index() is benefit_index
+    assert seplan.get_benefit_index(clip=False) is seplan._stages["benefit_index"]
+
+    # a weight edit only invalidates the stages built on top of the weights
+    normalized = seplan.get_normalized_benefits()
+    recipe.benefit_model.update_value(recipe.benefit_model.ids[0], 2)
+
+    assert seplan.get_benefit_index() is not benefit_index
+    assert seplan.get_constraint_index() is not constraint_index
+    assert seplan.get_normalized_benefits() is normalized
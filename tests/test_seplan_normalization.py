@@ -3,7 +3,7 @@
 import ee
 import pygaul
 
-from component.scripts.seplan import _percentile
+from component.scripts.seplan import _percentile, normalize_benefits
 
 
 def test_percentile_normalization_handles_dense_aoi():
@@ -21,3 +21,45 @@ def test_percentile_normalization_handles_dense_aoi():
     ).getInfo()
 
     assert value is not None
+
+
+def _single_quintiles(image, aoi):
+    """The per-image quintile normalization, reduced on its own over the aoi."""
+    band_name = ee.String(image.bandNames().get(0))
+    breakpoints = image.clip(aoi).reduceRegion(
+        reducer=ee.Reducer.percentile(percentiles=[20, 40, 60, 80]),
+        geometry=aoi,
+        tileScale=2,
+        scale=100,
+        maxPixels=1e13,
+    )
+    low, lowmed, highmed, high = [
+        ee.Number(breakpoints.get(band_name.cat(f"_p{p}"))) for p in [20, 40, 60, 80]
+    ]
+
+    return (
+        ee.Image(0)
+        .where(image.gt(0).And(image.lte(low)), 1)
+        .where(image.gt(low).And(image.lte(lowmed)), 2)
+        .where(image.gt(lowmed).And(image.lte(highmed)), 3)
+        .where(image.gt(highmed).And(image.lte(high)), 4)
+        .where(image.gt(high), 5)
+    ).selfMask()
+
+
+def test_normalize_benefits_matches_single_quintiles():
+    """The fused normalization must give the same classes as per-image quintiles."""
+    aoi = ee.Geometry.Rectangle([107, -7.5, 108, -6.5])
+    images = [ee.Image("USGS/SRTMGL1_003"), ee.Image("USGS/GTOPO30")]
+
+    fused = normalize_benefits(images, aoi)
+    single = [_single_quintiles(image, aoi) for image in images]
+
+    point = ee.Geometry.Point([107.6, -6.9])
+    for fused_image, single_image in zip(fused, single):
+        values = (
+            ee.Image.cat([fused_image.rename("fused"), single_image.rename("single")])
+            .reduceRegion(reducer=ee.Reducer.first(), geometry=point, scale=1000)
+            .getInfo()
+        )
+        assert values["fused"] == values["single"]
@@ -0,0 +1,37 @@
+"""Test the comparison of the startup benchmark with its baseline."""
+
+import importlib.util
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "startup", Path(__file__).parents[1] / "benchmarks" / "startup.py"
+)
+startup = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(startup)
+
+BASELINE = {"recipe": {"median": 1.0}, "page": {"median": 2.0}}
+
+
+def test_compare_flags_the_slower_cases():
+    results = {"recipe": {"median": 1.5}, "page": {"median": 2.1}}
+
+    regressions = startup.compare(results, BASELINE, threshold=0.1, min_delta=0.05)
+
+    assert regressions == ["recipe: 1.000s -> 1.500s (+50%)"]
+
+
+def test_compare_ignores_the_small_slowdowns():
+    results = {"recipe": {"median": 1.2}, "page": {"median": 2.0}}
+
+    assert startup.compare(results, BASELINE, threshold=0.1, min_delta=0.5) == []
+
+
+def test_compare_flags_the_cases_without_a_median():
+    results = {"recipe": {"error": "ImportError: boom"}, "map": {"median": 9.0}}
+
+    regressions = startup.compare(results, BASELINE)
+
+    assert regressions == [
+        "recipe: 1.000s -> failed (ImportError: boom)",
+        "page: 2.000s -> not run",
+    ]
@@ -0,0 +1,108 @@
+"""Test the number of aggregations in the statistics graphs."""
+
+import ee
+
+
+def _aoi():
+    return ee.FeatureCollection([ee.Feature(ee.Geometry.Point([0, 0]).buffer(100))])
+
+
+def _nb_reductions(ee_object) -> int:
+    """Count the reduceRegion nodes of a (deduplicated) serialized graph."""
+    return ee_object.serialize().count('"Image.reduceRegion"')
+
+
+def test_costs_share_one_reduction():
+    from component.scripts.statistics import get_costs_sum
+
+    cost_list = [[ee.Image(i), f"cost {i}"] for i in range(1, 4)]
+    costs = get_costs_sum(cost_list, _aoi(), ee.Image(1))
+
+    assert _nb_reductions(costs) == 1
+
+
+def test_benefits_share_one_reduction():
+    from component.scripts.statistics import get_benefits_mean
+
+    benefit_list = [[ee.Image(i), f"benefit {i}"] for i in range(1, 4)]
+    for main_aoi in [True, False]:
+        benefits = get_benefits_mean(benefit_list, _aoi(), ee.Image(1), main_aoi)
+        assert _nb_reductions(benefits) == 1
+
+
+def test_constraints_share_one_reduction():
+    from component.scripts.statistics import get_constraints_cover
+
+    constraint_list = [[ee.Image(1).selfMask(), f"constraint {i}"] for i in range(3)]
+    cover = get_constraints_cover(constraint_list, _aoi())
+
+    assert _nb_reductions(cover) == 1
+
+
+def test_fallback_reduces_the_constraints_together():
+    from types import SimpleNamespace
+
+    from component.scripts.statistics import _aoi_stats_items
+
+    constraint_list = [[ee.Image(1).selfMask(), f"constraint {i}"] for i in range(3)]
+    inputs = SimpleNamespace(
+        main_ee_name="aoi",
+        mask_out_areas=ee.Image(1),
+        wlc_out=ee.Image(1),
+        benefit_list=[],
+        cost_list=[],
+        constraint_list=constraint_list,
+    )
+    data = {"ee_feature": _aoi(), "scale": 100}
+
+    items = _aoi_stats_items(inputs, "aoi", data, [("constraint", "constraint 1")])
+
+    assert [item[:2] for item in items] == [
+        ("constraint", ("constraint 0", "constraint 1", "constraint 2"))
+    ]
+    graph = items[0][2]()
+    assert _nb_reductions(graph) == 1
+    assert '"exclusive"' in graph.serialize()
+
+
+def test_reductions_use_the_aoi_mask():
+    from component.scripts.aoi_geometry import aoi_mask
+    from component.scripts.statistics import get_costs_sum
+
+    assert aoi_mask(_aoi()).serialize() == aoi_mask(_aoi()).serialize()
+
+    costs = get_costs_sum([[ee.Image(1), "cost"]], _aoi(), ee.Image(1)).serialize()
+    assert '"Image.paint"' in costs
+    assert '"Image.clip"' not in costs
+
+
+def test_scale_fits_the_pixel_budget():
+    from component.scripts.statistics import STATS_SCALES, plan_stats_scale
+
+    # a drawn sub-AOI of a few km², a country and a continent
+    site = plan_stats_scale([30.0, -2.0, 30.05, -1.95])
+    country = plan_stats_scale([28.8, -2.9, 30.9, -1.0])
+    continent = plan_stats_scale([-82.0, -56.0, -34.0, 13.0])
+
+    assert site == STATS_SCALES[0]
+    assert site < country < continent
+    assert plan_stats_scale([-82.0, -56.0, -34.0, 13.0], pixel_budget=1) == 5000
+
+
+def test_simplification_error_is_the_symmetric_difference():
+    """Land gained and lost by the simplification don't cancel out."""
+    from component.scripts.aoi_geometry import _simplification_error
+
+    graph = _simplification_error(_aoi(), 100).serialize()
+
+    assert graph.count('"Geometry.symmetricDifference"') == 1
+
+
+def test_simplification_measures_the_tolerances_coarsest_first():
+    """Every tolerance is measured in the branch where the coarser ones don't fit."""
+    from component.scripts.aoi_geometry import _simplification_choice
+
+    graph = _simplification_choice(_aoi(), [1000, 100], 0.005).serialize()
+
+    assert graph.count('"Algorithms.If"') == 4  # 2 tolerances x (area > 0, fits)
+    assert graph.count('"Geometry.symmetricDifference"') == 2
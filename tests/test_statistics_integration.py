@@ -89,6 +89,7 @@ def mock_recipe(simple_test_image, test_feature_collection):
     seplan.get_constraint_index.return_value = (
         simple_test_image.divide(500).floor().clamp(1, 5)
     )
+    seplan.breakpoint_escalations = {}
 
     return recipe
 
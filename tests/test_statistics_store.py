@@ -0,0 +1,111 @@
+"""Test the persistent store of the dashboard statistics."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from component.scripts import statistics_store
+
+
+def _stats(name, value):
+    return {name: {"total": [value], "values": {"mean": value}}}
+
+
+def test_failed_cells_are_not_stored(stats_store):
+    key = statistics_store.cell_key("aoi", "benefit", "layer", "mask")
+    failed = statistics_store.cell_key("aoi", "benefit", "other", "mask")
+
+    statistics_store.save_cells(
+        {key: {"total": [1]}, failed: {"values": {}, "total": [0], "error": "boom"}}
+    )
+
+    assert statistics_store.load_cells([key, failed]) == {key: {"total": [1]}}
+    assert key != statistics_store.cell_key("aoi", "benefit", "layer", "new mask")
+
+
+def test_constraint_cells_without_exclusive_are_not_stored(stats_store):
+    from component.scripts.statistics import _save_aoi_cells
+
+    keys = {("constraint", "partial"): "partial", ("constraint", "full"): "full"}
+    inputs = SimpleNamespace(cell_keys={"aoi": keys})
+
+    _save_aoi_cells(
+        inputs,
+        "aoi",
+        {
+            ("constraint", "partial"): {"values": {"percent": 10}, "total": [1]},
+            ("constraint", "full"): {
+                "values": {"percent": 10, "exclusive": 5},
+                "total": [1],
+            },
+        },
+    )
+
+    assert list(statistics_store.load_cells(keys.values())) == ["full"]
+
+
+@pytest.mark.asyncio
+async def test_only_missing_cells_are_computed(mock_recipe):
+    from component.scripts.statistics import get_summary_statistics_async
+
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(
+        return_value={
+            "suitability": {"values": [{"image": 1, "sum": 10}], "total": 10},
+            "benefit": [_stats("b1", 1)],
+            "cost": [_stats("cost", 2)],
+            "constraint": [_stats("constraint", 3)],
+            "color": "#FF0000",
+        }
+    )
+    first = await get_summary_statistics_async(
+        gee_interface, mock_recipe(benefits=["b1"])
+    )
+
+    # a new benefit only requests its own statistics
+    gee_interface.get_info_async = AsyncMock(
+        return_value={"benefit": [_stats("b2", 4)], "color": "#FF0000"}
+    )
+    result = await get_summary_statistics_async(
+        gee_interface, mock_recipe(benefits=["b1", "b2"])
+    )
+
+    gee_interface.get_info_async.assert_awaited_once()
+    main = result["test_recipe"]["Main AOI"]
+    assert main["benefit"] == [_stats("b1", 1), _stats("b2", 4)]
+    assert main["cost"] == first["test_recipe"]["Main AOI"]["cost"]
+
+    # an unchanged recipe is read from the store
+    gee_interface.get_info_async = AsyncMock()
+    again = await get_summary_statistics_async(
+        gee_interface, mock_recipe(benefits=["b1", "b2"])
+    )
+
+    gee_interface.get_info_async.assert_not_awaited()
+    assert again == result
+
+
+@pytest.mark.asyncio
+async def test_constraint_edit_invalidates_the_masked_cells(mock_recipe):
+    from component.scripts.statistics import get_summary_statistics_async
+
+    response = {
+        "suitability": {"values": [{"image": 1, "sum": 10}], "total": 10},
+        "benefit": [_stats("b1", 1)],
+        "cost": [_stats("cost", 2)],
+        "constraint": [_stats("constraint", 3)],
+        "color": "#FF0000",
+    }
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(return_value=response)
+    await get_summary_statistics_async(gee_interface, mock_recipe(benefits=["b1"]))
+
+    edited = {**response, "cost": [_stats("cost", 5)]}
+    gee_interface.get_info_async = AsyncMock(return_value=edited)
+    result = await get_summary_statistics_async(
+        gee_interface, mock_recipe(benefits=["b1"], constraint_value=0)
+    )
+
+    gee_interface.get_info_async.assert_awaited_once()
+    assert result["test_recipe"]["Main AOI"]["cost"] == [_stats("cost", 5)]
@@ -0,0 +1,48 @@
+"""Test the streaming of the statistics as the AOIs are computed."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_partial_results_keep_the_primary_aoi_first(mock_recipe):
+    from component.scripts.statistics import iter_summary_statistics_async
+
+    calls = [0]
+
+    async def get_info_async(obj):
+        # the primary AOI is the first request and the slowest one
+        calls[0] += 1
+        await asyncio.sleep(0.05 if calls[0] == 1 else 0.01)
+        return {"suitability": {}, "color": ""}
+
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(side_effect=get_info_async)
+
+    aoi_names = ["Main AOI", "Sub AOI 0", "Sub AOI 1", "Sub AOI 2"]
+    partials = [
+        list(partial["test_recipe"])
+        async for partial in iter_summary_statistics_async(
+            gee_interface, mock_recipe(nb_sub_aois=3), mode="sequential"
+        )
+    ]
+
+    assert partials[-1] == aoi_names
+    for names in partials:
+        assert names == aoi_names[: len(names)]
+
+
+@pytest.mark.asyncio
+async def test_summary_statistics_is_the_last_partial(mock_recipe):
+    from component.scripts.statistics import get_summary_statistics_async
+
+    gee_interface = Mock()
+    gee_interface.get_info_async = AsyncMock(return_value={"color": ""})
+
+    result = await get_summary_statistics_async(
+        gee_interface, mock_recipe(nb_sub_aois=1), mode="sequential"
+    )
+
+    assert list(result["test_recipe"]) == ["Main AOI", "Sub AOI 0"]
@@ -0,0 +1,168 @@
+"""Test the single-request statistics over the zone collection."""
+
+from unittest.mock import AsyncMock, Mock
+
+import ee
+import numpy as np
+import pytest
+
+
+def _feature(aoi, **properties):
+    """A downloaded feature of the reductions of the given AOI index."""
+    return {"type": "Feature", "properties": {"seplan_aoi": aoi, **properties}}
+
+
+def test_aggregate_zones_merges_features_of_an_aoi():
+    from component.scripts.statistics import _aggregate_zones
+
+    features = [
+        _feature(0, area_sum=10, benefit_0_min=2, benefit_0_max=5),
+        _feature(0, area_sum=5, benefit_0_min=1, benefit_0_max=None),
+        _feature(1, area_sum=3, benefit_0_min=None, benefit_0_max=None),
+    ]
+
+    zones = _aggregate_zones(features, 2)
+
+    assert zones[0] == {"area_sum": 15, "benefit_0_min": 1, "benefit_0_max": 5}
+    assert zones[1] == {"area_sum": 3}
+
+
+def test_aggregate_zones_adds_the_constraint_groups_by_code():
+    from component.scripts.statistics import _aggregate_zones
+
+    features = [
+        _feature(0, groups=[{"code": 0, "sum": 6}, {"code": 1, "sum": 2}]),
+        _feature(0, groups=[{"code": 1, "sum": 1}, {"code": 3, "sum": 4}]),
+    ]
+
+    zones = _aggregate_zones(features, 1)
+
+    assert zones[0] == {"groups": {0: 6, 1: 3, 3: 4}}
+
+
+def test_decode_constraint_groups_of_overlapping_masks():
+    """The grouped areas decode into the coverage and exclusive coverage."""
+    from component.scripts.statistics import decode_constraint_groups
+
+    # 1 where the constraint masks out the land, on a grid of 1 ha pixels
+    first = np.zeros((10, 10), dtype=int)
+    first[:6] = 1
+    second = np.zeros((10, 10), dtype=int)
+    second[4:8] = 1
+    third = np.zeros((10, 10), dtype=int)
+    masks = [first, second, third]
+
+    # the codes of pack_constraints, grouped by ee.Reducer.sum().group()
+    codes = sum(mask << i for i, mask in enumerate(masks))
+    groups = {
+        int(code): float(count)
+        for code, count in zip(*np.unique(codes, return_counts=True))
+    }
+
+    total, percents, exclusives = decode_constraint_groups(groups, len(masks))
+
+    assert total == 100
+    assert percents == [60, 40, 0]
+    # rows 4 and 5 are masked by both
+    assert exclusives == [40, 20, 0]
+    assert decode_constraint_groups({}, 1) == (0, [None], [None])
+
+
+def test_zone_reductions_count_overlapping_features_once(ee_aoi):
+    """Each AOI is reduced as a whole over its mask, not feature by feature."""
+    from component.scripts.statistics import _zone_reductions
+
+    # two overlapping features in the same AOI
+    aoi = ee.FeatureCollection(
+        [
+            ee.Feature(ee.Geometry.Point([0, 0]).buffer(100)),
+            ee.Feature(ee.Geometry.Point([0, 0.0005]).buffer(100)),
+        ]
+    )
+    group = {"AOI": {"ee_feature": aoi}, "Other AOI": {"ee_feature": ee_aoi}}
+
+    graph = _zone_reductions(ee.Image(1), ee.Image(2), group, 100).serialize()
+
+    assert '"Image.reduceRegions"' not in graph
+    assert graph.count('"Image.paint"') == 2
+    # the statistics and the constraint groups of each AOI
+    assert graph.count('"Image.reduceRegion"') == 4
+
+
+@pytest.mark.asyncio
+async def test_collection_mode_reduces_the_aois_together(mock_recipe):
+    from component.scripts.statistics import get_summary_statistics_async
+
+    recipe = mock_recipe(nb_sub_aois=1)
+
+    common = {
+        "area_sum": 100,
+        "suitability_1_sum": 60,
+        "suitability_6_sum": 40,
+        "benefit_0_sum": 30,
+        "benefit_0_count_sum": 10,
+        "benefit_0_min": 1,
+        "benefit_0_max": 5,
+        "cost_0_total_sum": 200,
+        "cost_0_kept_sum": 100,
+    }
+    groups = [{"code": 0, "sum": 60}, {"code": 1, "sum": 40}]
+    gee_interface = Mock()
+    # the primary AOI and the chunk of sub-AOIs are each their own request
+    gee_interface.get_info_async = AsyncMock(
+        return_value={"features": [_feature(0, **common, groups=groups)]}
+    )
+
+    result = await get_summary_statistics_async(gee_interface, recipe)
+
+    assert gee_interface.get_info_async.await_count == 2
+    main, sub = result["test_recipe"]["Main AOI"], result["test_recipe"]["Sub AOI 0"]
+
+    assert main["suitability"] == {
+        "values": [{"image": 1, "sum": 60}, {"image": 6, "sum": 40}],
+        "total": 100,
+    }
+    assert main["benefit"] == [
+        {"benefit": {"total": [3.0], "values": {"mean": 3.0, "max": 5, "min": 1}}}
+    ]
+    assert sub["benefit"][0]["benefit"]["values"] == {"mean": 3.0, "max": 0, "min": 0}
+    assert main["cost"] == [{"cost": {"total": [2.0], "values": {"sum": 1.0}}}]
+    assert main["constraint"] == [
+        {
+            "constraint": {
+                "values": {"percent": 40.0, "exclusive": 40.0},
+                "total": [100],
+            }
+        }
+    ]
+    assert sub["color"] == "#00FF00"
+
+
+@pytest.mark.asyncio
+async def test_collection_mode_streams_the_aois(mock_recipe):
+    """Many AOIs are yielded as their requests are done, the primary AOI first."""
+    from component.scripts import statistics
+
+    recipe = mock_recipe(
+        statistics.COLLECTION_CHUNK + 1, benefits=[], costs=[], constraints=[]
+    )
+    gee_interface = Mock()
+
+    inputs = await statistics._get_stats_inputs(gee_interface, recipe)
+    groups = statistics._collection_groups(inputs)
+    assert [len(group) for _, group in groups] == [1, statistics.COLLECTION_CHUNK, 1]
+
+    # the first AOI of every request gets values, the others are fully masked
+    gee_interface.get_info_async = AsyncMock(
+        return_value={"features": [_feature(0, area_sum=1)]}
+    )
+
+    sizes = []
+    async for summary_stats in statistics.iter_summary_statistics_async(
+        gee_interface, recipe, "collection"
+    ):
+        sizes.append(len(summary_stats["test_recipe"]))
+
+    assert sizes[0] == 1
+    assert len(sizes) > 1
+    assert sizes[-1] == statistics.COLLECTION_CHUNK + 2